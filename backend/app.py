@@ -1,17 +1,42 @@
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, Response, request, jsonify, send_file, stream_with_context
 from flask_cors import CORS
 import os
 import subprocess
 import tempfile
-import uuid
 import base64
 import io
 import sys
 import traceback
 import re
+import copy
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
+from fast_path import fast_path_allowed, is_simple_snippet
+from python_pool import POOL_SIZE as PYTHON_POOL_SIZE, run_in_checkpoint, run_python_script, run_python_snippet, start_checkpoint
+from r_formula import FormulaError, compile_formula, extract_outer_formula
+from r_pool import POOL_SIZE as R_POOL_SIZE, run_r_script
+from r_translate import TRANSLATE_ENABLED, TranslationError, create_translator
+from artifacts import SCRIPT_DIR, create_artifact_store
+from array_encoding import DECODE_JS, DEFAULT_PRECISION, PRECISIONS, encode_figure
+from assets import (ASSET_MAX_AGE, asset_etag, plotly_js_url, plotly_script_tag, resolve_asset,
+                    resolve_widget_dependencies, widget_dependency_tags)
+from batch import iter_batch_results
+from dataset_store import (MAX_UPLOAD_BYTES, DatasetError, delete_dataset, describe, list_datasets,
+                           r_prelude, referenced_datasets, store_csv, valid_name)
+from jobs import JobQueueFull, create_job_manager, format_sse
+from limits import describe_exit
+from metrics import (CACHE_LOOKUPS, ERRORS, REGISTRY, RENDER_SECONDS, RENDERS, RESPONSE_BYTES,
+                     TIMEOUTS, StageTimer, activate, add_stage, record_usage, set_handler, stage)
+from lod import (DEFAULT_POINT_BUDGET, SURFACE_METHODS, clamp_grid, decimate_surface, downsample_scatter,
+                 downsample_traces, format_reports)
+from rasterize import RASTER_FORMATS, RasterizeError, create_rasterizer, export_options
+from render_cache import cache_key, create_render_cache
+from sessions import MAX_SESSION_ID_LENGTH, create_session_store, figure_delta, normalize_prefix, split_code
+from streaming import listen
+
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
 
@@ -19,68 +44,642 @@ CORS(app)  # Enable CORS for all routes
 TEMP_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'temp')
 os.makedirs(TEMP_DIR, exist_ok=True)
 
+# Seconds a single execution may run before it is killed
+EXECUTION_TIMEOUT = 30
+
+# Batch renders: worker threads, items per batch and the longest deadline a
+# batch may ask for, in seconds. Items of each language run on that
+# language's warm pool, so more threads than the larger pool would only
+# wait for a worker; without pools there is one thread per CPU.
+BATCH_WORKERS = int(os.environ.get('BATCH_WORKERS', max(PYTHON_POOL_SIZE, R_POOL_SIZE) or os.cpu_count() or 2))
+BATCH_MAX_ITEMS = int(os.environ.get('BATCH_MAX_ITEMS', 500))
+BATCH_DEADLINE = float(os.environ.get('BATCH_DEADLINE', 600))
+
+# Send every response with an X-Timing stage breakdown, not only on request
+TIMING_HEADER = os.environ.get('TIMING_HEADER', '0') == '1'
+
+# Response formats for Plotly results
+OUTPUT_FORMATS = ('html', 'spec') + tuple(RASTER_FORMATS)
+
+# Sharded store for output files, swept by a background janitor
+artifact_store = create_artifact_store(TEMP_DIR)
+
+# Cache of rendered results keyed on the code that produced them
+render_cache = create_render_cache(TEMP_DIR)
+
+# Warm kaleido process for static PNG/SVG/PDF exports
+rasterizer = create_rasterizer()
+
+# Translator of simple base-R and ggplot2 scripts to Plotly figures
+translator = create_translator()
+
+# Editor sessions for incremental re-renders of Python figure specs
+session_store = create_session_store()
+
+# Bounded executor that runs every render, synchronous or not
+job_manager = create_job_manager()
+
+# Separate pool for batch items so a large batch cannot starve the job queue
+batch_executor = ThreadPoolExecutor(max_workers=BATCH_WORKERS, thread_name_prefix='render-batch')
+
+def drain():
+    """Wait for queued and running renders to finish, for graceful shutdown"""
+    job_manager.shutdown(wait=True)
+    batch_executor.shutdown(wait=True)
+    if session_store is not None:
+        session_store.close()
+
 @app.route('/')
 def health_check():
     """Simple health check endpoint"""
     return jsonify({'status': 'ok', 'message': 'Visualization API is running'})
 
+@app.route('/assets/<path:path>')
+def serve_asset(path):
+    """Versioned Plotly.js and htmlwidgets assets with immutable caching"""
+    file_path = resolve_asset(path)
+    if file_path is None:
+        return jsonify({'error': 'Unknown asset'}), 404
+    response = send_file(file_path, etag=asset_etag(file_path), max_age=ASSET_MAX_AGE, conditional=True)
+    response.headers['Cache-Control'] = f'public, max-age={ASSET_MAX_AGE}, immutable'
+    return response
+
 @app.route('/api/visualize', methods=['POST'])
 def visualize():
-    data = request.json
-    if not data or 'code' not in data or 'language' not in data:
-        return jsonify({'error': 'Missing code or language parameter'}), 400
+    """Render synchronously; a thin wrapper that waits for a render job"""
+    job, error_response = submit_render_job(request.json, tenant=request.headers.get('X-Tenant'))
+    if error_response is not None:
+        return error_response
+    
+    job.wait()
+    timer = job.params['timer']
+    with timer.stage('serialize'):
+        response = jsonify(job.result)
+    RESPONSE_BYTES.observe(response.content_length or 0, language=timer.language, handler=timer.handler)
+    timer.record()
+    if job.params['cache_status']:
+        response.headers['X-Cache'] = job.params['cache_status']
+    if TIMING_HEADER or request.headers.get('X-Timing'):
+        response.headers['X-Timing'] = timer.header()
+    return response
+
+@app.route('/api/jobs', methods=['POST'])
+def create_job():
+    """Queue a render and return its job id immediately"""
+    job, error_response = submit_render_job(request.json, tenant=request.headers.get('X-Tenant'))
+    if error_response is not None:
+        return error_response
+    return jsonify(job.to_dict()), 202
+
+@app.route('/api/jobs/<job_id>')
+def get_job(job_id):
+    """Status of a render job, including its result once finished"""
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Unknown job id'}), 404
+    return jsonify(job.to_dict())
+
+@app.route('/api/jobs/<job_id>/events')
+def job_events(job_id):
+    """Server-Sent-Events stream of a job's progress, output and result"""
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Unknown job id'}), 404
+    
+    # Resume after the last event the client has seen
+    try:
+        after = int(request.headers.get('Last-Event-ID', -1))
+    except ValueError:
+        after = -1
+    
+    def stream():
+        for event in job.iter_events(after=after):
+            yield format_sse(event)
+    
+    response = Response(stream_with_context(stream()), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+def parse_render_request(data, timeout=EXECUTION_TIMEOUT, tenant=None):
+    """Validate a render request body; `tenant` comes from the X-Tenant header
+
+    Returns (params, None) on success or (None, error message).
+    """
+    started = time.perf_counter()
+    if not isinstance(data, dict) or 'code' not in data or 'language' not in data:
+        return None, 'Missing code or language parameter'
     
     code = data['code']
-    language = data['language'].lower()
+    language = str(data['language']).lower()
     
     if language not in ['python', 'r']:
-        return jsonify({'error': 'Unsupported language. Use "python" or "r"'}), 400
+        return None, 'Unsupported language. Use "python" or "r"'
+    
+    # Numeric encoding used for 3D data embedded in generated pages
+    precision = data.get('precision', DEFAULT_PRECISION)
+    if precision not in PRECISIONS:
+        return None, f'Unsupported precision. Use one of: {", ".join(PRECISIONS)}'
     
+    # Level-of-detail budget per trace and the surface decimation method
     try:
-        # Generate unique ID for this visualization
-        viz_id = str(uuid.uuid4())
-        output_path = os.path.join(TEMP_DIR, f'{viz_id}.png')
-        
-        if language == 'python':
-            result = execute_python(code, output_path)
-        else:  # language == 'r'
-            # For R, check what type of visualization it is
-            if '3d' in code.lower() or 'rgl' in code.lower() or 'persp3d' in code.lower() or 'plot3d' in code.lower():
-                # Try the specialized 3D surface parser first
-                params = parse_3d_surface_code(code)
-                if params and params.get('formula_type') == 'sin_sqrt_x2_y2':
-                    # We have a match for the specific example - use specialized handler
-                    data = generate_3d_data(params)
-                    html = create_3d_html(data, "3D Surface Plot")
-                    result = {
-                        'success': True,
-                        'html': html,
-                        'output': 'Generated interactive 3D surface plot using Plotly.js'
-                    }
-                else:
-                    # Fall back to generic 3D handler
-                    result = execute_r_3d(code, output_path)
-            elif 'plotly' in code.lower():
-                # This is a plotly visualization
-                result = execute_r_plotly(code, output_path)
-            else:
-                # Regular R plot
-                result = execute_r_standard(code, output_path)
-        
-        return jsonify(result)
+        point_budget = int(data.get('point_budget', DEFAULT_POINT_BUDGET))
+    except (TypeError, ValueError):
+        return None, 'point_budget must be an integer'
+    lod_method = data.get('lod_method', 'mean')
+    if lod_method not in SURFACE_METHODS:
+        return None, f'Unsupported lod_method. Use one of: {", ".join(SURFACE_METHODS)}'
+    
+    # 'html' returns a full page, 'spec' only the Plotly figure JSON and
+    # png/svg/pdf a static export of it
+    output_format = data.get('format', 'html')
+    if output_format not in OUTPUT_FORMATS:
+        return None, f'Unsupported format. Use one of: {", ".join(OUTPUT_FORMATS)}'
+    options = {'precision': precision, 'point_budget': point_budget, 'lod_method': lod_method,
+               'format': output_format}
+    if output_format in RASTER_FORMATS:
+        options['export'], error = export_options(data)
+        if error:
+            return None, error
+    
+    # Editor sessions re-run only changed plotting code and answer with figure deltas
+    session_id = data.get('session')
+    if session_id is not None and (not isinstance(session_id, str)
+                                   or not 0 < len(session_id) <= MAX_SESSION_ID_LENGTH):
+        return None, f'session must be a string of at most {MAX_SESSION_ID_LENGTH} characters'
+    if session_store is None or language != 'python' or output_format != 'spec':
+        session_id = None
+    
+    # Identical code is answered from the render cache unless the client opts out
+    # (session renders only when they cannot render incrementally, see cached_render).
+    # Keys include the hashes of loaded datasets, and code loading datasets by
+    # computed names is not cached.
+    datasets = referenced_datasets(code)
+    use_cache = render_cache is not None and data.get('cache', True) and datasets is not None
+    key_options = dict(options, datasets=datasets) if datasets else options
+    params = {
+        'code': code,
+        'language': language,
+        'options': options,
+        'timeout': timeout,
+        'fast_path': fast_path_allowed(tenant),
+        'session': session_id,
+        'base': data.get('base'),
+        'cache_key': cache_key(language, code, key_options) if use_cache else None,
+        'cache_status': None,
+        'timer': StageTimer(language),
+    }
+    params['timer'].add('parse', time.perf_counter() - started)
+    return params, None
+
+def cached_render(params):
+    """Return the cached result for parsed params, or None, recording HIT/MISS
     
+    A session holding a checkpoint for the version the client has renders
+    incrementally instead; other session renders (a first render, a `base`
+    mismatch) use the cache and the hit starts a new session version.
+    """
+    if not params['cache_key']:
+        return None
+    session = session_store.get(params['session']) if params['session'] else None
+    if session is not None and session.checkpoint is not None and params['base'] == session.version:
+        return None
+    cached = render_cache.get(params['cache_key'])
+    params['cache_status'] = 'MISS' if cached is None else 'HIT'
+    CACHE_LOOKUPS.inc(result=params['cache_status'].lower())
+    if cached is not None:
+        if session is not None:
+            with session.lock:
+                session.figure = None
+                session.version += 1
+                cached = dict(cached, session={'id': session.id, 'version': session.version, 'prefix': 'none'})
+        params['timer'].handler = 'cache'
+        record_render(params['timer'], cached)
+    return cached
+
+def render_params(params):
+    """Render parsed params and store successful results in the cache"""
+    timer = params['timer']
+    try:
+        with activate(timer):
+            if params['session']:
+                result = render_session(params)
+            else:
+                result = render_visualization(params['code'], params['language'], params['options'],
+                                              timeout=params['timeout'], fast_path=params['fast_path'])
     except Exception as e:
         exc_type, exc_value, exc_traceback = sys.exc_info()
         error_details = traceback.format_exception(exc_type, exc_value, exc_traceback)
-        return jsonify({'error': str(e), 'traceback': error_details})
+        result = {'error': str(e), 'traceback': error_details}
+    
+    # Session deltas only apply to the client's figure; full session results are
+    # cached without their session fields
+    if params['cache_key'] and result.get('success') and 'delta' not in result:
+        render_cache.put(params['cache_key'], {key: value for key, value in result.items() if key != 'session'})
+    record_render(timer, result)
+    record_usage(timer, result.get('usage'))
+    return result
+
+def record_render(timer, result):
+    """Record a finished render's stages, outcome and usage in the metrics"""
+    labels = {'language': timer.language, 'handler': timer.handler}
+    RENDERS.inc(outcome='success' if result.get('success') else 'error', **labels)
+    if not result.get('success'):
+        ERRORS.inc(**labels)
+    RENDER_SECONDS.observe(timer.total(), **labels)
+    timer.record()
+
+def submit_render_job(data, tenant=None):
+    """Validate a request body and queue its render
+
+    Returns (job, None) on success or (None, error_response) when the
+    request is invalid or the job queue is full. Cache hits produce a job
+    that has already finished.
+    """
+    params, error = parse_render_request(data, tenant=tenant)
+    if error:
+        return None, (jsonify({'error': error}), 400)
+    
+    cached = cached_render(params)
+    if cached is not None:
+        job = job_manager.create(params)
+        job.finish(cached)
+        return job, None
+    
+    try:
+        return job_manager.submit(run_render_job, params), None
+    except JobQueueFull:
+        response = jsonify({'error': 'Too many visualizations in progress, try again shortly'})
+        response.headers['Retry-After'] = '5'
+        return None, (response, 429)
+
+def run_render_job(job):
+    """Execute a queued render, streaming its output as job events"""
+    streamed = []
+    
+    def forward(stream, text):
+        streamed.append(stream)
+        job.emit('output', {'stream': stream, 'text': text})
+    
+    with listen(forward):
+        result = render_params(job.params)
+    # Executors that capture output in one piece have not streamed anything
+    if result.get('output') and not streamed:
+        job.emit('output', {'stream': 'stdout', 'text': result['output']})
+    return result
+
+@app.route('/api/visualize/batch', methods=['POST'])
+def visualize_batch():
+    """Render many snippets at once, streaming NDJSON results as they finish
+    
+    Body: {"items": [{"code", "language", "id"?, ...}], "deadline"?, "item_timeout"?}.
+    Each line is one item's result tagged with its index (and id, if given);
+    a failing item only affects its own line. The last line summarizes the batch.
+    """
+    data = request.json
+    if not data or not isinstance(data.get('items'), list):
+        return jsonify({'error': 'Missing items list'}), 400
+    items = data['items']
+    if len(items) > BATCH_MAX_ITEMS:
+        return jsonify({'error': f'Too many items, at most {BATCH_MAX_ITEMS} per batch'}), 400
+    try:
+        deadline = min(float(data.get('deadline', BATCH_DEADLINE)), BATCH_DEADLINE)
+        item_timeout = min(float(data.get('item_timeout', EXECUTION_TIMEOUT)), EXECUTION_TIMEOUT)
+    except (TypeError, ValueError):
+        return jsonify({'error': 'deadline and item_timeout must be numbers'}), 400
+    
+    tenant = request.headers.get('X-Tenant')
+    expires = time.monotonic() + deadline
+    
+    def render_item(item):
+        # Waiting for a pool worker counts against the item's timeout, which
+        # ends with the batch deadline at the latest
+        timeout = min(item_timeout, expires - time.monotonic())
+        if timeout <= 0:
+            return {'error': 'Batch deadline exceeded'}
+        params, error = parse_render_request(item, timeout=timeout, tenant=tenant)
+        if error:
+            return {'error': error}
+        cached = cached_render(params)
+        return cached if cached is not None else render_params(params)
+    
+    def stream():
+        started = time.monotonic()
+        succeeded = 0
+        results = iter_batch_results(items, render_item, batch_executor, deadline)
+        try:
+            for index, result in results:
+                line = {'index': index}
+                if isinstance(items[index], dict) and 'id' in items[index]:
+                    line['id'] = items[index]['id']
+                line.update(result)
+                succeeded += 1 if result.get('success') else 0
+                yield json.dumps(line) + '\n'
+        finally:
+            # Cancels the items not started yet when the client disconnects
+            results.close()
+        yield json.dumps({'done': True, 'total': len(items), 'succeeded': succeeded,
+                          'failed': len(items) - succeeded,
+                          'elapsed': round(time.monotonic() - started, 3)}) + '\n'
+    
+    response = Response(stream_with_context(stream()), mimetype='application/x-ndjson')
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+@app.route('/api/cache/stats')
+def cache_stats():
+    """Hit/miss counters and sizes of the render cache"""
+    if render_cache is None:
+        return jsonify({'enabled': False})
+    return jsonify(dict(render_cache.stats(), enabled=True))
+
+@app.route('/api/artifacts/stats')
+def artifact_stats():
+    """Bytes on disk and eviction counters of the artifact store"""
+    return jsonify(artifact_store.stats())
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus metrics for the render pipeline"""
+    return Response(REGISTRY.render(), mimetype='text/plain; version=0.0.4')
+
+@app.route('/api/sessions/stats')
+def session_stats():
+    """Checkpoint reuse and delta counters of editor sessions"""
+    if session_store is None:
+        return jsonify({'enabled': False})
+    return jsonify(dict(session_store.stats(), enabled=True))
+
+@app.route('/api/rasterize/stats')
+def rasterize_stats():
+    """Export, queue and image cache counters of the kaleido rasterizer"""
+    return jsonify(rasterizer.stats())
+
+@app.route('/api/translate/stats')
+def translate_stats():
+    """Translated, fallback and cache counters of the R-to-Plotly translator"""
+    return jsonify(translator.stats())
+
+@app.route('/api/datasets', methods=['POST'])
+def upload_dataset():
+    """Store an uploaded CSV as a named dataset of memory-mapped columns
+    
+    Send the file as multipart field `file` (with an optional `name` field,
+    defaulting to the file name) or the CSV itself as the request body with
+    `?name=`. Uploading to an existing name replaces its dataset.
+    """
+    if request.content_length and request.content_length > MAX_UPLOAD_BYTES:
+        return jsonify({'error': f'Dataset exceeds {MAX_UPLOAD_BYTES // (1024 * 1024)} MB'}), 413
+    upload = request.files.get('file')
+    name = request.form.get('name') or request.args.get('name')
+    if upload is not None and not name and upload.filename:
+        name = os.path.splitext(os.path.basename(upload.filename))[0]
+    try:
+        manifest = store_csv(name, upload.stream if upload is not None else request.stream)
+    except DatasetError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify(manifest), 201
+
+@app.route('/api/datasets')
+def get_datasets():
+    """Names, hashes and columns of the uploaded datasets"""
+    return jsonify({'datasets': list_datasets()})
+
+@app.route('/api/datasets/<name>', methods=['GET', 'DELETE'])
+def dataset(name):
+    """Describe or delete one dataset"""
+    if not valid_name(name):
+        return jsonify({'error': 'Invalid dataset name'}), 400
+    if request.method == 'DELETE':
+        if not delete_dataset(name):
+            return jsonify({'error': 'Unknown dataset'}), 404
+        return '', 204
+    manifest = describe(name)
+    if manifest is None:
+        return jsonify({'error': 'Unknown dataset'}), 404
+    return jsonify(manifest)
+
+@app.route('/api/jobs/stats')
+def jobs_stats():
+    """Queue depth and worker count of the job executor"""
+    return jsonify(job_manager.stats())
+
+def render_visualization(code, language, options=None, timeout=EXECUTION_TIMEOUT, fast_path=False):
+    """Execute code with the handler matching its language and return the result payload
+    
+    `fast_path` lets simple NumPy/matplotlib snippets run inline on a warm
+    worker (see fast_path.py); other code uses the regular handlers.
+    """
+    options = options or {}
+    precision = options.get('precision', DEFAULT_PRECISION)
+    output_format = options.get('format', 'html')
+    export = options.get('export')
+    
+    # Unique output file for this visualization
+    output_path = artifact_store.new_path('.png')
+    
+    if language == 'python':
+        if fast_path and is_simple_snippet(code):
+            result = execute_python_fast(code, timeout=timeout)
+            if result is not None:
+                return result
+        set_handler('execute_python')
+        return execute_python(code, output_path, output_format=output_format, precision=precision,
+                              export=export, timeout=timeout)
+    
+    # Scripts within the translatable subset of base R and ggplot2 skip R
+    fallback = None
+    if TRANSLATE_ENABLED:
+        with stage('translate'):
+            try:
+                translation = translator.translate(code)
+            except TranslationError as e:
+                translation, fallback = None, str(e)
+        if translation is not None:
+            set_handler('r_translate')
+            # Reduce long series to the point budget on a copy; the translator caches the figure
+            figure = dict(translation.figure, data=copy.deepcopy(translation.figure['data']))
+            reports = downsample_traces(figure['data'], options.get('point_budget', DEFAULT_POINT_BUDGET))
+            output = '\n'.join(filter(None, [translation.output.strip(), format_reports(reports)]))
+            return figure_result(figure, figure_html, output, output_format, precision,
+                                 export=export, lod=reports,
+                                 translation={'translated': True,
+                                              'cache': 'HIT' if translation.cached else 'MISS'})
+    
+    result = render_r(code, output_path, options, timeout)
+    if fallback is not None:
+        result['translation'] = {'translated': False, 'reason': fallback}
+    return result
+
+def render_r(code, output_path, options, timeout=EXECUTION_TIMEOUT):
+    """Run R code in R with the handler matching the kind of visualization it creates"""
+    precision = options.get('precision', DEFAULT_PRECISION)
+    point_budget = options.get('point_budget', DEFAULT_POINT_BUDGET)
+    lod_method = options.get('lod_method', 'mean')
+    output_format = options.get('format', 'html')
+    export = options.get('export')
+    
+    # Check what type of visualization it is
+    if '3d' in code.lower() or 'rgl' in code.lower() or 'persp3d' in code.lower() or 'plot3d' in code.lower():
+        # Try the specialized 3D surface parser first
+        params = parse_3d_surface_code(code)
+        if params.get('formula_type') == 'expression' and 'x_min' in params:
+            # The surface formula compiled - evaluate it in-process
+            set_handler('r_formula')
+            with stage('execute'):
+                data = generate_3d_data(params)
+                data['x'], data['y'], data['z'], report = decimate_surface(
+                    data['x'], data['y'], data['z'], point_budget, lod_method)
+            return figure_result(
+                surface_figure(data, "3D Surface Plot"), create_3d_html,
+                '\n'.join(filter(None, [
+                    'Generated interactive 3D surface plot using Plotly.js',
+                    format_reports([report])])),
+                output_format, precision, export=export, lod=[report])
+        # Fall back to generic 3D handler
+        set_handler('execute_r_3d')
+        with stage('execute'):
+            return execute_r_3d(code, output_path, precision=precision,
+                                point_budget=point_budget, lod_method=lod_method,
+                                output_format=output_format, export=export)
+    elif 'plotly' in code.lower():
+        # This is a plotly visualization
+        set_handler('execute_r_plotly')
+        return execute_r_plotly(code, output_path, point_budget=point_budget,
+                                precision=precision, output_format=output_format, export=export,
+                                timeout=timeout)
+    # Regular R plot
+    set_handler('execute_r_standard')
+    return execute_r_standard(code, output_path, timeout=timeout)
+
+def render_session(params):
+    """Render Python code for an editor session as a figure spec or delta
+    
+    The code's data preparation runs once in a checkpoint kept by the
+    session and only the plotting suffix is re-executed (see sessions.py).
+    A Plotly figure is returned as a `delta` when the request's `base` is
+    the session version the client holds. Code that cannot be split, or
+    runs without a worker pool, gets a regular full render.
+    """
+    session = session_store.get(params['session'])
+    precision = params['options']['precision']
+    timeout = params['timeout']
+    with session.lock:
+        split = split_code(params['code'])
+        try:
+            reply = execute_python_session(session, split[0], split[1], timeout) if split else None
+        except subprocess.TimeoutExpired as e:
+            TIMEOUTS.inc(language='python')
+            return timeout_result(e, timeout)
+        
+        if reply is None:
+            session_store.count('full_renders')
+            result = render_visualization(params['code'], 'python', params['options'],
+                                          timeout=timeout, fast_path=params['fast_path'])
+            if result.get('success'):
+                session.figure = None
+                session.version += 1
+            result['session'] = {'id': session.id, 'version': session.version, 'prefix': 'none'}
+            return result
+        
+        output = session.prefix_output + reply.get('stdout', '')
+        if reply.get('error') or reply['returncode'] != 0:
+            message = reply.get('stderr') or reply.get('error') or describe_exit(reply['returncode'])
+            return {'error': message or 'Execution failed', 'output': output, 'usage': reply.get('usage')}
+        
+        if reply.get('figure'):
+            with stage('read'):
+                figure = json.loads(reply['figure'])
+            delta = None
+            if session.figure is not None and params['base'] == session.version:
+                delta = figure_delta(session.figure, figure)
+            if delta is not None:
+                session_store.count('deltas')
+                with stage('encode'):
+                    delta['data'] = {index: encode_figure(trace, precision) for index, trace in delta['data'].items()}
+                    delta['layout'] = encode_figure(delta['layout'], precision)
+                result = {'success': True, 'delta': dict(delta, base=params['base']),
+                          'plotly_js': plotly_js_url(), 'output': output}
+            else:
+                result = figure_result(figure, None, output, 'spec', precision)
+            session.figure = figure
+        elif reply.get('image'):
+            result = {'success': True, 'image': reply['image'], 'format': 'image/png', 'output': output}
+            session.figure = None
+        else:
+            return {'error': 'Failed to generate visualization. The code did not create a Plotly figure '
+                             'named fig or a matplotlib figure.',
+                    'output': output, 'usage': reply.get('usage')}
+        
+        session.version += 1
+        result['usage'] = reply.get('usage')
+        result['session'] = {'id': session.id, 'version': session.version, 'prefix': reply['prefix']}
+        return result
+
+def execute_python_session(session, prefix, suffix, timeout=EXECUTION_TIMEOUT):
+    """Run the suffix in the session's checkpoint, first (re)starting it for a new prefix
+    
+    Returns the reply of the suffix run, with `prefix` set to 'reused' or
+    'executed', or the failed checkpoint's reply if the prefix raised.
+    Returns None when no worker pool is available; raises TimeoutExpired.
+    """
+    set_handler('python_session')
+    started = time.perf_counter()
+    executed = 0.0
+    # A dataset re-uploaded under the same name needs a new checkpoint
+    prefix_key = (normalize_prefix(prefix), referenced_datasets(prefix))
+    reply = None
+    for _ in range(2):
+        reused = session.checkpoint is not None and session.prefix == prefix_key
+        if not reused:
+            session.close_checkpoint()
+            path = session.new_checkpoint_path()
+            try:
+                checkpoint = start_checkpoint(prefix, path, session_store.ttl, timeout=timeout)
+            except subprocess.TimeoutExpired:
+                add_stage('execute', time.perf_counter() - started)
+                raise
+            if checkpoint is None:
+                return None
+            executed += checkpoint.get('execute_seconds', 0.0)
+            if checkpoint.get('error'):
+                checkpoint['prefix'] = 'executed'
+                add_stage('execute', executed)
+                add_stage('spawn', time.perf_counter() - started - executed)
+                return checkpoint
+            session.checkpoint, session.prefix = path, prefix_key
+            session.prefix_output = checkpoint.get('stdout', '')
+            session_store.count('prefix_runs')
+        
+        try:
+            reply = run_in_checkpoint(session.checkpoint, suffix, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            add_stage('execute', time.perf_counter() - started)
+            raise
+        if reply is not None:
+            if reused:
+                session_store.count('prefix_reused')
+            reply['prefix'] = 'reused' if reused else 'executed'
+            break
+        # The checkpoint expired or died; start a new one once
+        session.close_checkpoint()
+    
+    if reply is None:
+        return {'returncode': 1, 'error': 'The session checkpoint is unavailable', 'prefix': 'executed'}
+    executed += reply.get('execute_seconds', 0.0)
+    add_stage('execute', executed)
+    add_stage('save', reply.get('save_seconds', 0.0))
+    add_stage('spawn', time.perf_counter() - started - executed - reply.get('save_seconds', 0.0))
+    return reply
 
 def parse_3d_surface_code(code):
-    """Parse the specific 3D surface example code to extract data and formula"""
+    """Parse 3D surface code to extract the grid and the compiled z formula"""
     result = {}
     
     # Extract x, y ranges
-    x_match = re.search(r'x\s*<-\s*seq\((-?\d+),\s*(-?\d+),\s*length\s*=\s*(\d+)\)', code)
-    y_match = re.search(r'y\s*<-\s*seq\((-?\d+),\s*(-?\d+),\s*length\s*=\s*(\d+)\)', code)
+    seq_pattern = r'\s*<-\s*seq\(\s*(-?[\d.]+)\s*,\s*(-?[\d.]+)\s*,\s*length(?:\.out)?\s*=\s*(\d+)\s*\)'
+    x_match = re.search(r'\bx' + seq_pattern, code)
+    y_match = re.search(r'\by' + seq_pattern, code)
     
     if x_match and y_match:
         result['x_min'] = float(x_match.group(1))
@@ -92,15 +691,17 @@ def parse_3d_surface_code(code):
         result['y_length'] = int(y_match.group(3))
     
     # Look for z formula
-    z_match = re.search(r'z\s*<-\s*outer\(x,\s*y,\s*function\(x,\s*y\)\s*([^)]+)\)', code)
+    z_match = extract_outer_formula(code)
     if z_match:
-        formula = z_match.group(1).strip()
+        variables, formula = z_match
         result['z_formula'] = formula
         
-        # Detect specific formulas
-        if 'sin' in formula and 'sqrt' in formula and 'x^2' in formula and 'y^2' in formula:
-            result['formula_type'] = 'sin_sqrt_x2_y2'
-        else:
+        # Compile the formula into a vectorized expression if it is supported
+        try:
+            result['z_expression'] = compile_formula(formula, variables)
+            result['formula_type'] = 'expression'
+        except FormulaError as e:
+            result['formula_error'] = str(e)
             result['formula_type'] = 'unknown'
     
     # Check for colors
@@ -120,32 +721,100 @@ def parse_3d_surface_code(code):
 
 def generate_3d_data(params):
     """Generate 3D data based on the parsed parameters"""
-    # Create x and y values
-    x = np.linspace(params.get('x_min', -5), params.get('x_max', 5), params.get('x_length', 50))
-    y = np.linspace(params.get('y_min', -5), params.get('y_max', 5), params.get('y_length', 50))
+    # Create x and y values, within the in-process grid limit
+    x_length, y_length = clamp_grid(params.get('x_length', 50), params.get('y_length', 50))
+    x = np.linspace(params.get('x_min', -5), params.get('x_max', 5), x_length)
+    y = np.linspace(params.get('y_min', -5), params.get('y_max', 5), y_length)
     X, Y = np.meshgrid(x, y)
     
-    # Generate Z values based on formula type
-    if params.get('formula_type') == 'sin_sqrt_x2_y2':
-        Z = np.sin(np.sqrt(X**2 + Y**2))
+    # Generate Z values from the compiled formula
+    if params.get('z_expression') is not None:
+        Z = params['z_expression'](X, Y)
     else:
         # Default formula
         Z = np.sin(np.sqrt(X**2 + Y**2))
     
     return {
-        'x': x.tolist(),
-        'y': y.tolist(),
-        'z': Z.tolist()
+        'x': x,
+        'y': y,
+        'z': Z
+    }
+
+def surface_figure(data, title="3D Surface Plot"):
+    """Plotly figure spec (data and layout) for a 3D surface"""
+    return {
+        'data': [{
+            'z': data['z'],
+            'x': data['x'],
+            'y': data['y'],
+            'type': 'surface',
+            'colorscale': 'Viridis'
+        }],
+        'layout': {
+            'title': title,
+            'scene': {
+                'xaxis': {'title': 'X'},
+                'yaxis': {'title': 'Y'},
+                'zaxis': {'title': 'Z'}
+            },
+            'autosize': True,
+            'margin': {'l': 0, 'r': 0, 'b': 0, 't': 50}
+        }
     }
 
-def create_3d_html(data, title="3D Surface Plot"):
-    """Create HTML for 3D visualization using Plotly.js"""
+def figure_result(figure, html_builder, output, output_format, precision, export=None, **extra):
+    """Build the response for a Plotly figure in the requested format
+    
+    'spec' returns the encoded figure itself so the client can render it
+    with Plotly.react; 'html' returns the page produced by html_builder;
+    png, svg and pdf return the figure exported by kaleido with the size
+    options in `export` (see rasterize.py).
+    """
+    if output_format in RASTER_FORMATS:
+        with stage('rasterize'):
+            try:
+                data = rasterizer.export(figure, output_format, **(export or {}))
+            except RasterizeError as e:
+                return dict(extra, error=str(e), output=output)
+        result = {
+            'success': True,
+            'image': base64.b64encode(data).decode('utf-8'),
+            'format': RASTER_FORMATS[output_format],
+            'output': output
+        }
+        result.update(extra)
+        return result
+    
+    with stage('encode'):
+        if output_format == 'spec':
+            result = {
+                'success': True,
+                'spec': encode_figure(figure, precision),
+                'plotly_js': plotly_js_url(),
+                'output': output
+            }
+        else:
+            result = {
+                'success': True,
+                'html': html_builder(figure, precision),
+                'output': output
+            }
+    result.update(extra)
+    return result
+
+def create_3d_html(figure, precision=DEFAULT_PRECISION):
+    """Create HTML for 3D visualization using Plotly.js
+    
+    Numeric arrays are embedded with encode_figure() at the given precision
+    and decoded into typed arrays in the page.
+    """
+    title = figure['layout'].get('title', '3D Surface Plot')
     html = f"""
 <!DOCTYPE html>
 <html>
 <head>
     <title>{title}</title>
-    <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
+    {plotly_script_tag()}
     <style>
         body, html {{
             margin: 0;
@@ -163,26 +832,10 @@ def create_3d_html(data, title="3D Surface Plot"):
 <body>
     <div id="plotly-3d"></div>
     <script>
-        var data = [{{
-            z: {json.dumps(data['z'])},
-            x: {json.dumps(data['x'])},
-            y: {json.dumps(data['y'])},
-            type: 'surface',
-            colorscale: 'Viridis'
-        }}];
+        {DECODE_JS}
+        var figure = decodeFigure({json.dumps(encode_figure(figure, precision))});
         
-        var layout = {{
-            title: '{title}',
-            scene: {{
-                xaxis: {{ title: 'X' }},
-                yaxis: {{ title: 'Y' }},
-                zaxis: {{ title: 'Z' }}
-            }},
-            autosize: true,
-            margin: {{ l: 0, r: 0, b: 0, t: 50 }}
-        }};
-        
-        Plotly.newPlot('plotly-3d', data, layout, {{responsive: true}});
+        Plotly.newPlot('plotly-3d', figure.data, figure.layout, {{responsive: true}});
         
         window.addEventListener('resize', function() {{
             Plotly.relayout('plotly-3d', {{
@@ -196,11 +849,82 @@ def create_3d_html(data, title="3D Surface Plot"):
     """
     return html
 
-def execute_python(code, output_path):
+def figure_html(figure, precision=DEFAULT_PRECISION, div_id='plotly-chart', height=500):
+    """Create a minimal HTML page that plots a Plotly figure spec"""
+    title = figure['layout'].get('title', 'Interactive Plot')
+    if isinstance(title, dict):
+        title = title.get('text', 'Interactive Plot')
+    html = f"""
+<!DOCTYPE html>
+<html>
+<head>
+    <title>{title}</title>
+    {plotly_script_tag()}
+</head>
+<body>
+    <div id="{div_id}" style="width:100%; height:{height}px;"></div>
+    <script>
+        {DECODE_JS}
+        var figure = decodeFigure({json.dumps(encode_figure(figure, precision))});
+        
+        Plotly.newPlot('{div_id}', figure.data, figure.layout);
+    </script>
+</body>
+</html>
+    """
+    return html
+
+def execute_python_fast(code, timeout=EXECUTION_TIMEOUT):
+    """Run a matplotlib snippet inline on a warm worker, with no files involved
+    
+    Returns None when no worker pool is available.
+    """
+    started = time.perf_counter()
+    try:
+        reply = run_python_snippet(code, timeout=timeout)
+    except subprocess.TimeoutExpired as e:
+        set_handler('python_fast_path')
+        add_stage('execute', time.perf_counter() - started)
+        TIMEOUTS.inc(language='python')
+        return timeout_result(e, timeout)
+    if reply is None:
+        return None
+    
+    set_handler('python_fast_path')
+    elapsed = time.perf_counter() - started
+    if 'execute_seconds' not in reply and reply.get('usage'):
+        # The child died before reporting; its whole lifetime was execution
+        reply['execute_seconds'] = reply['usage']['wall_seconds']
+    execute_seconds = reply.get('execute_seconds', 0.0)
+    save_seconds = reply.get('save_seconds', 0.0)
+    add_stage('spawn', elapsed - execute_seconds - save_seconds)
+    add_stage('execute', execute_seconds)
+    add_stage('save', save_seconds)
+    
+    if reply.get('error') or reply['returncode'] != 0:
+        message = reply.get('stderr') or reply.get('error') or describe_exit(reply['returncode'])
+        return {'error': message or 'Execution failed', 'output': reply.get('stdout', ''),
+                'usage': reply.get('usage')}
+    if not reply.get('image'):
+        return {'error': 'Failed to generate visualization. The snippet did not draw a matplotlib figure.',
+                'output': reply.get('stdout', ''), 'usage': reply.get('usage')}
+    return {
+        'success': True,
+        'image': reply['image'],
+        'format': 'image/png',
+        'output': reply.get('stdout', ''),
+        'usage': reply.get('usage')
+    }
+
+def execute_python(code, output_path, output_format='html', precision=DEFAULT_PRECISION,
+                   export=None, timeout=EXECUTION_TIMEOUT):
     indented_code = '\n'.join('    ' + line for line in code.splitlines())
+    staging = {f'{output_path}{extension}': artifact_store.staging_path(f'{output_path}{extension}')
+               for extension in ('', '.html', '.json', '.timing')}
     
     # Create a temporary Python file
-    with tempfile.NamedTemporaryFile(suffix='.py', mode='w', delete=False) as f:
+    with stage('write'), tempfile.NamedTemporaryFile(suffix='.py', mode='w', delete=False,
+                                                     dir=SCRIPT_DIR) as f:
         # Add imports and setup code with simplified error handling
         full_code = f"""
 import matplotlib
@@ -214,28 +938,49 @@ import plotly.io as pio
 import base64
 import traceback
 import sys
+import os as _os
+import time as _timing
+from dataset_store import load_dataset
+
+def _save_artifact(path, save):
+    # Save under the staging name and rename, so no reader sees a partial file
+    staging = {staging!r}
+    save(staging[path])
+    _os.replace(staging[path], path)
+
+def _write_artifact(path, text):
+    def write(staging_path):
+        with open(staging_path, 'w') as f:
+            f.write(text)
+    _save_artifact(path, write)
 
 try:
     # User code starts here
 {indented_code}
     
+    _save_started = _timing.perf_counter()
     # Check for plotly figures first (prioritize interactive over static)
     if 'fig' in locals() or 'fig' in globals():
         fig_var = locals().get('fig') or globals().get('fig')
-        if str(type(fig_var)).find('plotly') >= 0:
+        if str(type(fig_var)).find('plotly') >= 0 and '{output_format}' != 'html':
+            # Save only the figure spec; the client plots it with Plotly.react
+            # or the server exports it as an image
+            _write_artifact('{output_path}.json', pio.to_json(fig_var, validate=False))
+            print("SUCCESS: Figure spec generated for interactive visualization")
+        elif str(type(fig_var)).find('plotly') >= 0:
             # Save as HTML for interactive display
-            html_content = fig_var.to_html(full_html=True, include_plotlyjs='cdn')
-            with open('{output_path}.html', 'w') as f:
-                f.write(html_content)
+            html_content = fig_var.to_html(full_html=True, include_plotlyjs='{plotly_js_url()}')
+            _write_artifact('{output_path}.html', html_content)
             print("SUCCESS: HTML generated for interactive visualization")
     
     # Save matplotlib figure if present
     try:
-        plt.savefig('{output_path}')
+        _save_artifact('{output_path}', lambda staging_path: plt.savefig(staging_path, format='png'))
         plt.close()
         print("SUCCESS: Matplotlib figure saved")
     except Exception as e:
         print(f"Error saving matplotlib figure: {{str(e)}}")
+    _write_artifact('{output_path}.timing', str(_timing.perf_counter() - _save_started))
             
 except Exception as e:
     print(f"ERROR: {{str(e)}}")
@@ -244,188 +989,303 @@ except Exception as e:
         f.write(full_code)
         temp_file = f.name
     
-    # Execute the Python file
+    # Execute the Python file on a warm worker
     try:
-        result = subprocess.run(['python', temp_file], 
-                                capture_output=True, 
-                                text=True, 
-                                timeout=30)
-        
-        # Log the result for debugging
-        print(f"Python execution stdout: {result.stdout}")
-        print(f"Python execution stderr: {result.stderr}")
+        started = time.perf_counter()
+        result = run_python_script(temp_file, timeout=timeout)
+        record_execution(started, result, output_path)
         
         # Check for errors first
         if result.returncode != 0:
-            return {'error': result.stderr}
+            return {'error': execution_error(result), 'usage': result.usage}
+        
+        # Check if we have a plotly figure spec
+        if os.path.exists(f"{output_path}.json"):
+            with stage('read'), open(f"{output_path}.json", 'r') as f:
+                figure = json.load(f)
+            return figure_result(figure, None, result.stdout, output_format, precision, export=export,
+                                 usage=result.usage)
         
         # Check if we have an interactive plotly visualization
         if os.path.exists(f"{output_path}.html"):
             try:
-                with open(f"{output_path}.html", 'r') as f:
+                with stage('read'), open(f"{output_path}.html", 'r') as f:
                     html_content = f.read()
                 
                 return {
                     'success': True,
                     'html': html_content,
-                    'output': result.stdout
+                    'output': result.stdout,
+                    'usage': result.usage
                 }
             except Exception as e:
                 print(f"Error reading HTML file: {str(e)}")
         
         # Otherwise, check for a static image
         if os.path.exists(output_path):
-            with open(output_path, 'rb') as img_file:
+            with stage('read'), open(output_path, 'rb') as img_file:
                 img_data = base64.b64encode(img_file.read()).decode('utf-8')
             
             return {
                 'success': True,
                 'image': img_data,
                 'format': 'image/png',
-                'output': result.stdout
+                'output': result.stdout,
+                'usage': result.usage
             }
         
         # If we got here, no visualization was created
-        return {'error': 'Failed to generate visualization. Process output: ' + result.stdout + '\nError: ' + result.stderr}
+        return {'error': 'Failed to generate visualization. Process output: ' + result.stdout + '\nError: ' + result.stderr,
+                'usage': result.usage}
+    
+    except subprocess.TimeoutExpired as e:
+        add_stage('execute', time.perf_counter() - started)
+        TIMEOUTS.inc(language='python')
+        return timeout_result(e, timeout)
     
     except Exception as e:
         return {'error': f'Exception during visualization generation: {str(e)}'}
     
     finally:
-        # Clean up temporary files
+        # Clean up the script; the artifact store's janitor deletes the outputs
         if os.path.exists(temp_file):
             os.remove(temp_file)
-        if os.path.exists(f"{output_path}.html"):
-            try:
-                os.remove(f"{output_path}.html")
-            except:
-                pass
 
-def execute_r_standard(code, output_path):
+def record_execution(started, result, output_path):
+    """Split the time spent running a script into spawn, execute and save stages
+    
+    The executed script writes its figure save time to `<output_path>.timing`;
+    the rest of the measured usage is user code, and whatever the worker did
+    not measure itself is dispatch and process startup.
+    """
+    elapsed = time.perf_counter() - started
+    save_seconds = 0.0
+    try:
+        with open(f"{output_path}.timing") as f:
+            save_seconds = float(f.read().strip() or 0)
+    except (OSError, ValueError):
+        pass
+    executed = result.usage['wall_seconds'] if result.usage else elapsed
+    add_stage('spawn', elapsed - executed)
+    add_stage('execute', executed - save_seconds)
+    add_stage('save', save_seconds)
+
+def execution_error(result):
+    """Error message for a failed execution, explaining resource-limit kills"""
+    limit_message = describe_exit(result.returncode)
+    return '\n'.join(filter(None, [result.stderr, limit_message])) or f'Process exited with status {result.returncode}'
+
+def timeout_result(error, timeout):
+    """Error result for an execution killed at its timeout, with the output it printed so far"""
+    message = f'Execution timed out after {timeout} seconds'
+    if error.stderr:
+        message = f'{message}\n{error.stderr}'
+    return {'error': message, 'output': error.output or ''}
+
+def execute_r_standard(code, output_path, timeout=EXECUTION_TIMEOUT):
     """Execute standard R code for static visualizations"""
-    with tempfile.NamedTemporaryFile(suffix='.R', mode='w', delete=False) as f:
+    staging_png = json.dumps(artifact_store.staging_path(output_path))
+    staging_timing = json.dumps(artifact_store.staging_path(f'{output_path}.timing'))
+    with stage('write'), tempfile.NamedTemporaryFile(suffix='.R', mode='w', delete=False,
+                                                     dir=SCRIPT_DIR) as f:
         full_code = f"""
 # Load ggplot2 for static plots
 library(ggplot2)
-
+{r_prelude()}
 # User code
 {code}
 
-# Try to save the last plot
+# Try to save the last plot, under the staging name so no reader sees a partial file
+.save_started <- proc.time()[["elapsed"]]
 tryCatch({{
-  png("{output_path}", width = 800, height = 600)
+  png({staging_png}, width = 800, height = 600)
   if(exists("p")) {{
     print(p)
   }}
   dev.off()
 }}, error = function(e) {{
   # If an error occurs, create a simple error plot
-  png("{output_path}", width = 800, height = 600)
+  png({staging_png}, width = 800, height = 600)
   plot(0, 0, main="Error in plot", xlab="", ylab="")
   text(0, 0, e$message, col="red")
   dev.off()
 }})
+if (file.exists({staging_png})) invisible(file.rename({staging_png}, "{output_path}"))
+cat(proc.time()[["elapsed"]] - .save_started, file = {staging_timing})
+invisible(file.rename({staging_timing}, "{output_path}.timing"))
 """
         f.write(full_code)
         temp_file = f.name
     
-    # Execute the R file
+    # Execute the R file in a warm session
     try:
-        result = subprocess.run(['Rscript', temp_file], 
-                               capture_output=True, 
-                               text=True, 
-                               timeout=30)
+        started = time.perf_counter()
+        try:
+            result = run_r_script(temp_file, timeout=timeout)
+        except subprocess.TimeoutExpired as e:
+            add_stage('execute', time.perf_counter() - started)
+            TIMEOUTS.inc(language='r')
+            return timeout_result(e, timeout)
+        record_execution(started, result, output_path)
         
         if result.returncode != 0:
-            return {'error': result.stderr}
+            return {'error': execution_error(result), 'usage': result.usage}
         
         # Check if output file exists
         if os.path.exists(output_path):
-            with open(output_path, 'rb') as img_file:
+            with stage('read'), open(output_path, 'rb') as img_file:
                 img_data = base64.b64encode(img_file.read()).decode('utf-8')
             
             return {
                 'success': True,
                 'image': img_data,
                 'format': 'image/png',
-                'output': result.stdout
+                'output': result.stdout,
+                'usage': result.usage
             }
         else:
-            return {'error': 'Failed to generate visualization'}
+            return {'error': 'Failed to generate visualization', 'usage': result.usage}
     
     finally:
-        # Clean up
+        # Clean up the script; the artifact store's janitor deletes the outputs
         if os.path.exists(temp_file):
             os.remove(temp_file)
 
-def execute_r_plotly(code, output_path):
-    """Generate HTML with plotly.js for R plotly code"""
-    # Extract x and y values from the code if present
-    x_values_match = re.search(r'x\s*[=<-]\s*c\(([^)]+)\)', code)
-    y_values_match = re.search(r'y\s*[=<-]\s*c\(([^)]+)\)', code)
+def execute_r_plotly(code, output_path, point_budget=DEFAULT_POINT_BUDGET,
+                     precision=DEFAULT_PRECISION, output_format='html', export=None,
+                     timeout=EXECUTION_TIMEOUT):
+    """Execute R plotly code and extract the widget's figure spec
     
-    x_values = [1, 2, 3, 4, 5]  
-    y_values = [5, 4, 3, 2, 1] 
+    The code runs in a warm R session. The last plotly (or ggplot) object it
+    shows, or `p`/`fig`, is built with plotly_build() and its htmlwidget data
+    written as JSON together with the widget's dependencies, which are
+    served from the shared /assets/widgets route instead of per render.
+    """
+    staging_json = json.dumps(artifact_store.staging_path(f'{output_path}.json'))
+    staging_timing = json.dumps(artifact_store.staging_path(f'{output_path}.timing'))
+    with stage('write'), tempfile.NamedTemporaryFile(suffix='.R', mode='w', delete=False,
+                                                     dir=SCRIPT_DIR) as f:
+        full_code = f"""
+suppressPackageStartupMessages(library(plotly))
+{r_prelude()}
+# User code, evaluated one expression at a time so the last plot shown is known
+.widget <- NULL
+for (.expr in parse(text = {json.dumps(code)}, keep.source = FALSE)) {{
+  .value <- withVisible(eval(.expr, envir = globalenv()))
+  if (.value$visible) {{
+    if (inherits(.value$value, c("plotly", "ggplot"))) .widget <- .value$value
+    else print(.value$value)
+  }}
+}}
+for (.name in c("p", "fig")) {{
+  if (is.null(.widget) && exists(.name) && inherits(get(.name), c("plotly", "ggplot"))) {{
+    .widget <- get(.name)
+  }}
+}}
+if (is.null(.widget)) stop("No plotly figure found. Show the plot or assign it to p or fig.")
+
+# Build the figure and write its htmlwidget data and dependencies
+.save_started <- proc.time()[["elapsed"]]
+.built <- plotly_build(.widget)
+.x <- .built$x
+.x[c("attrs", "visdat", "cur_data")] <- NULL
+.dependencies <- lapply(
+  htmltools::resolveDependencies(c(htmlwidgets::getDependency("plotly", "plotly"), .built$dependencies)),
+  function(dep) {{
+    src <- dep$src$file
+    if (!is.null(dep$package)) src <- system.file(src, package = dep$package)
+    list(name = dep$name, version = dep$version, src = src,
+         script = I(as.character(unlist(lapply(dep$script, function(s) if (is.list(s)) s$src else s)))),
+         stylesheet = I(as.character(unlist(dep$stylesheet))))
+  }})
+writeLines(
+  jsonlite::toJSON(list(x = .x, evals = I(htmlwidgets::JSEvals(.x)), dependencies = .dependencies),
+                   auto_unbox = TRUE, force = TRUE, null = "null", na = "null", digits = NA),
+  {staging_json})
+invisible(file.rename({staging_json}, "{output_path}.json"))
+cat(proc.time()[["elapsed"]] - .save_started, file = {staging_timing})
+invisible(file.rename({staging_timing}, "{output_path}.timing"))
+"""
+        f.write(full_code)
+        temp_file = f.name
     
-    if x_values_match:
-        try:
-            x_str = x_values_match.group(1)
-            x_values = [float(x.strip()) for x in x_str.split(',')]
-        except:
-            pass
-            
-    if y_values_match:
+    # Execute the R file in a warm session
+    try:
+        started = time.perf_counter()
         try:
-            y_str = y_values_match.group(1)
-            y_values = [float(y.strip()) for y in y_str.split(',')]
-        except:
-            pass
+            result = run_r_script(temp_file, timeout=timeout)
+        except subprocess.TimeoutExpired as e:
+            add_stage('execute', time.perf_counter() - started)
+            TIMEOUTS.inc(language='r')
+            return timeout_result(e, timeout)
+        record_execution(started, result, output_path)
+        
+        if result.returncode != 0:
+            return {'error': execution_error(result), 'usage': result.usage}
+        if not os.path.exists(f"{output_path}.json"):
+            return {'error': 'Failed to generate visualization', 'usage': result.usage}
+        
+        with stage('read'):
+            with open(f"{output_path}.json", 'r') as f:
+                payload = json.load(f)
+            dependencies = resolve_widget_dependencies(payload.get('dependencies', []))
+        widget = payload['x']
+        
+        # Reduce long series to the point budget
+        reports = downsample_traces(widget.get('data', []), point_budget)
+        output = '\n'.join(filter(None, [result.stdout.strip(), format_reports(reports)]))
+        
+        if output_format in RASTER_FORMATS:
+            figure = {key: widget[key] for key in ('data', 'layout') if key in widget}
+            return figure_result(figure, None, output, output_format, precision, export=export,
+                                 lod=reports, usage=result.usage)
+        if output_format == 'spec':
+            figure = {key: widget[key] for key in ('data', 'layout', 'config', 'frames') if key in widget}
+            plotly_js = next((dep['scripts'][0] for dep in dependencies
+                              if dep['name'] == 'plotly-main' and dep['scripts']), plotly_js_url())
+            return figure_result(figure, None, output, 'spec', precision, lod=reports,
+                                 plotly_js=plotly_js, usage=result.usage)
+        with stage('encode'):
+            html_content = widget_html(widget, payload.get('evals', []), dependencies)
+        return {
+            'success': True,
+            'html': html_content,
+            'output': output,
+            'lod': reports,
+            'usage': result.usage
+        }
     
-    # Get plot title if present
-    title_match = re.search(r'title\s*=\s*["\']([^"\']+)["\']', code)
-    title = "Interactive Plot" if not title_match else title_match.group(1)
+    finally:
+        # Clean up the script; the artifact store's janitor deletes the outputs
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+
+def widget_html(widget, evals, dependencies, div_id='htmlwidget-plotly', height=500):
+    """Create a standalone htmlwidgets page for an R plotly widget
     
-    # Create a simple HTML with plotly.js
+    Scripts and stylesheets come from the shared, cached /assets/widgets
+    route; only the widget data is embedded in the page.
+    """
+    data = json.dumps({'x': widget, 'evals': evals, 'jsHooks': []}).replace('</', '<\\/')
     html = f"""
 <!DOCTYPE html>
 <html>
 <head>
-    <title>{title}</title>
-    <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
+    <meta charset="utf-8" />
+    <title>Interactive Plot</title>
+    {widget_dependency_tags(dependencies)}
 </head>
-<body>
-    <div id="plotly-chart" style="width:100%; height:500px;"></div>
-    <script>
-        var data = [{{
-            x: {x_values},
-            y: {y_values},
-            type: 'scatter',
-            mode: 'markers'
-        }}];
-        
-        var layout = {{
-            title: '{title}',
-            xaxis: {{
-                title: 'X Values'
-            }},
-            yaxis: {{
-                title: 'Y Values'
-            }}
-        }};
-        
-        Plotly.newPlot('plotly-chart', data, layout);
-    </script>
+<body style="margin:0;">
+    <div id="{div_id}" class="plotly html-widget" style="width:100%; height:{height}px;"></div>
+    <script type="application/json" data-for="{div_id}">{data}</script>
 </body>
 </html>
     """
-    
-    return {
-        'success': True,
-        'html': html,
-        'output': 'Generated interactive plotly visualization'
-    }
+    return html
 
-def execute_r_3d(code, output_path):
+def execute_r_3d(code, output_path, precision=DEFAULT_PRECISION,
+                 point_budget=DEFAULT_POINT_BUDGET, lod_method='mean', output_format='html',
+                 export=None):
     """Generate a 3D visualization using Plotly.js for R rgl code"""
     # Try to extract x, y, z data from the code
     x_match = re.search(r'x\s*<-\s*([^#\n]+)', code)
@@ -437,15 +1297,18 @@ def execute_r_3d(code, output_path):
     y_values = []
     z_values = []
     
-    # If we find seq in the code, try to extract the range
-    range_match = re.search(r'seq\((-?\d+),\s*(-?\d+)', code)
+    # If we find seq in the code, try to extract the range and resolution
+    range_match = re.search(r'seq\((-?[\d.]+),\s*(-?[\d.]+)(?:,\s*length(?:\.out)?\s*=\s*(\d+))?', code)
     range_min = -5
     range_max = 5
+    grid_length = 50
     
     if range_match:
         try:
             range_min = float(range_match.group(1))
             range_max = float(range_match.group(2))
+            if range_match.group(3):
+                grid_length = clamp_grid(int(range_match.group(3)), int(range_match.group(3)))[0]
         except:
             pass
     
@@ -459,104 +1322,80 @@ def execute_r_3d(code, output_path):
     # Generate 3D data
     if plot_type == "surface":
         # Generate a grid of points
-        x = np.linspace(range_min, range_max, 50)
-        y = np.linspace(range_min, range_max, 50)
+        x = np.linspace(range_min, range_max, grid_length)
+        y = np.linspace(range_min, range_max, grid_length)
         X, Y = np.meshgrid(x, y)
         
-        # Try to extract the function from the code if possible
-        z_func_match = re.search(r'function\(x,\s*y\)\s*([^}]+)', code)
-        if z_func_match:
-            z_func_str = z_func_match.group(1).strip()
-            # Look for common math functions
-            if "sin" in z_func_str and "sqrt" in z_func_str:
-                # This looks like the example function: sin(sqrt(x^2 + y^2))
-                R = np.sqrt(X**2 + Y**2)
-                Z = np.sin(R)
-            else:
-                # Default to a simple surface
-                Z = np.sin(np.sqrt(X**2 + Y**2))
-        else:
+        # Try to evaluate the function from the code if possible
+        z_func_match = extract_outer_formula(code)
+        if z_func_match is None:
             # Default surface
             Z = np.sin(np.sqrt(X**2 + Y**2))
+        else:
+            # Never draw a surface other than the one the script defines
+            try:
+                Z = compile_formula(z_func_match[1], z_func_match[0])(X, Y)
+            except FormulaError as e:
+                return {'error': f'The surface formula is not supported: {str(e)}'}
             
-        # Convert to lists for JSON
-        x_values = x.tolist()
-        y_values = y.tolist()
-        z_values = Z.tolist()
+        x_values, y_values, z_values, report = decimate_surface(x, y, Z, point_budget, lod_method)
     else:
         # For scatter3d, generate some points
         t = np.linspace(0, 10, 50)
-        x_values = np.cos(t).tolist()
-        y_values = np.sin(t).tolist()
-        z_values = t.tolist()
+        (x_values, y_values, z_values), report = downsample_scatter(
+            [np.cos(t), np.sin(t), t], point_budget)
     
-    # Create HTML with 3D Plotly visualization
+    # Create a 3D Plotly figure
     title = "3D Visualization"
     if plot_type == "surface":
-        plot_js = f"""
-        var data = [{{
-            z: {json.dumps(z_values)},
-            x: {json.dumps(x_values)},
-            y: {json.dumps(y_values)},
-            type: 'surface',
-            colorscale: 'Viridis'
-        }}];
-        """
+        trace = {
+            'z': z_values,
+            'x': x_values,
+            'y': y_values,
+            'type': 'surface',
+            'colorscale': 'Viridis'
+        }
     else:
-        plot_js = f"""
-        var data = [{{
-            x: {json.dumps(x_values)},
-            y: {json.dumps(y_values)},
-            z: {json.dumps(z_values)},
-            mode: 'markers',
-            type: 'scatter3d',
-            marker: {{
-                size: 5,
-                color: {json.dumps(z_values)},
-                colorscale: 'Viridis',
-                opacity: 0.8
-            }}
-        }}];
-        """
-    
-    html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>{title}</title>
-    <script src="https://cdn.plot.ly/plotly-latest.min.js"></script>
-</head>
-<body>
-    <div id="plotly-3d" style="width:100%; height:600px;"></div>
-    <script>
-        {plot_js}
-        
-        var layout = {{
-            title: '{title}',
-            scene: {{
-                xaxis: {{ title: 'X' }},
-                yaxis: {{ title: 'Y' }},
-                zaxis: {{ title: 'Z' }},
-                camera: {{
-                    eye: {{ x: 1.5, y: 1.5, z: 1.5 }}
-                }}
-            }},
-            margin: {{ l: 0, r: 0, b: 0, t: 50 }}
-        }};
-        
-        Plotly.newPlot('plotly-3d', data, layout);
-    </script>
-</body>
-</html>
-    """
+        trace = {
+            'x': x_values,
+            'y': y_values,
+            'z': z_values,
+            'mode': 'markers',
+            'type': 'scatter3d',
+            'marker': {
+                'size': 5,
+                'color': z_values,
+                'colorscale': 'Viridis',
+                'opacity': 0.8
+            }
+        }
     
-    return {
-        'success': True,
-        'html': html,
-        'output': 'Generated interactive 3D visualization using Plotly.js'
+    figure = {
+        'data': [trace],
+        'layout': {
+            'title': title,
+            'scene': {
+                'xaxis': {'title': 'X'},
+                'yaxis': {'title': 'Y'},
+                'zaxis': {'title': 'Z'},
+                'camera': {
+                    'eye': {'x': 1.5, 'y': 1.5, 'z': 1.5}
+                }
+            },
+            'margin': {'l': 0, 'r': 0, 'b': 0, 't': 50}
+        }
     }
+    
+    return figure_result(
+        figure, lambda fig, prec: figure_html(fig, prec, div_id='plotly-3d', height=600),
+        '\n'.join(filter(None, [
+            'Generated interactive 3D visualization using Plotly.js',
+            format_reports([report])])),
+        output_format, precision, export=export, lod=[report])
 
 if __name__ == '__main__':
+    # Development server only; production runs gunicorn with wsgi.py
     port = int(os.environ.get('PORT', 5001))
-    print(f"Starting Flask server on port {port}...")
-    app.run(debug=True, host='0.0.0.0', port=port)
\ No newline at end of file
+    debug = os.environ.get('FLASK_DEBUG', '0') == '1'
+    print(f"Starting Flask development server on port {port}...")
+    app.run(debug=debug, host='0.0.0.0', port=port, threaded=True)
\ No newline at end of file
@@ -0,0 +1,220 @@
+"""Compact encodings for numeric arrays embedded in generated Plotly pages.
+
+Instead of writing large grids as JSON lists of decimal floats, arrays are
+shipped as base64 strings of little-endian binary taken straight from the
+NumPy buffer, and decoded into JavaScript typed arrays in the browser.
+
+Encoded arrays use the same shape as Plotly's own typed-array spec
+({dtype, bdata, shape}); quantized arrays add `scale` and `offset`.
+encode_figure() applies the encoding to every numeric array in a Plotly
+figure spec, and decodeFigure() in DECODE_JS reverses it in the browser.
+
+Precisions:
+    json     plain JSON lists (fallback, lossless)
+    float32  4 bytes per value
+    float16  2 bytes per value, about 3 significant digits
+    uint16   2 bytes per value, linearly quantized between min and max
+
+Integer arrays are never rounded: they are sent as int32 when they fit and
+as JSON lists otherwise. Float arrays whose range or offset the requested
+precision cannot represent (values past 65504 in float16, epoch timestamps
+in float32) are sent as float64.
+"""
+import base64
+import os
+
+import numpy as np
+
+PRECISIONS = ('json', 'float32', 'float16', 'uint16')
+
+# Default used when a request does not ask for a precision
+DEFAULT_PRECISION = os.environ.get('ARRAY_PRECISION', 'float32')
+
+# Quantized value reserved for NaN / missing data
+UINT16_NAN = 65535
+
+# Numeric lists shorter than this are left as JSON in figure specs
+MIN_ENCODED_LENGTH = 32
+
+# A float array is downcast only if its values are at most this many times
+# its spread away from zero; beyond that the offset eats the precision
+MAX_OFFSET_RATIO = 16
+
+_INT32 = np.iinfo(np.int32)
+
+
+def _b64(arr):
+    return base64.b64encode(np.ascontiguousarray(arr).tobytes()).decode('ascii')
+
+
+def _fits(arr, dtype):
+    """Whether a float64 array keeps its range and resolution in dtype"""
+    finite = arr[np.isfinite(arr)]
+    if finite.size == 0:
+        return True
+    low, high = float(finite.min()), float(finite.max())
+    magnitude = max(abs(low), abs(high))
+    if magnitude > float(np.finfo(dtype).max):
+        return False
+    if magnitude <= MAX_OFFSET_RATIO * (high - low):
+        return True
+    # Values far from zero relative to their spread survive only if exact
+    return bool(np.array_equal(finite.astype(dtype), finite))
+
+
+def encode_array(values, precision=DEFAULT_PRECISION):
+    """Encode a numeric array for embedding in a page"""
+    arr = np.asarray(values)
+    if precision not in PRECISIONS:
+        raise ValueError(f'Unsupported precision: {precision}')
+    if arr.dtype.kind in 'iub':
+        if precision == 'json' or arr.size == 0 or arr.min() < _INT32.min or arr.max() > _INT32.max:
+            return arr.tolist()
+        return {'dtype': 'i4', 'bdata': _b64(arr.astype('<i4')), 'shape': list(arr.shape)}
+    arr = arr.astype(np.float64, copy=False)
+    if precision == 'json':
+        return arr.tolist()
+
+    shape = list(arr.shape)
+    if precision == 'float32' and _fits(arr, np.float32):
+        return {'dtype': 'f4', 'bdata': _b64(arr.astype('<f4')), 'shape': shape}
+    if precision == 'float16' and _fits(arr, np.float16):
+        return {'dtype': 'f2', 'bdata': _b64(arr.astype('<f2')), 'shape': shape}
+    if precision == 'uint16':
+        finite = np.isfinite(arr)
+        if finite.any():
+            offset = float(arr[finite].min())
+            span = float(arr[finite].max()) - offset
+        else:
+            offset, span = 0.0, 0.0
+        scale = span / (UINT16_NAN - 1) if span > 0 else 1.0
+        quantized = np.full(arr.shape, UINT16_NAN, dtype='<u2')
+        quantized[finite] = np.rint((arr[finite] - offset) / scale)
+        return {'dtype': 'u2', 'bdata': _b64(quantized), 'shape': shape,
+                'scale': scale, 'offset': offset}
+    return {'dtype': 'f8', 'bdata': _b64(arr.astype('<f8')), 'shape': shape}
+
+
+def _numeric_list(value):
+    """Return an array for a (nested) list of plain numbers, else None"""
+    if len(value) < MIN_ENCODED_LENGTH and not (value and isinstance(value[0], list)):
+        return None
+    try:
+        arr = np.asarray(value)
+    except ValueError:
+        return None
+    if arr.dtype.kind not in 'iuf' or arr.ndim > 2 or arr.size < MIN_ENCODED_LENGTH:
+        return None
+    return arr
+
+
+def _reencode_typed_array(typed, precision):
+    """Re-encode a float64 Plotly typed array at the requested precision"""
+    if typed.get('dtype') != 'f8' or precision == 'json':
+        return typed
+    shape = typed.get('shape')
+    if isinstance(shape, str):
+        shape = [int(n) for n in shape.split(',')]
+    arr = np.frombuffer(base64.b64decode(typed['bdata']), dtype='<f8')
+    if shape:
+        arr = arr.reshape(shape)
+    return encode_array(arr, precision)
+
+
+def encode_figure(figure, precision=DEFAULT_PRECISION):
+    """Encode the numeric arrays of a Plotly figure spec
+
+    NumPy arrays are always converted; long numeric lists (for example from
+    plotly's to_json) are encoded too unless the precision is 'json'.
+    Float64 arrays already in Plotly's typed-array form are re-encoded at
+    the requested precision.
+    """
+    if isinstance(figure, np.ndarray):
+        if figure.dtype.kind in 'iuf':
+            return encode_array(figure, precision)
+        return figure.tolist()
+    if isinstance(figure, dict):
+        if 'bdata' in figure:
+            return _reencode_typed_array(figure, precision)
+        return {key: encode_figure(value, precision) for key, value in figure.items()}
+    if isinstance(figure, (list, tuple)):
+        if precision != 'json' and figure:
+            arr = _numeric_list(figure)
+            if arr is not None:
+                return encode_array(arr, precision)
+        return [encode_figure(value, precision) for value in figure]
+    if isinstance(figure, np.generic):
+        return figure.item()
+    return figure
+
+
+# Browser-side decoder for encode_array output; decodeArray() returns plain
+# arrays unchanged and turns 2D encodings into an array of typed-array rows.
+# It also understands the other dtypes of Plotly's typed-array spec.
+DECODE_JS = """
+var TYPED_ARRAYS = {
+    f8: Float64Array, f4: Float32Array, i4: Int32Array, u4: Uint32Array,
+    i2: Int16Array, u2: Uint16Array, i1: Int8Array, u1: Uint8Array
+};
+
+function decodeArray(a) {
+    if (a === null || typeof a !== 'object' || Array.isArray(a) || !a.bdata) {
+        return a;
+    }
+    var raw = atob(a.bdata);
+    var bytes = new Uint8Array(raw.length);
+    for (var i = 0; i < raw.length; i++) {
+        bytes[i] = raw.charCodeAt(i);
+    }
+    var values;
+    if (a.dtype === 'f2') {
+        var half = new Uint16Array(bytes.buffer);
+        values = new Float32Array(half.length);
+        for (var j = 0; j < half.length; j++) {
+            var h = half[j], s = (h & 0x8000) ? -1 : 1, e = (h >> 10) & 0x1f, f = h & 0x3ff;
+            values[j] = e === 0 ? s * Math.pow(2, -14) * (f / 1024)
+                : e === 31 ? (f ? NaN : s * Infinity)
+                : s * Math.pow(2, e - 15) * (1 + f / 1024);
+        }
+    } else if (a.dtype === 'u2' && a.scale !== undefined) {
+        var q = new Uint16Array(bytes.buffer);
+        values = new Float32Array(q.length);
+        for (var k = 0; k < q.length; k++) {
+            values[k] = q[k] === 65535 ? NaN : a.offset + q[k] * a.scale;
+        }
+    } else if (TYPED_ARRAYS[a.dtype]) {
+        values = new TYPED_ARRAYS[a.dtype](bytes.buffer);
+    } else {
+        throw new Error('Unsupported dtype ' + a.dtype);
+    }
+    var shape = a.shape || [values.length];
+    if (typeof shape === 'string') {
+        shape = shape.split(',').map(Number);
+    }
+    if (shape.length === 2) {
+        var rows = [];
+        for (var r = 0; r < shape[0]; r++) {
+            rows.push(values.subarray(r * shape[1], (r + 1) * shape[1]));
+        }
+        return rows;
+    }
+    return values;
+}
+
+function decodeFigure(obj) {
+    if (Array.isArray(obj)) {
+        return obj.map(decodeFigure);
+    }
+    if (obj !== null && typeof obj === 'object') {
+        if (obj.bdata) {
+            return decodeArray(obj);
+        }
+        var out = {};
+        for (var key in obj) {
+            out[key] = decodeFigure(obj[key]);
+        }
+        return out;
+    }
+    return obj;
+}
+"""
@@ -0,0 +1,185 @@
+"""Disk-backed store for files produced while rendering.
+
+Output images and other artifacts live in sharded subdirectories
+(<root>/<id[:2]>/<id><ext>) so no single directory grows large. Scripts
+write each artifact under its staging name (see staging_path) and rename
+it into place, so an artifact is never seen half written, even when its
+script is killed mid-write. Requests leave their artifacts behind: a
+background janitor thread deletes artifacts past their maximum age and,
+when the store exceeds its size cap, the oldest artifacts first, along
+with staging files of killed scripts. It also ages out files left loose in
+the legacy temp directory by older versions.
+
+Scripts handed to the Python and R workers are short-lived and go to a
+tmpfs directory when one is available (see SCRIPT_DIR).
+
+Configuration (environment variables):
+    ARTIFACT_MAX_MB            size cap of the store (default 1024)
+    ARTIFACT_MAX_AGE           seconds an artifact is kept (default 3600)
+    ARTIFACT_JANITOR_INTERVAL  seconds between janitor sweeps (default 60)
+    SCRIPT_DIR                 directory for temporary scripts (default: /dev/shm
+                               if writable, else the system temp directory)
+"""
+import os
+import tempfile
+import threading
+import time
+import uuid
+
+
+def _default_script_dir():
+    configured = os.environ.get('SCRIPT_DIR')
+    if configured:
+        os.makedirs(configured, exist_ok=True)
+        return configured
+    if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        return '/dev/shm'
+    return None
+
+
+# Where temp scripts are written; None means tempfile's default
+SCRIPT_DIR = _default_script_dir()
+
+
+class ArtifactStore:
+    """Sharded artifact directory with size- and age-based eviction"""
+
+    def __init__(self, root, max_bytes, max_age, janitor_interval=60, legacy_dir=None):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.janitor_interval = janitor_interval
+        self.legacy_dir = legacy_dir
+        self._lock = threading.Lock()
+        self._janitor_pid = None
+        self._counters = {'evicted_files': 0, 'evicted_bytes': 0, 'expired_files': 0,
+                          'sweeps': 0}
+        self._last_sweep = None
+        self._disk = {'bytes': 0, 'files': 0}
+        os.makedirs(root, exist_ok=True)
+
+    def path(self, artifact_id, extension=''):
+        """Path of an artifact, creating its shard directory"""
+        shard = os.path.join(self.root, artifact_id[:2])
+        os.makedirs(shard, exist_ok=True)
+        self.start_janitor()
+        return os.path.join(shard, f'{artifact_id}{extension}')
+
+    def new_path(self, extension=''):
+        """Reserve a path for a new artifact, e.g. the output of a script"""
+        return self.path(str(uuid.uuid4()), extension)
+
+    @staticmethod
+    def staging_path(path):
+        """Name a script writes an artifact under before renaming it to path"""
+        directory, name = os.path.split(path)
+        return os.path.join(directory, f'.tmp-{name}')
+
+    def remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _files(self):
+        """Yield (path, size, mtime) for every file in the store"""
+        for root, _, files in os.walk(self.root):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                yield path, st.st_size, st.st_mtime
+
+    def _legacy_files(self):
+        """Loose files directly in the legacy temp directory"""
+        if not self.legacy_dir:
+            return
+        try:
+            entries = list(os.scandir(self.legacy_dir))
+        except OSError:
+            return
+        for entry in entries:
+            if entry.name.startswith('.') or not entry.is_file(follow_symlinks=False):
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            yield entry.path, st.st_size, st.st_mtime
+
+    def sweep(self):
+        """Delete expired artifacts, then the oldest ones beyond the size cap"""
+        now = time.time()
+        expired = evicted = evicted_bytes = 0
+        for path, size, mtime in list(self._legacy_files()):
+            if now - mtime > self.max_age:
+                self.remove(path)
+                expired += 1
+                evicted_bytes += size
+
+        kept = []
+        for path, size, mtime in list(self._files()):
+            if now - mtime > self.max_age:
+                self.remove(path)
+                expired += 1
+                evicted_bytes += size
+            else:
+                kept.append((path, size, mtime))
+
+        total = sum(size for _, size, _ in kept)
+        if self.max_bytes and total > self.max_bytes:
+            for path, size, _ in sorted(kept, key=lambda f: f[2]):
+                if total <= self.max_bytes:
+                    break
+                self.remove(path)
+                total -= size
+                evicted += 1
+                evicted_bytes += size
+
+        with self._lock:
+            self._counters['expired_files'] += expired
+            self._counters['evicted_files'] += expired + evicted
+            self._counters['evicted_bytes'] += evicted_bytes
+            self._counters['sweeps'] += 1
+            self._last_sweep = now
+            self._disk = {'bytes': total, 'files': len(kept) - evicted}
+
+    def _janitor(self):
+        while True:
+            try:
+                self.sweep()
+            except Exception as e:
+                print(f"Artifact janitor error: {str(e)}")
+            time.sleep(self.janitor_interval)
+
+    def start_janitor(self):
+        """Start the janitor thread once per process (workers may fork after import)"""
+        if self._janitor_pid == os.getpid() or self.janitor_interval <= 0:
+            return
+        with self._lock:
+            if self._janitor_pid == os.getpid():
+                return
+            self._janitor_pid = os.getpid()
+        threading.Thread(target=self._janitor, name='artifact-janitor', daemon=True).start()
+
+    def stats(self):
+        with self._lock:
+            return dict(self._counters,
+                        bytes_on_disk=self._disk['bytes'],
+                        files_on_disk=self._disk['files'],
+                        max_bytes=self.max_bytes,
+                        max_age=self.max_age,
+                        last_sweep=self._last_sweep,
+                        script_dir=SCRIPT_DIR or tempfile.gettempdir())
+
+
+def create_artifact_store(temp_dir):
+    """Build the store below temp_dir from environment configuration"""
+    return ArtifactStore(
+        os.path.join(temp_dir, 'artifacts'),
+        max_bytes=int(os.environ.get('ARTIFACT_MAX_MB', 1024)) * 1024 * 1024,
+        max_age=int(os.environ.get('ARTIFACT_MAX_AGE', 3600)),
+        janitor_interval=int(os.environ.get('ARTIFACT_JANITOR_INTERVAL', 60)),
+        legacy_dir=temp_dir)
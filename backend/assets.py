@@ -0,0 +1,179 @@
+"""Locally served JavaScript/CSS assets for generated visualizations.
+
+Generated pages reference a pinned Plotly.js bundle and the htmlwidgets
+dependencies under a versioned /assets route instead of a CDN. Assets never
+change under a given URL, so they are served with a strong ETag and
+immutable caching and the browser downloads each of them only once.
+
+Routes:
+    /assets/plotly/<version>/plotly.min.js   the bundle shipped with the plotly package
+    /assets/widgets/<name>-<version>/<file>  htmlwidgets dependencies from static/widgets
+
+Dependencies reported by R widgets that are not in static/widgets yet are
+copied to WIDGETS_INSTALL_DIR from their R package the first time they are
+seen, so every page shares one copy per dependency version instead of a
+*_files directory per render. Server processes sharing the directory may
+install the same dependency at once; the first complete copy wins.
+
+Configuration (environment variables):
+    ASSET_BASE_URL       prefix for asset URLs in generated pages, e.g. the public
+                         backend origin when pages are shown on another host
+                         (default: same origin)
+    WIDGETS_INSTALL_DIR  writable directory for dependencies copied from R
+                         packages, served next to static/widgets
+                         (default: static/widgets)
+"""
+import hashlib
+import html
+import os
+import re
+import shutil
+import tempfile
+import threading
+
+WIDGETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'widgets')
+WIDGETS_INSTALL_DIR = os.path.abspath(os.environ.get('WIDGETS_INSTALL_DIR', WIDGETS_DIR))
+
+# Assets are immutable for a given URL, so browsers may keep them for a year
+ASSET_MAX_AGE = 365 * 24 * 3600
+
+try:
+    import plotly
+    import plotly.offline
+
+    PLOTLY_JS_VERSION = plotly.offline.get_plotlyjs_version()
+    PLOTLY_JS_PATH = os.path.join(os.path.dirname(plotly.__file__), 'package_data', 'plotly.min.js')
+except ImportError:
+    PLOTLY_JS_VERSION = None
+    PLOTLY_JS_PATH = None
+
+_etags = {}
+_etags_lock = threading.Lock()
+
+# Widget dependency directories known to exist below WIDGETS_DIR or WIDGETS_INSTALL_DIR
+_installed_widgets = set()
+_install_lock = threading.Lock()
+
+_DEPENDENCY_NAME = re.compile(r'^[A-Za-z0-9._-]+$')
+
+
+def asset_base_url():
+    return os.environ.get('ASSET_BASE_URL', '').rstrip('/')
+
+
+def plotly_js_url():
+    """URL of the pinned Plotly.js bundle, falling back to the CDN if it is missing"""
+    if PLOTLY_JS_PATH is None or not os.path.exists(PLOTLY_JS_PATH):
+        return 'https://cdn.plot.ly/plotly-latest.min.js'
+    return f'{asset_base_url()}/assets/plotly/{PLOTLY_JS_VERSION}/plotly.min.js'
+
+
+def plotly_script_tag():
+    return f'<script src="{plotly_js_url()}"></script>'
+
+
+def widget_asset_url(path):
+    """URL of a widget dependency file, e.g. 'htmlwidgets-1.6.4/htmlwidgets.js'"""
+    return f'{asset_base_url()}/assets/widgets/{path}'
+
+
+def _widget_dirs():
+    return [WIDGETS_DIR] if WIDGETS_INSTALL_DIR == WIDGETS_DIR else [WIDGETS_DIR, WIDGETS_INSTALL_DIR]
+
+
+def _install_widget_dependency(directory, src):
+    """Copy a dependency's files into WIDGETS_INSTALL_DIR once; False if unavailable"""
+    if directory in _installed_widgets:
+        return True
+    with _install_lock:
+        if not any(os.path.isdir(os.path.join(path, directory)) for path in _widget_dirs()):
+            if not src or not os.path.isdir(src):
+                return False
+            target = os.path.join(WIDGETS_INSTALL_DIR, directory)
+            try:
+                os.makedirs(WIDGETS_INSTALL_DIR, exist_ok=True)
+                staging = tempfile.mkdtemp(prefix='.install-', dir=WIDGETS_INSTALL_DIR)
+                try:
+                    shutil.copytree(src, os.path.join(staging, 'files'))
+                    os.rename(os.path.join(staging, 'files'), target)
+                    print(f"Installed widget dependency {directory}")
+                finally:
+                    shutil.rmtree(staging, ignore_errors=True)
+            except OSError as e:
+                # Another server process may have installed it first
+                if not os.path.isdir(target):
+                    print(f"Could not install widget dependency {directory}: {str(e)}")
+                    return False
+        _installed_widgets.add(directory)
+    return True
+
+
+def _paths(dependency, key):
+    paths = dependency.get(key) or []
+    return [paths] if isinstance(paths, str) else paths
+
+
+def resolve_widget_dependencies(dependencies):
+    """Asset URLs for the htmlwidgets dependencies of a rendered R widget
+
+    Each dependency is a dict with name, version, src (its directory in the
+    R library), script and stylesheet (paths relative to src). Returns
+    dicts with name, version, scripts and stylesheets as URLs; dependencies
+    that are neither shared yet nor available to copy are skipped.
+    """
+    resolved = []
+    for dependency in dependencies:
+        name, version = dependency.get('name'), dependency.get('version')
+        directory = f'{name}-{version}'
+        if not (_DEPENDENCY_NAME.match(str(name)) and _DEPENDENCY_NAME.match(str(version))):
+            print(f"Skipping widget dependency with unexpected name {directory!r}")
+            continue
+        if not _install_widget_dependency(directory, dependency.get('src')):
+            print(f"Widget dependency {directory} is not available")
+            continue
+        resolved.append({
+            'name': name,
+            'version': version,
+            'scripts': [widget_asset_url(f'{directory}/{path}') for path in _paths(dependency, 'script')],
+            'stylesheets': [widget_asset_url(f'{directory}/{path}')
+                            for path in _paths(dependency, 'stylesheet')],
+        })
+    return resolved
+
+
+def widget_dependency_tags(resolved):
+    """<link> and <script> tags for dependencies from resolve_widget_dependencies"""
+    tags = []
+    for dependency in resolved:
+        tags.extend(f'<link href="{html.escape(url)}" rel="stylesheet" />' for url in dependency['stylesheets'])
+        tags.extend(f'<script src="{html.escape(url)}"></script>' for url in dependency['scripts'])
+    return '\n'.join(tags)
+
+
+def resolve_asset(path):
+    """Map an /assets path to a file on disk, or None if it does not exist"""
+    if path == f'plotly/{PLOTLY_JS_VERSION}/plotly.min.js' and PLOTLY_JS_PATH:
+        return PLOTLY_JS_PATH if os.path.exists(PLOTLY_JS_PATH) else None
+
+    if path.startswith('widgets/'):
+        for directory in _widget_dirs():
+            full_path = os.path.realpath(os.path.join(directory, path[len('widgets/'):]))
+            # Refuse anything that escapes the widgets directory
+            if full_path.startswith(os.path.realpath(directory) + os.sep) and os.path.isfile(full_path):
+                return full_path
+    return None
+
+
+def asset_etag(file_path):
+    """Content hash of an asset, computed once per file"""
+    with _etags_lock:
+        etag = _etags.get(file_path)
+    if etag is None:
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        etag = digest.hexdigest()[:32]
+        with _etags_lock:
+            _etags[file_path] = etag
+    return etag
@@ -0,0 +1,45 @@
+"""Concurrent rendering of many snippets with a shared deadline.
+
+A batch fans its items out over a thread pool and yields each result as
+soon as it is ready, so callers can stream them back instead of waiting
+for the slowest item. Failures are isolated: an item that raises only
+produces an error result for that item. Items still unfinished when the
+batch deadline passes are cancelled (if not started yet) and reported as
+errors; an item that is already running, or waiting for a pool worker, is
+bounded by its own execution timeout, which the caller ends with the
+deadline. Closing the generator early, as a streaming response does when
+its client disconnects, also cancels the items that have not started.
+"""
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+
+
+def iter_batch_results(items, fn, executor, deadline):
+    """Run fn(item) for every item, yielding (index, result) in completion order
+
+    `deadline` is the number of seconds the whole batch may take.
+    """
+    expires = time.monotonic() + deadline
+    pending = {executor.submit(fn, item): index for index, item in enumerate(items)}
+
+    try:
+        while pending:
+            remaining = expires - time.monotonic()
+            if remaining <= 0:
+                break
+            done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = {'error': str(e)}
+                yield index, result
+
+        for future, index in sorted(pending.items(), key=lambda entry: entry[1]):
+            future.cancel()
+            yield index, {'error': 'Batch deadline exceeded'}
+    finally:
+        # Nobody reads the remaining results; free the executor for other batches
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,356 @@
+"""Benchmark and load test for the visualization API.
+
+Runs a fixed corpus of scenarios modelled on frontend/src/examples.js
+(matplotlib, plotly express, ggplot2, R plotly and rgl surfaces at several
+grid sizes) against the Flask app in-process through app.test_client(), or
+against a running server over HTTP, at a configurable concurrency. For
+every scenario it reports p50/p95/p99 latency, throughput, response size
+and peak memory, and writes the results as JSON so runs can be compared.
+
+Usage:
+    python benchmark.py                                  # in-process
+    python benchmark.py --url http://localhost:5001 -c 8 # running server
+    python benchmark.py --output after.json --compare before.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+
+import numpy as np
+
+from worker_pool import process_rss_kb
+
+MATPLOTLIB_LINES = """
+import matplotlib.pyplot as plt
+import numpy as np
+
+x = np.linspace(0, 10, 100)
+fig, ax = plt.subplots(figsize=(10, 6))
+ax.plot(x, np.sin(x), label='sin(x)', color='blue', linewidth=2)
+ax.plot(x, np.cos(x), label='cos(x)', color='red', linewidth=2)
+ax.plot(x, np.sin(x) * np.cos(x), label='sin(x)cos(x)', color='green', linestyle='--')
+ax.set_title('Multiple Line Series')
+ax.grid(True, linestyle='--', alpha=0.7)
+ax.legend()
+plt.tight_layout()
+"""
+
+MATPLOTLIB_BARS = """
+import matplotlib.pyplot as plt
+
+categories = ['A', 'B', 'C', 'D', 'E']
+values = [22, 35, 14, 28, 19]
+fig, ax = plt.subplots(figsize=(8, 6))
+ax.bar(categories, values, color='skyblue')
+ax.set_title('Simple Bar Chart')
+plt.tight_layout()
+"""
+
+PLOTLY_SCATTER = """
+import plotly.express as px
+import numpy as np
+import pandas as pd
+
+np.random.seed(42)
+n = 100
+x = np.random.normal(0, 1, n)
+df = pd.DataFrame({'x_val': x, 'y_val': x + np.random.normal(0, 1, n),
+                   'size': np.random.uniform(5, 15, n), 'color': np.random.uniform(0, 1, n)})
+fig = px.scatter(df, x='x_val', y='y_val', size='size', color='color',
+                 color_continuous_scale='viridis', title='Interactive Scatter Plot')
+"""
+
+PLOTLY_SURFACE = """
+import plotly.graph_objects as go
+import numpy as np
+
+x = np.linspace(-5, 5, {n})
+y = np.linspace(-5, 5, {n})
+x_grid, y_grid = np.meshgrid(x, y)
+z_grid = np.sin(np.sqrt(x_grid**2 + y_grid**2))
+fig = go.Figure(data=[go.Surface(z=z_grid, x=x, y=y)])
+fig.update_layout(title='3D Surface Plot')
+"""
+
+R_GGPLOT_BARS = """
+data <- data.frame(
+  category = c("A", "B", "C", "D", "E"),
+  value = c(22, 35, 14, 28, 19)
+)
+p <- ggplot(data, aes(x = category, y = value, fill = category)) +
+  geom_bar(stat = "identity", width = 0.7) +
+  labs(title = "Simple Bar Chart", x = "Categories", y = "Values") +
+  theme_minimal()
+print(p)
+"""
+
+R_GGPLOT_BOXPLOT = """
+set.seed(123)
+data <- data.frame(
+  group = rep(c("A", "B", "C", "D"), each = 30),
+  value = c(rnorm(30, 5, 1), rnorm(30, 7, 1.5), rnorm(30, 4, 0.8), rnorm(30, 6, 1.2))
+)
+p <- ggplot(data, aes(x = group, y = value, fill = group)) +
+  geom_boxplot(alpha = 0.7) +
+  geom_jitter(width = 0.2, alpha = 0.5) +
+  theme_minimal()
+print(p)
+"""
+
+R_PLOTLY_SCATTER = """
+library(plotly)
+x <- c(1, 2, 3, 4, 5, 6, 7, 8, 9, 10)
+y <- c(3, 1, 4, 1, 5, 9, 2, 6, 5, 3)
+p <- plot_ly(x = x, y = y, type = "scatter", mode = "markers") %>%
+  layout(title = "Interactive Scatter Plot")
+p
+"""
+
+R_RGL_SURFACE = """
+library(rgl)
+x <- seq(-5, 5, length = {n})
+y <- seq(-5, 5, length = {n})
+z <- outer(x, y, function(x, y) sin(sqrt(x^2 + y^2)))
+persp3d(x, y, z, col = "lightblue", main = "3D Surface Plot")
+"""
+
+# Fixed corpus; names are stable so results of two runs line up
+SCENARIOS = [
+    {'name': 'python-matplotlib-lines', 'language': 'python', 'code': MATPLOTLIB_LINES},
+    {'name': 'python-matplotlib-bars', 'language': 'python', 'code': MATPLOTLIB_BARS},
+    {'name': 'python-plotly-scatter', 'language': 'python', 'code': PLOTLY_SCATTER},
+    {'name': 'python-plotly-surface-50', 'language': 'python', 'code': PLOTLY_SURFACE.format(n=50)},
+    {'name': 'python-plotly-surface-200', 'language': 'python', 'code': PLOTLY_SURFACE.format(n=200)},
+    {'name': 'r-ggplot-bars', 'language': 'r', 'code': R_GGPLOT_BARS},
+    {'name': 'r-ggplot-boxplot', 'language': 'r', 'code': R_GGPLOT_BOXPLOT},
+    {'name': 'r-plotly-scatter', 'language': 'r', 'code': R_PLOTLY_SCATTER},
+] + [
+    {'name': f'r-rgl-surface-{n}', 'language': 'r', 'code': R_RGL_SURFACE.format(n=n)}
+    for n in (50, 200, 500, 1000)
+]
+
+
+def descendant_pids(pid):
+    """PIDs of all processes below `pid`, e.g. pool workers and their children"""
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                # The command name may contain spaces; fields resume after ')'
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    pids, pending = [], [pid]
+    while pending:
+        current = pending.pop()
+        for child in children.get(current, []):
+            pids.append(child)
+            pending.append(child)
+    return pids
+
+
+class MemorySampler:
+    """Samples the combined RSS of a process tree in the background"""
+
+    def __init__(self, pid, interval=0.05):
+        self.pid = pid
+        self.interval = interval
+        self.peak_kb = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            total = sum(process_rss_kb(pid) for pid in [self.pid] + descendant_pids(self.pid))
+            self.peak_kb = max(self.peak_kb, total)
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        if os.path.isdir('/proc'):
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+
+def client_sender():
+    """Send requests through Flask's test client in this process"""
+    from app import app
+    local = threading.local()
+
+    def send(body):
+        if not hasattr(local, 'client'):
+            local.client = app.test_client()
+        response = local.client.post('/api/visualize', json=body)
+        return response.status_code, response.get_data()
+    return send
+
+
+def http_sender(url):
+    """Send requests to a running server"""
+    endpoint = url.rstrip('/') + '/api/visualize'
+
+    def send(body):
+        request = urllib.request.Request(endpoint, data=json.dumps(body).encode('utf-8'),
+                                         headers={'Content-Type': 'application/json'})
+        try:
+            with urllib.request.urlopen(request, timeout=120) as response:
+                return response.status, response.read()
+        except urllib.error.HTTPError as e:
+            return e.code, e.read()
+    return send
+
+
+def percentile(values, q):
+    return round(float(np.percentile(values, q)), 2) if values else None
+
+
+def run_scenario(send, scenario, args, monitor_pid):
+    """Run one scenario and summarize its latencies, sizes and memory"""
+    body = {'code': scenario['code'], 'language': scenario['language'],
+            'format': args.format, 'cache': args.cache}
+    for _ in range(args.warmup):
+        send(body)
+
+    def timed_request(_):
+        started = time.perf_counter()
+        status, data = send(body)
+        elapsed = (time.perf_counter() - started) * 1000
+        try:
+            result = json.loads(data)
+        except ValueError:
+            result = {}
+        ok = status == 200 and bool(result.get('success'))
+        usage = result.get('usage') or {}
+        return elapsed, len(data), ok, usage.get('max_rss_mb'), result.get('error')
+
+    with MemorySampler(monitor_pid) if monitor_pid else nullcontext() as sampler:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            samples = list(executor.map(timed_request, range(args.requests)))
+        wall = time.perf_counter() - started
+
+    latencies = [s[0] for s in samples]
+    sizes = [s[1] for s in samples]
+    job_rss = [s[3] for s in samples if s[3] is not None]
+    errors = [s[4] for s in samples if not s[2]]
+    return {
+        'language': scenario['language'],
+        'requests': len(samples),
+        'errors': len(errors),
+        'first_error': str(errors[0])[:300] if errors else None,
+        'p50_ms': percentile(latencies, 50),
+        'p95_ms': percentile(latencies, 95),
+        'p99_ms': percentile(latencies, 99),
+        'mean_ms': round(float(np.mean(latencies)), 2),
+        'max_ms': round(max(latencies), 2),
+        'throughput_rps': round(len(samples) / wall, 2) if wall else None,
+        'response_bytes_mean': int(np.mean(sizes)),
+        'response_bytes_max': max(sizes),
+        'peak_rss_mb': round(sampler.peak_kb / 1024, 1) if sampler else None,
+        'max_job_rss_mb': max(job_rss) if job_rss else None,
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare(current, baseline_path):
+    """Print the p50/p95 change of every scenario against an earlier run"""
+    with open(baseline_path) as f:
+        baseline = json.load(f)['scenarios']
+    print(f"\n{'scenario':32} {'p50 ms':>18} {'p95 ms':>18} {'bytes':>20}", file=sys.stderr)
+    for name, result in current['scenarios'].items():
+        before = baseline.get(name)
+        if not before:
+            continue
+        cells = []
+        for key in ('p50_ms', 'p95_ms', 'response_bytes_mean'):
+            old, new = before.get(key), result.get(key)
+            change = f'{(new - old) / old * 100:+.0f}%' if old and new is not None else 'n/a'
+            cells.append(f'{new} ({change})')
+        print(f'{name:32} {cells[0]:>18} {cells[1]:>18} {cells[2]:>20}', file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--url', help='benchmark a running server instead of the in-process app')
+    parser.add_argument('-c', '--concurrency', type=int, default=1, help='requests in flight at once')
+    parser.add_argument('-n', '--requests', type=int, default=20, help='measured requests per scenario')
+    parser.add_argument('--warmup', type=int, default=2, help='unmeasured requests per scenario')
+    parser.add_argument('--scenario', action='append',
+                        help='only run scenarios whose name contains this (repeatable)')
+    parser.add_argument('--format', default='html', choices=['html', 'spec', 'png', 'svg', 'pdf'])
+    parser.add_argument('--cache', action='store_true', help='allow render cache hits')
+    parser.add_argument('--server-pid', type=int,
+                        help='sample the memory of this server process tree in --url mode')
+    parser.add_argument('--output', help='write the JSON results to this file')
+    parser.add_argument('--compare', help='earlier JSON results to compare against')
+    args = parser.parse_args()
+
+    if args.url:
+        send = http_sender(args.url)
+        monitor_pid = args.server_pid
+    else:
+        send = client_sender()
+        monitor_pid = os.getpid()
+
+    scenarios = [s for s in SCENARIOS
+                 if not args.scenario or any(part in s['name'] for part in args.scenario)]
+    results = {
+        'meta': {
+            'mode': 'http' if args.url else 'test_client',
+            'url': args.url,
+            'concurrency': args.concurrency,
+            'requests': args.requests,
+            'warmup': args.warmup,
+            'format': args.format,
+            'cache': args.cache,
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'started_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        },
+        'scenarios': {},
+    }
+    for scenario in scenarios:
+        result = run_scenario(send, scenario, args, monitor_pid)
+        results['scenarios'][scenario['name']] = result
+        print(f"{scenario['name']:32} p50 {result['p50_ms']:>9} ms  p95 {result['p95_ms']:>9} ms  "
+              f"p99 {result['p99_ms']:>9} ms  {result['throughput_rps']:>7} req/s  "
+              f"{result['errors']} errors", file=sys.stderr)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,269 @@
+"""Uploaded datasets shared by name across executions.
+
+A CSV uploaded to /api/datasets is parsed once and stored column by column
+as .npy files, keyed on the SHA-256 of the uploaded bytes:
+
+    <DATASET_DIR>/objects/<hash>/manifest.json  rows, columns and sizes
+    <DATASET_DIR>/objects/<hash>/columns        NUL-terminated name/kind pairs
+    <DATASET_DIR>/objects/<hash>/<i>.npy        values of column i
+    <DATASET_DIR>/objects/<hash>/<i>.labels     NUL-terminated labels of a category column
+    <DATASET_DIR>/names/<name>                  hash the name currently points to
+
+Column kinds are float (float64), int (int32), bool (uint8) and category
+(the smallest signed integer codes holding the labels, -1 for missing);
+string columns are stored as categories.
+
+Python code calls load_dataset(name), which memory-maps the column files,
+so concurrent executions share one copy in the page cache instead of each
+parsing the CSV again. R code gets the same function from dataset_loader.R.
+Render cache keys include the hashes of the datasets a script loads, so
+re-uploading a dataset under the same name invalidates cached renders.
+
+Configuration (environment variables):
+    DATASET_DIR     where datasets are stored (default: backend/temp/datasets)
+    DATASET_MAX_MB  largest CSV accepted for upload (default 512)
+"""
+import hashlib
+import json
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+DATASET_DIR = os.environ.get('DATASET_DIR') or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), 'temp', 'datasets')
+MAX_UPLOAD_BYTES = int(os.environ.get('DATASET_MAX_MB', 512)) * 1024 * 1024
+
+# Reader sourced by the R wrappers (see r_prelude)
+R_LOADER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dataset_loader.R')
+
+# Names start with a letter or digit, so '.', '..' and hidden files are never names
+NAME_PATTERN = re.compile(r'^[A-Za-z0-9][A-Za-z0-9_.-]{0,63}$')
+
+# load_dataset('name') calls with a literal name, and any load_dataset call
+_LITERAL_REFERENCE = re.compile(r'''\bload_dataset\s*\(\s*(?:name\s*=\s*)?(['"])([^'"\\]*)\1''')
+_REFERENCE = re.compile(r'\bload_dataset\s*\(')
+
+_INT32 = np.iinfo(np.int32)
+
+_lock = threading.Lock()
+
+
+class DatasetError(Exception):
+    pass
+
+
+def _names_dir():
+    return os.path.join(DATASET_DIR, 'names')
+
+
+def _object_dir(digest):
+    return os.path.join(DATASET_DIR, 'objects', digest)
+
+
+def valid_name(name):
+    return bool(name) and name not in ('.', '..') and NAME_PATTERN.match(name) is not None
+
+
+def resolve(name):
+    """Hash of the dataset stored under name, or None"""
+    if not valid_name(name):
+        return None
+    try:
+        with open(os.path.join(_names_dir(), name)) as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _read_manifest(digest):
+    with open(os.path.join(_object_dir(digest), 'manifest.json')) as f:
+        return json.load(f)
+
+
+def describe(name):
+    """Manifest of a named dataset, or None if there is no such dataset"""
+    digest = resolve(name)
+    if digest is None:
+        return None
+    try:
+        return dict(_read_manifest(digest), name=name)
+    except (OSError, ValueError):
+        return None
+
+
+def list_datasets():
+    try:
+        names = sorted(os.listdir(_names_dir()))
+    except OSError:
+        return []
+    return [manifest for manifest in map(describe, names) if manifest is not None]
+
+
+def _write_nul_separated(path, strings):
+    with open(path, 'wb') as f:
+        for value in strings:
+            f.write(str(value).replace('\0', '').encode('utf-8') + b'\0')
+
+
+def _read_nul_separated(path):
+    with open(path, 'rb') as f:
+        return [value.decode('utf-8') for value in f.read().split(b'\0')[:-1]]
+
+
+def _column_array(series):
+    """(kind, array, labels) storing one CSV column"""
+    kind = series.dtype.kind
+    if kind == 'b':
+        return 'bool', series.to_numpy().astype(np.uint8), None
+    if kind in 'iu':
+        values = series.to_numpy()
+        if len(values) == 0 or (values.min() >= _INT32.min and values.max() <= _INT32.max):
+            return 'int', values.astype('<i4'), None
+        return 'float', values.astype('<f8'), None
+    if kind == 'f':
+        return 'float', series.to_numpy().astype('<f8'), None
+    codes, labels = pd.factorize(series, sort=True)
+    dtype = next(t for t in (np.int8, np.int16, np.int32) if len(labels) <= np.iinfo(t).max)
+    return 'category', codes.astype(dtype), [str(label) for label in labels]
+
+
+def convert_csv(csv_path, directory, digest, source_bytes):
+    """Parse a CSV file and write its columns and manifest into directory"""
+    try:
+        frame = pd.read_csv(csv_path)
+    except (ValueError, pd.errors.ParserError, UnicodeDecodeError) as e:
+        raise DatasetError(f'Could not parse CSV: {str(e)}')
+    columns = []
+    kinds = []
+    stored_bytes = 0
+    for i, name in enumerate(frame.columns):
+        kind, values, labels = _column_array(frame[name])
+        np.save(os.path.join(directory, f'{i}.npy'), values)
+        stored_bytes += values.nbytes
+        if labels is not None:
+            _write_nul_separated(os.path.join(directory, f'{i}.labels'), labels)
+        columns.append({'name': str(name), 'kind': kind, 'dtype': str(values.dtype),
+                        'labels': len(labels) if labels is not None else None})
+        kinds.extend([name, kind])
+    _write_nul_separated(os.path.join(directory, 'columns'), kinds)
+    manifest = {'hash': digest, 'rows': len(frame), 'columns': columns,
+                'bytes': stored_bytes, 'source_bytes': source_bytes}
+    with open(os.path.join(directory, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f)
+    return manifest
+
+
+def store_csv(name, stream, max_bytes=MAX_UPLOAD_BYTES):
+    """Store CSV data read from a binary stream under name and return its manifest
+
+    Content already stored (under any name) is not parsed again. Raises
+    DatasetError for invalid names, oversized uploads and unparsable CSV.
+    """
+    if not valid_name(name):
+        raise DatasetError('Dataset names are 1-64 letters, digits, dots, dashes or underscores, '
+                           'starting with a letter or digit')
+    objects = os.path.join(DATASET_DIR, 'objects')
+    os.makedirs(objects, exist_ok=True)
+    os.makedirs(_names_dir(), exist_ok=True)
+
+    started = time.perf_counter()
+    fd, csv_path = tempfile.mkstemp(dir=DATASET_DIR, prefix='.upload-', suffix='.csv')
+    staging = None
+    try:
+        digest = hashlib.sha256()
+        size = 0
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in iter(lambda: stream.read(1024 * 1024), b''):
+                size += len(chunk)
+                if size > max_bytes:
+                    raise DatasetError(f'Dataset exceeds {max_bytes // (1024 * 1024)} MB')
+                digest.update(chunk)
+                f.write(chunk)
+        digest = digest.hexdigest()
+
+        directory = _object_dir(digest)
+        if not os.path.exists(os.path.join(directory, 'manifest.json')):
+            staging = tempfile.mkdtemp(dir=objects, prefix='.tmp-')
+            convert_csv(csv_path, staging, digest, size)
+            try:
+                os.rename(staging, directory)
+                staging = None
+            except OSError:
+                pass  # stored concurrently by another upload
+
+        with _lock:
+            fd, tmp_name = tempfile.mkstemp(dir=_names_dir(), prefix='.tmp-')
+            with os.fdopen(fd, 'w') as f:
+                f.write(digest)
+            os.replace(tmp_name, os.path.join(_names_dir(), name))
+    finally:
+        os.remove(csv_path)
+        if staging:
+            shutil.rmtree(staging, ignore_errors=True)
+    print(f"Stored dataset {name} ({digest[:12]}, {size} bytes) in {time.perf_counter() - started:.3f}s")
+    return dict(_read_manifest(digest), name=name)
+
+
+def delete_dataset(name):
+    """Remove a name, and its columns once no other name uses them"""
+    with _lock:
+        digest = resolve(name)
+        if digest is None:
+            return False
+        os.remove(os.path.join(_names_dir(), name))
+        if digest not in {resolve(other) for other in os.listdir(_names_dir())}:
+            # Processes that memory-mapped the columns keep their open files
+            shutil.rmtree(_object_dir(digest), ignore_errors=True)
+    return True
+
+
+def load_dataset(name, columns=None):
+    """Load an uploaded dataset as a DataFrame of memory-mapped, read-only columns
+
+    `columns` selects a subset; only those files are opened.
+    """
+    digest = resolve(name)
+    if digest is None:
+        raise ValueError(f'Unknown dataset {name!r}. Upload it to /api/datasets first.')
+    directory = _object_dir(digest)
+    stored = {column['name']: (i, column) for i, column in enumerate(_read_manifest(digest)['columns'])}
+    wanted = list(stored) if columns is None else list(columns)
+    missing = [column for column in wanted if column not in stored]
+    if missing:
+        raise ValueError(f'Dataset {name!r} has no column(s): {", ".join(map(str, missing))}')
+
+    data = {}
+    for column in wanted:
+        i, meta = stored[column]
+        values = np.load(os.path.join(directory, f'{i}.npy'), mmap_mode='r')
+        if meta['kind'] == 'bool':
+            values = values.view(np.bool_)
+        elif meta['kind'] == 'category':
+            values = pd.Categorical.from_codes(
+                values, categories=_read_nul_separated(os.path.join(directory, f'{i}.labels')))
+        data[column] = values
+    return pd.DataFrame(data, copy=False)
+
+
+def referenced_datasets(code):
+    """Hashes of the datasets code loads, keyed on name (None for unknown names)
+
+    Returns None when a load_dataset call does not name its dataset with a
+    string literal, since its input cannot be known before running it.
+    """
+    names = [match.group(2) for match in _LITERAL_REFERENCE.finditer(code)]
+    if len(names) != len(_REFERENCE.findall(code)):
+        return None
+    return {name: resolve(name) for name in sorted(set(names))}
+
+
+def r_prelude():
+    """R code defining load_dataset() for a script"""
+    return (f'source({json.dumps(R_LOADER)})\n'
+            f'load_dataset <- dataset_loader({json.dumps(DATASET_DIR)})\n')
@@ -0,0 +1,57 @@
+"""Opt-in fast path for simple NumPy/matplotlib snippets.
+
+For allow-listed tenants, snippets that only use numpy, matplotlib and the
+standard math modules skip the temp script, the wrapper and the PNG file:
+they are sent to a warm Python worker as an inline job, run in a child
+forked from the worker (which already has the Agg backend loaded) and the
+figure comes back over a pipe (see python_worker.py). Anything else takes
+the regular execute_python path.
+
+The server does not authenticate X-Tenant. The fast path runs with less
+isolation than the regular path, so a deployment that allow-lists tenants
+must have a trusted proxy set the header or strip it from client
+requests; otherwise any caller can name an allow-listed tenant.
+
+Configuration (environment variables):
+    FAST_PATH_TENANTS  comma-separated tenants (X-Tenant request header) allowed
+                       to use the fast path, `*` for everyone (default: none)
+"""
+import ast
+import os
+
+FAST_PATH_TENANTS = {tenant.strip() for tenant in os.environ.get('FAST_PATH_TENANTS', '').split(',')
+                     if tenant.strip()}
+
+# Top-level modules a fast-path snippet may import
+ALLOWED_MODULES = {'numpy', 'matplotlib', 'math', 'random', 'statistics'}
+
+# Names the regular wrapper predefines but the fast path does not
+WRAPPER_ONLY_NAMES = {'pd', 'px', 'go', 'pio', 'load_dataset'}
+
+
+def fast_path_allowed(tenant):
+    if '*' in FAST_PATH_TENANTS:
+        return True
+    return bool(tenant) and tenant in FAST_PATH_TENANTS
+
+
+def is_simple_snippet(code):
+    """Whether code only imports allowed modules and does not rely on plotly/pandas"""
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return False
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                return False
+            modules = [node.module or '']
+        elif isinstance(node, ast.Name) and node.id in WRAPPER_ONLY_NAMES:
+            return False
+        else:
+            continue
+        if any(module.split('.')[0] not in ALLOWED_MODULES for module in modules):
+            return False
+    return True
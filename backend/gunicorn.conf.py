@@ -0,0 +1,44 @@
+"""Gunicorn configuration for serving the API in production (see wsgi.py).
+
+Threaded workers keep idle keep-alive connections and long-lived
+Server-Sent-Events streams from blocking other requests. The app keeps
+render jobs, editor sessions and the in-memory render cache in process, so
+a job or session is only known to the worker that created it; run a single
+worker and scale with threads (and the Python/R worker pools) unless
+requests are routed to workers by job and session. On SIGTERM every
+worker stops accepting connections, finishes its in-flight requests within
+the graceful timeout and then drains renders that were queued through the
+job API before it exits.
+
+Configuration (environment variables):
+    PORT               port to listen on (default 5001)
+    WEB_CONCURRENCY    worker processes (default 1)
+    GUNICORN_THREADS   request threads per worker (default 8)
+    GUNICORN_TIMEOUT   seconds before a silent worker is restarted (default 120)
+    GRACEFUL_TIMEOUT   seconds a worker may spend draining on shutdown (default 60)
+    KEEPALIVE          seconds an idle keep-alive connection is held open (default 5)
+    MAX_REQUESTS       restart a worker after this many requests, 0 = never (default 0)
+"""
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5001)}"
+workers = int(os.environ.get('WEB_CONCURRENCY', 1))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 8))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))
+graceful_timeout = int(os.environ.get('GRACEFUL_TIMEOUT', 60))
+keepalive = int(os.environ.get('KEEPALIVE', 5))
+max_requests = int(os.environ.get('MAX_REQUESTS', 0))
+max_requests_jitter = max_requests // 10
+
+# Import the app and its libraries once in the master before forking
+preload_app = True
+
+accesslog = '-'
+errorlog = '-'
+
+
+def worker_exit(server, worker):
+    """Let queued and running renders finish before the worker goes away"""
+    from app import drain
+    drain()
@@ -0,0 +1,197 @@
+"""Asynchronous render jobs.
+
+Jobs are queued on a bounded executor so a slow visualization no longer holds
+an HTTP request open. Every job keeps an ordered list of events (status
+changes, output, the final result) that clients can poll or follow as a
+Server-Sent-Events stream.
+
+Configuration (environment variables):
+    JOB_WORKERS      jobs executed concurrently (default 4)
+    JOB_QUEUE_SIZE   jobs allowed to wait for a worker before submissions
+                     are rejected (default 32)
+    JOB_RESULT_TTL   seconds a finished job is kept for polling (default 600)
+"""
+import json
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class JobQueueFull(Exception):
+    """Raised when the job queue has no room for another submission"""
+
+
+class Job:
+    """A single render request and the events it has produced"""
+
+    def __init__(self, params):
+        self.id = str(uuid.uuid4())
+        self.params = params
+        self.status = QUEUED
+        self.result = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.events = []
+        self._cond = threading.Condition()
+
+    @property
+    def finished(self):
+        return self.status in (DONE, FAILED)
+
+    def emit(self, event, data):
+        """Append an event and wake up anyone streaming this job"""
+        with self._cond:
+            self.events.append((len(self.events), event, data))
+            self._cond.notify_all()
+
+    def set_status(self, status):
+        with self._cond:
+            self.status = status
+            if status == RUNNING:
+                self.started_at = time.time()
+            elif status in (DONE, FAILED):
+                self.finished_at = time.time()
+        self.emit('status', {'status': status})
+
+    def finish(self, result):
+        self.result = result
+        self.emit('result', result)
+        self.set_status(FAILED if 'error' in result else DONE)
+
+    def wait(self, timeout=None):
+        """Block until the job has finished; returns False on timeout"""
+        with self._cond:
+            return self._cond.wait_for(lambda: self.finished, timeout)
+
+    def iter_events(self, after=-1, heartbeat=15):
+        """Yield events with a sequence number greater than `after`
+
+        Yields None every `heartbeat` seconds without new events so callers
+        can keep the connection alive, and stops after the last event of a
+        finished job.
+        """
+        next_seq = after + 1
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: len(self.events) > next_seq or self.finished,
+                                    heartbeat)
+                pending = self.events[next_seq:]
+                finished = self.finished
+            if not pending and not finished:
+                yield None
+                continue
+            for event in pending:
+                yield event
+            next_seq += len(pending)
+            if finished and next_seq >= len(self.events):
+                return
+
+    def to_dict(self, include_result=True):
+        info = {
+            'id': self.id,
+            'status': self.status,
+            'created_at': self.created_at,
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+        }
+        if include_result and self.finished:
+            info['result'] = self.result
+        return info
+
+
+class JobManager:
+    """Runs jobs on an executor behind a bounded queue"""
+
+    def __init__(self, executor, max_workers, max_queue=32, result_ttl=600):
+        self.executor = executor
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.result_ttl = result_ttl
+        self._jobs = {}
+        self._active = 0
+        self._lock = threading.Lock()
+
+    def _prune(self):
+        cutoff = time.time() - self.result_ttl
+        for job_id in [job_id for job_id, job in self._jobs.items()
+                       if job.finished and job.finished_at < cutoff]:
+            del self._jobs[job_id]
+
+    def _run(self, job, fn):
+        job.set_status(RUNNING)
+        try:
+            result = fn(job)
+        except Exception as e:
+            result = {'error': f'Job failed: {str(e)}'}
+        finally:
+            with self._lock:
+                self._active -= 1
+        job.finish(result)
+
+    def create(self, params):
+        """Register a job that will be completed by the caller"""
+        job = Job(params)
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+        job.emit('status', {'status': QUEUED})
+        return job
+
+    def submit(self, fn, params):
+        """Queue fn(job) for execution and return the job
+
+        Raises JobQueueFull when every worker is busy and `max_queue` jobs
+        are already waiting.
+        """
+        with self._lock:
+            self._prune()
+            if self._active >= self.max_queue + self.max_workers:
+                raise JobQueueFull()
+            self._active += 1
+            job = Job(params)
+            self._jobs[job.id] = job
+        job.emit('status', {'status': QUEUED})
+        self.executor.submit(self._run, job, fn)
+        return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'workers': self.max_workers,
+                'max_queue': self.max_queue,
+                'active': self._active,
+                'tracked': len(self._jobs),
+            }
+
+    def shutdown(self, wait=True):
+        self.executor.shutdown(wait=wait)
+
+
+def format_sse(event):
+    """Format a job event (or a heartbeat) as a Server-Sent-Events message"""
+    if event is None:
+        return ': keep-alive\n\n'
+    seq, name, data = event
+    return f'id: {seq}\nevent: {name}\ndata: {json.dumps(data)}\n\n'
+
+
+def create_job_manager():
+    """Build the job manager from environment configuration"""
+    workers = int(os.environ.get('JOB_WORKERS', 4))
+    return JobManager(
+        ThreadPoolExecutor(max_workers=workers, thread_name_prefix='render-job'),
+        workers,
+        max_queue=int(os.environ.get('JOB_QUEUE_SIZE', 32)),
+        result_ttl=int(os.environ.get('JOB_RESULT_TTL', 600)))
@@ -0,0 +1,151 @@
+"""Per-execution resource limits and usage accounting.
+
+Every user script runs in a process that gets rlimits for CPU time, address
+space, open files and processes, so a single job cannot exhaust the
+machine. When a delegated cgroup v2 directory is configured, Python jobs
+additionally run in a cgroup of their own with memory.max and pids.max set.
+The executors report the measured wall time, CPU time and peak RSS of each
+job in a `usage` dict.
+
+Configuration (environment variables, 0 disables a limit):
+    JOB_CPU_SECONDS     CPU time a job may use (default 60)
+    JOB_MEMORY_MB       address space of a job process (default 2048)
+    JOB_MAX_OPEN_FILES  open file descriptors (default 256)
+    JOB_MAX_PROCESSES   processes/threads of the user running the job (default 512)
+    JOB_CGROUP_ROOT     writable cgroup v2 directory for per-job cgroups (default: unset)
+"""
+import os
+import resource
+import signal
+import time
+
+from streaming import run_streaming
+
+CPU_SECONDS = int(os.environ.get('JOB_CPU_SECONDS', 60))
+MEMORY_MB = int(os.environ.get('JOB_MEMORY_MB', 2048))
+MAX_OPEN_FILES = int(os.environ.get('JOB_MAX_OPEN_FILES', 256))
+MAX_PROCESSES = int(os.environ.get('JOB_MAX_PROCESSES', 512))
+CGROUP_ROOT = os.environ.get('JOB_CGROUP_ROOT')
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Seconds between SIGXCPU at the soft CPU limit and SIGKILL at the hard one
+CPU_GRACE_SECONDS = 5
+
+
+def apply_limits(cpu=True):
+    """Apply the configured rlimits to the current process
+
+    Meant to run in the child right before user code starts. Hard limits
+    are lowered as well so the script cannot raise them again. Long-lived
+    R sessions pass cpu=False because RLIMIT_CPU counts the whole session.
+    """
+    limits = [
+        (resource.RLIMIT_AS, MEMORY_MB * 1024 * 1024),
+        (resource.RLIMIT_NOFILE, MAX_OPEN_FILES),
+        (resource.RLIMIT_NPROC, MAX_PROCESSES),
+    ]
+    if cpu:
+        limits.append((resource.RLIMIT_CPU, CPU_SECONDS))
+
+    for kind, value in limits:
+        if value <= 0:
+            continue
+        _, hard = resource.getrlimit(kind)
+        if hard != resource.RLIM_INFINITY:
+            value = min(value, hard)
+        new_hard = value
+        if kind == resource.RLIMIT_CPU:
+            new_hard = value + CPU_GRACE_SECONDS
+            if hard != resource.RLIM_INFINITY:
+                new_hard = min(new_hard, hard)
+        try:
+            resource.setrlimit(kind, (value, new_hard))
+        except (ValueError, OSError):
+            pass
+
+
+def describe_exit(returncode):
+    """Explain an exit caused by a resource limit, or return None"""
+    if returncode == -signal.SIGXCPU:
+        return f'Execution exceeded the CPU time limit of {CPU_SECONDS} seconds'
+    if returncode == -signal.SIGKILL:
+        return 'Execution was killed after exceeding a resource limit'
+    return None
+
+
+def rusage_usage(rusage, wall_seconds):
+    """Usage dict from the rusage of a finished child"""
+    return {
+        'wall_seconds': round(wall_seconds, 3),
+        'cpu_seconds': round(rusage.ru_utime + rusage.ru_stime, 3),
+        # ru_maxrss is reported in KiB on Linux
+        'max_rss_mb': round(rusage.ru_maxrss / 1024, 1),
+    }
+
+
+def _write(path, name, value):
+    with open(os.path.join(path, name), 'w') as f:
+        f.write(value)
+
+
+def create_cgroup(name):
+    """Create a child cgroup below JOB_CGROUP_ROOT, or return None"""
+    if not CGROUP_ROOT:
+        return None
+    path = os.path.join(CGROUP_ROOT, name)
+    try:
+        os.makedirs(path, exist_ok=True)
+        if MEMORY_MB > 0:
+            _write(path, 'memory.max', str(MEMORY_MB * 1024 * 1024))
+        if MAX_PROCESSES > 0:
+            _write(path, 'pids.max', str(MAX_PROCESSES))
+    except OSError as e:
+        print(f"Could not set up cgroup {path}: {str(e)}")
+        return None
+    return path
+
+
+def enter_cgroup(path):
+    """Move the current process into a cgroup created by create_cgroup"""
+    if path:
+        try:
+            _write(path, 'cgroup.procs', str(os.getpid()))
+        except OSError:
+            pass
+
+
+def remove_cgroup(path):
+    """Kill anything left in a job cgroup and remove it"""
+    if not path:
+        return
+    try:
+        _write(path, 'cgroup.kill', '1')
+    except OSError:
+        pass
+    for _ in range(50):
+        try:
+            os.rmdir(path)
+            return
+        except FileNotFoundError:
+            return
+        except OSError:
+            time.sleep(0.01)
+
+
+def run_limited(args, timeout):
+    """Run a process with the rlimits applied, attaching a `usage` dict
+
+    Used when no worker pool is available; only wall time is measured here.
+    Output is streamed as it arrives (see streaming.py), so Python runs
+    unbuffered. The backend directory is on PYTHONPATH, as it is in pool
+    workers, so scripts can import dataset_store.
+    """
+    started = time.monotonic()
+    python_path = os.pathsep.join(filter(None, [BACKEND_DIR, os.environ.get('PYTHONPATH')]))
+    result = run_streaming(args, timeout,
+                           preexec_fn=apply_limits,
+                           env=dict(os.environ, PYTHONUNBUFFERED='1', PYTHONPATH=python_path))
+    result.usage = {'wall_seconds': round(time.monotonic() - started, 3),
+                    'cpu_seconds': None, 'max_rss_mb': None}
+    return result
@@ -0,0 +1,273 @@
+"""Server-side level-of-detail reduction for large traces.
+
+Browsers cannot draw multi-million point surfaces or scatter traces
+smoothly, and shipping them dominates response time. This module reduces
+traces to a point budget before they are serialized:
+
+    surfaces   grid decimation by block mean, or by keeping each block's most
+               extreme value so peaks and troughs survive (`minmax`)
+    series     Largest-Triangle-Three-Buckets (LTTB) for ordered 2D series
+    scatter    voxel-grid averaging for unordered 2D/3D point clouds
+
+Every reducer returns a report describing the achieved reduction.
+"""
+import math
+import os
+import warnings
+
+import numpy as np
+
+# Points allowed per trace when a request does not set `point_budget`
+DEFAULT_POINT_BUDGET = int(os.environ.get('LOD_POINT_BUDGET', 250000))
+
+# Largest surface grid evaluated in-process from an R seq() length; longer
+# grids are evaluated at a proportionally coarser resolution
+MAX_SURFACE_CELLS = int(os.environ.get('LOD_MAX_SURFACE_CELLS', 4000000))
+
+SURFACE_METHODS = ('mean', 'minmax')
+
+
+def _report(kind, method, original, reduced):
+    return {
+        'trace': kind,
+        'method': method,
+        'original_points': int(original),
+        'points': int(reduced),
+        'reduction_ratio': round(original / reduced, 2) if reduced else 1.0,
+    }
+
+
+def _block_view(values, fy, fx):
+    """Pad a 2D array with NaN to whole blocks and view it as (ny, fy, nx, fx)"""
+    ny = math.ceil(values.shape[0] / fy)
+    nx = math.ceil(values.shape[1] / fx)
+    padded = np.pad(values.astype(np.float64),
+                    ((0, ny * fy - values.shape[0]), (0, nx * fx - values.shape[1])),
+                    constant_values=np.nan)
+    return padded.reshape(ny, fy, nx, fx)
+
+
+def _block_mean_1d(values, factor):
+    n = math.ceil(len(values) / factor)
+    padded = np.pad(np.asarray(values, dtype=np.float64), (0, n * factor - len(values)),
+                    constant_values=np.nan)
+    return np.nanmean(padded.reshape(n, factor), axis=1)
+
+
+def clamp_grid(nx, ny, max_cells=MAX_SURFACE_CELLS):
+    """Axis lengths scaled down together so an nx by ny grid has at most max_cells cells"""
+    nx, ny = max(int(nx), 1), max(int(ny), 1)
+    if nx * ny <= max_cells:
+        return nx, ny
+    factor = math.sqrt(max_cells / (nx * ny))
+    nx = min(max(int(nx * factor), 1), max_cells)
+    return nx, max(min(int(ny * factor), max_cells // nx), 1)
+
+
+def decimate_surface(x, y, Z, budget, method='mean'):
+    """Reduce a surface grid (Z indexed [y, x]) to at most `budget` points
+
+    Returns (x, y, Z, report); the input is returned unchanged when it
+    already fits the budget.
+    """
+    Z = np.asarray(Z)
+    original = Z.size
+    if not budget or original <= budget:
+        return x, y, Z, _report('surface', 'none', original, original)
+
+    factor = math.ceil(math.sqrt(original / budget))
+    # Never reduce an axis below two samples
+    fy = max(1, min(factor, Z.shape[0] // 2))
+    fx = max(1, min(factor, Z.shape[1] // 2))
+    blocks = _block_view(Z, fy, fx)
+
+    # All-NaN padding blocks are expected; silence 'empty slice' warnings
+    with np.errstate(all='ignore'), warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        means = np.nanmean(blocks, axis=(1, 3))
+        if method == 'minmax':
+            highs = np.nanmax(blocks, axis=(1, 3))
+            lows = np.nanmin(blocks, axis=(1, 3))
+            # Keep whichever extreme deviates more from the block mean
+            reduced = np.where(highs - means >= means - lows, highs, lows)
+        else:
+            reduced = means
+
+    new_x = _block_mean_1d(x, fx)
+    new_y = _block_mean_1d(y, fy)
+    return new_x, new_y, reduced, _report('surface', f'block {method}', original, reduced.size)
+
+
+def lttb(x, y, budget):
+    """Return the indices of `budget` points chosen by Largest-Triangle-Three-Buckets
+
+    LTTB picks each bucket's point against the point picked in the bucket
+    before, which makes it sequential. To stay vectorized the buckets are
+    solved twice: first against the previous bucket's average, then against
+    the point that pass picked there.
+    """
+    n = len(x)
+    if budget >= n or budget < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    # Buckets [bounds[j], bounds[j + 1]); the first budget - 2 get a point each
+    # and the last one only serves as the "next" bucket of its neighbour
+    bounds = np.append(np.linspace(1, n - 1, budget - 1).astype(np.int64), n)
+    counts = np.diff(bounds)
+    avg_x = np.add.reduceat(x, bounds[:-1]) / counts
+    avg_y = np.add.reduceat(y, bounds[:-1]) / counts
+
+    starts = bounds[:budget - 2]
+    sizes = counts[:budget - 2]
+    bucket = np.repeat(np.arange(budget - 2), sizes)
+    points = np.arange(bounds[0], bounds[budget - 2])
+    px, py = x[points], y[points]
+    next_x, next_y = avg_x[1:budget - 1][bucket], avg_y[1:budget - 1][bucket]
+
+    def select(anchor_x, anchor_y):
+        ax, ay = anchor_x[bucket], anchor_y[bucket]
+        areas = np.abs((ax - next_x) * (py - ay) - (ax - px) * (next_y - ay))
+        areas = np.nan_to_num(areas, nan=-1.0)
+        best = np.maximum.reduceat(areas, starts - bounds[0])
+        candidates = np.flatnonzero(areas == best[bucket])
+        # The first maximum of each bucket, like np.argmax
+        _, first = np.unique(bucket[candidates], return_index=True)
+        return points[candidates[first]]
+
+    anchor_x = np.concatenate(([x[0]], avg_x[:budget - 3]))
+    anchor_y = np.concatenate(([y[0]], avg_y[:budget - 3]))
+    selected = select(anchor_x, anchor_y)
+    previous = np.concatenate(([0], selected[:-1]))
+    selected = select(x[previous], y[previous])
+    return np.concatenate(([0], selected, [n - 1]))
+
+
+def voxel_downsample(columns, budget):
+    """Average points that fall into the same cell of a regular grid
+
+    `columns` is a list of equally long 1D arrays (2 or 3 coordinates);
+    returns the averaged columns. Points with missing coordinates are dropped.
+    """
+    points = np.column_stack([np.asarray(c, dtype=np.float64) for c in columns])
+    points = points[np.all(np.isfinite(points), axis=1)]
+    lows = np.nanmin(points, axis=0)
+    spans = np.nanmax(points, axis=0) - lows
+    spans[spans == 0] = 1.0
+
+    # Start from roughly `budget` cells and shrink until the occupied ones fit
+    cells = max(2, int(budget ** (1.0 / points.shape[1])))
+    while True:
+        keys = np.minimum(((points - lows) / spans * cells).astype(np.int64), cells - 1)
+        flat = np.ravel_multi_index(keys.T, (cells,) * points.shape[1])
+        unique, inverse = np.unique(flat, return_inverse=True)
+        if len(unique) <= budget or cells <= 2:
+            break
+        cells = max(2, int(cells * 0.8))
+
+    counts = np.bincount(inverse, minlength=len(unique))
+    return [np.bincount(inverse, weights=points[:, i], minlength=len(unique)) / counts
+            for i in range(points.shape[1])]
+
+
+def _reduce_scatter(columns, budget):
+    """(columns, kept indices or None when points were merged, report)"""
+    original = len(columns[0])
+    kind = f'scatter{len(columns)}d'
+    if not budget or original <= budget:
+        return columns, None, _report(kind, 'none', original, original)
+
+    x = np.asarray(columns[0], dtype=np.float64)
+    if len(columns) == 2 and np.all(np.diff(x) >= 0):
+        indices = lttb(x, columns[1], budget)
+        return ([np.asarray(c)[indices] for c in columns], indices,
+                _report(kind, 'lttb', original, len(indices)))
+    reduced = voxel_downsample(columns, budget)
+    return reduced, None, _report(kind, 'voxel grid', original, len(reduced[0]))
+
+
+def downsample_scatter(columns, budget):
+    """Reduce a 2D or 3D scatter trace to at most `budget` points
+
+    Ordered 2D series use LTTB so their shape is kept; anything else is
+    reduced on a voxel grid. Returns (columns, report).
+    """
+    reduced, _, report = _reduce_scatter(columns, budget)
+    return reduced, report
+
+
+# Per-point trace attributes (dotted paths for nested ones) that must follow x/y
+POINT_ATTRIBUTES = ('text', 'hovertext', 'hovertemplate', 'customdata', 'ids', 'key', 'textposition',
+                    'marker.color', 'marker.size', 'marker.symbol', 'marker.opacity',
+                    'marker.line.color', 'marker.line.width',
+                    'error_x.array', 'error_x.arrayminus', 'error_y.array', 'error_y.arrayminus')
+
+
+def _reduce_point_attributes(trace, n, indices):
+    """Slice the per-point attributes of a trace to the kept indices, or drop them if None"""
+    for path in POINT_ATTRIBUTES:
+        *parents, name = path.split('.')
+        container = trace
+        for parent in parents:
+            container = container.get(parent)
+            if not isinstance(container, dict):
+                break
+        else:
+            values = container.get(name)
+            if isinstance(values, (list, np.ndarray)) and np.ndim(values) > 0 and len(values) == n:
+                if indices is None:
+                    del container[name]
+                elif isinstance(values, np.ndarray):
+                    container[name] = values[indices]
+                else:
+                    container[name] = [values[i] for i in indices]
+
+
+def _is_numeric_series(values):
+    if isinstance(values, np.ndarray):
+        return values.ndim == 1 and values.dtype.kind in 'iuf'
+    return isinstance(values, list) and all(
+        isinstance(v, (int, float)) and not isinstance(v, bool) for v in values)
+
+
+def downsample_traces(traces, budget):
+    """Reduce the 2D scatter traces of a figure spec in place
+
+    Used for figures built elsewhere (e.g. by R plotly or the R translator)
+    whose traces hold plain lists or 1D arrays. Per-point attributes such as
+    hover text and marker colours are sliced like x/y, or dropped when points
+    were merged on a voxel grid. Returns the reports of the traces that were
+    considered.
+    """
+    reports = []
+    for trace in traces:
+        if trace.get('type', 'scatter') not in ('scatter', 'scattergl'):
+            continue
+        x, y = trace.get('x'), trace.get('y')
+        if not (_is_numeric_series(x) and _is_numeric_series(y)) or len(x) != len(y):
+            continue
+        n = len(x)
+        arrays = isinstance(x, np.ndarray)
+        (x, y), indices, report = _reduce_scatter([x, y], budget)
+        if report['method'] != 'none':
+            if arrays:
+                trace['x'], trace['y'] = np.asarray(x), np.asarray(y)
+            else:
+                trace['x'], trace['y'] = np.asarray(x).tolist(), np.asarray(y).tolist()
+            _reduce_point_attributes(trace, n, indices)
+        reports.append(report)
+    return reports
+
+
+def format_reports(reports):
+    """Describe the reductions that were applied, for the response output"""
+    lines = []
+    for report in reports:
+        if report['method'] == 'none':
+            continue
+        lines.append(f"Level of detail: {report['trace']} reduced from {report['original_points']} "
+                     f"to {report['points']} points using {report['method']} "
+                     f"({report['reduction_ratio']}x)")
+    return '\n'.join(lines)
+
@@ -0,0 +1,243 @@
+"""Prometheus metrics and per-stage timing for the render pipeline.
+
+A StageTimer collects how long one render spends in each stage:
+
+    parse      request validation
+    translate  translating R code to a Plotly figure without R (see r_translate.py)
+    write      writing the wrapped script to a temp file
+    spawn      dispatch to a worker and process startup
+    execute    running the user's code
+    save       saving the figure inside the executed script
+    read       reading output files and base64 encoding images
+    encode     building the figure spec or HTML page
+    rasterize  static export of a figure by kaleido (see rasterize.py)
+    serialize  JSON serialization of the response
+
+Code deeper in the pipeline reports into the timer active on the current
+thread with the module-level stage()/add_stage()/set_handler() helpers,
+which do nothing when no timer is active. Nested stages count exclusive
+time. Finished timers are recorded into histograms labelled by stage,
+language and handler, exposed in the Prometheus text format by /metrics.
+"""
+import threading
+import time
+from contextlib import contextmanager
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216, 67108864)
+MEMORY_BUCKETS = (32, 64, 128, 256, 512, 1024, 2048, 4096)
+
+
+def _label_text(names, values):
+    if not names:
+        return ''
+    pairs = ','.join('{}="{}"'.format(name, str(value).replace('\\', '\\\\').replace('"', '\\"'))
+                     for name, value in zip(names, values))
+    return '{' + pairs + '}'
+
+
+def _format_number(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """A monotonically increasing count per label combination"""
+
+    kind = 'counter'
+
+    def __init__(self, name, description, labels=()):
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels.get(name, '') for name in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        with self._lock:
+            values = dict(self._values)
+        for key, value in sorted(values.items()):
+            yield f'{self.name}{_label_text(self.labels, key)} {_format_number(value)}'
+
+
+class Histogram:
+    """Cumulative bucket counts, sum and count per label combination"""
+
+    kind = 'histogram'
+
+    def __init__(self, name, description, labels=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.description = description
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets) + (float('inf'),)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        key = tuple(labels.get(name, '') for name in self.labels)
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * len(self.buckets), 0.0))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            self._values[key] = (counts, total + value)
+
+    def samples(self):
+        with self._lock:
+            values = {key: (list(counts), total) for key, (counts, total) in self._values.items()}
+        for key, (counts, total) in sorted(values.items()):
+            for bound, count in zip(self.buckets, counts):
+                labels = _label_text(self.labels + ('le',), key + (_format_number(bound),))
+                yield f'{self.name}_bucket{labels} {count}'
+            yield f'{self.name}_sum{_label_text(self.labels, key)} {_format_number(total)}'
+            yield f'{self.name}_count{_label_text(self.labels, key)} {counts[-1]}'
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def render(self):
+        """All metrics in the Prometheus text exposition format"""
+        lines = []
+        for metric in self.metrics:
+            lines.append(f'# HELP {metric.name} {metric.description}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            lines.extend(metric.samples())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+
+STAGE_SECONDS = REGISTRY.register(Histogram(
+    'render_stage_seconds', 'Time spent in each stage of a render',
+    ('stage', 'language', 'handler')))
+RENDER_SECONDS = REGISTRY.register(Histogram(
+    'render_seconds', 'Time of a render up to response serialization',
+    ('language', 'handler')))
+RESPONSE_BYTES = REGISTRY.register(Histogram(
+    'render_response_bytes', 'Size of serialized render responses',
+    ('language', 'handler'), buckets=SIZE_BUCKETS))
+JOB_CPU_SECONDS = REGISTRY.register(Histogram(
+    'render_job_cpu_seconds', 'CPU time used by executed user code',
+    ('language', 'handler')))
+JOB_MAX_RSS_MB = REGISTRY.register(Histogram(
+    'render_job_max_rss_mb', 'Peak resident memory of executed user code',
+    ('language', 'handler'), buckets=MEMORY_BUCKETS))
+RENDERS = REGISTRY.register(Counter(
+    'render_requests_total', 'Renders by language, handler and outcome',
+    ('language', 'handler', 'outcome')))
+ERRORS = REGISTRY.register(Counter(
+    'render_errors_total', 'Renders that returned an error',
+    ('language', 'handler')))
+TIMEOUTS = REGISTRY.register(Counter(
+    'render_timeouts_total', 'Executions killed for exceeding their timeout',
+    ('language',)))
+CACHE_LOOKUPS = REGISTRY.register(Counter(
+    'render_cache_lookups_total', 'Render cache lookups by result',
+    ('result',)))
+
+
+class StageTimer:
+    """Stage durations of a single render"""
+
+    def __init__(self, language='', handler='unknown'):
+        self.language = language
+        self.handler = handler
+        self.stages = {}
+        self._recorded = set()
+        self._nested = []
+
+    def add(self, name, seconds):
+        self.stages[name] = self.stages.get(name, 0.0) + max(seconds, 0.0)
+
+    @contextmanager
+    def stage(self, name):
+        """Time a block; time spent in nested stages is not counted twice"""
+        started = time.perf_counter()
+        self._nested.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.add(name, elapsed - self._nested.pop())
+            if self._nested:
+                self._nested[-1] += elapsed
+
+    def record(self):
+        """Observe the stages not recorded yet into the stage histogram"""
+        for name, seconds in self.stages.items():
+            if name not in self._recorded:
+                STAGE_SECONDS.observe(seconds, stage=name, language=self.language,
+                                      handler=self.handler)
+                self._recorded.add(name)
+
+    def total(self):
+        return sum(self.stages.values())
+
+    def header(self):
+        """Breakdown for the X-Timing response header, in milliseconds"""
+        parts = [f'{name};dur={seconds * 1000:.2f}' for name, seconds in self.stages.items()]
+        parts.append(f'total;dur={self.total() * 1000:.2f}')
+        return ', '.join(parts)
+
+
+_local = threading.local()
+
+
+def current_timer():
+    return getattr(_local, 'timer', None)
+
+
+@contextmanager
+def activate(timer):
+    """Make `timer` receive the stages reported on this thread"""
+    previous = current_timer()
+    _local.timer = timer
+    try:
+        yield timer
+    finally:
+        _local.timer = previous
+
+
+@contextmanager
+def stage(name):
+    timer = current_timer()
+    if timer is None:
+        yield
+        return
+    with timer.stage(name):
+        yield
+
+
+def add_stage(name, seconds):
+    timer = current_timer()
+    if timer is not None:
+        timer.add(name, seconds)
+
+
+def set_handler(name):
+    timer = current_timer()
+    if timer is not None:
+        timer.handler = name
+
+
+def record_usage(timer, usage):
+    """Record the measured usage of an executed job (see limits.py)"""
+    if not usage:
+        return
+    if usage.get('cpu_seconds') is not None:
+        JOB_CPU_SECONDS.observe(usage['cpu_seconds'], language=timer.language, handler=timer.handler)
+    if usage.get('max_rss_mb') is not None:
+        JOB_MAX_RSS_MB.observe(usage['max_rss_mb'], language=timer.language, handler=timer.handler)
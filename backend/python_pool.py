@@ -0,0 +1,177 @@
+"""Pool of pre-warmed Python worker processes for execute_python.
+
+Each worker (see python_worker.py) has matplotlib, numpy, pandas and plotly
+imported already and forks a clean child per job, so a request only pays for
+the user's code instead of interpreter startup and library imports.
+
+Configuration (environment variables):
+    PYTHON_POOL_SIZE        number of workers, 0 disables the pool (default 2)
+    PYTHON_POOL_MAX_JOBS    jobs served before a worker is recycled (default 100)
+    PYTHON_POOL_MAX_RSS_MB  recycle a worker whose RSS grows past this (default 512)
+"""
+import atexit
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+
+from limits import run_limited
+from streaming import tail_files
+from worker_pool import WorkerDied, WorkerPool
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'python_worker.py')
+
+POOL_SIZE = int(os.environ.get('PYTHON_POOL_SIZE', 2))
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_python_pool():
+    """Return the process-wide pool, creating it on first use
+
+    Returns None when the pool is disabled or fork() is unavailable.
+    """
+    global _pool
+    size = POOL_SIZE
+    if size <= 0 or not hasattr(os, 'fork'):
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = WorkerPool(
+                [sys.executable, WORKER_SCRIPT],
+                size,
+                max_jobs=int(os.environ.get('PYTHON_POOL_MAX_JOBS', 100)),
+                max_rss_mb=int(os.environ.get('PYTHON_POOL_MAX_RSS_MB', 512)))
+            atexit.register(_pool.shutdown)
+        return _pool
+
+
+def _read_text(path):
+    with open(path, 'r', errors='replace') as f:
+        return f.read()
+
+
+def run_python_script(script, timeout=30):
+    """Run a Python script file with subprocess.run semantics
+
+    Uses a warm worker when the pool is enabled and a fresh interpreter
+    otherwise. Output is streamed while the script runs (see streaming.py).
+    Returns a CompletedProcess with an extra `usage` attribute (see
+    limits.py) and raises TimeoutExpired carrying the output so far.
+    """
+    args = ['python', script]
+    pool = get_python_pool()
+    if pool is None:
+        return run_limited(args, timeout)
+
+    out_fd, out_path = tempfile.mkstemp(suffix='.out')
+    err_fd, err_path = tempfile.mkstemp(suffix='.err')
+    os.close(out_fd)
+    os.close(err_fd)
+    try:
+        try:
+            with tail_files({'stdout': out_path, 'stderr': err_path}):
+                reply = pool.run(json.dumps({'script': script, 'stdout': out_path, 'stderr': err_path}),
+                                 timeout=timeout)
+        except WorkerDied as e:
+            result = subprocess.CompletedProcess(args, 1, _read_text(out_path), str(e))
+            result.usage = None
+            return result
+        if reply is None:
+            raise subprocess.TimeoutExpired(args, timeout, output=_read_text(out_path),
+                                            stderr=_read_text(err_path))
+        if reply.get('error'):
+            result = subprocess.CompletedProcess(args, reply['returncode'], '', reply['stderr'])
+        else:
+            result = subprocess.CompletedProcess(args, reply['returncode'],
+                                                 _read_text(out_path), _read_text(err_path))
+        result.usage = reply.get('usage')
+        return result
+    finally:
+        os.remove(out_path)
+        os.remove(err_path)
+
+
+def run_python_snippet(code, timeout=30):
+    """Run a snippet inline on a warm worker, returning the worker's reply
+
+    The reply holds the base64 PNG of the figure (if any), captured output,
+    timings and usage. Returns None when the pool is disabled; raises
+    TimeoutExpired.
+    """
+    pool = get_python_pool()
+    if pool is None:
+        return None
+    try:
+        reply = pool.run(json.dumps({'mode': 'inline', 'code': code}), timeout=timeout)
+    except WorkerDied as e:
+        return {'returncode': 1, 'error': str(e), 'stdout': '', 'stderr': str(e), 'usage': None}
+    if reply is None:
+        raise subprocess.TimeoutExpired(['python', '<snippet>'], timeout)
+    return reply
+
+
+def start_checkpoint(code, socket_path, ttl, timeout=30):
+    """Execute code on a warm worker and keep its namespace in a checkpoint
+
+    The checkpoint listens on socket_path until it has been idle for `ttl`
+    seconds (see python_worker.py). Returns the worker's reply, which holds
+    an `error` if the code failed, or None when the pool is disabled.
+    Raises TimeoutExpired.
+    """
+    pool = get_python_pool()
+    if pool is None:
+        return None
+    job = {'mode': 'checkpoint', 'code': code, 'socket': socket_path, 'ttl': ttl, 'timeout': timeout}
+    try:
+        # The checkpoint stops itself after `timeout`; the grace period lets it report that
+        reply = pool.run(json.dumps(job), timeout=timeout + 5)
+    except WorkerDied as e:
+        return {'returncode': 1, 'error': str(e), 'stdout': '', 'stderr': str(e), 'usage': None}
+    if reply is None:
+        raise subprocess.TimeoutExpired(['python', '<checkpoint>'], timeout)
+    return reply
+
+
+def _checkpoint_request(socket_path, request, timeout):
+    """Send one request to a checkpoint and return its reply, None if it is gone"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(socket_path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            return None
+        sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        line = sock.makefile('rb').readline()
+    return json.loads(line) if line else None
+
+
+def run_in_checkpoint(socket_path, code, timeout=30):
+    """Run code in a fresh fork of a checkpoint, returning the reply
+
+    The reply looks like an inline job's, with the figure as a Plotly spec
+    (`figure`) or a PNG (`image`). Returns None when the checkpoint has
+    exited; raises TimeoutExpired.
+    """
+    try:
+        reply = _checkpoint_request(socket_path, {'code': code, 'timeout': timeout}, timeout + 5)
+    except socket.timeout:
+        reply = {'timed_out': True}
+    except (OSError, ValueError):
+        # The checkpoint died while handling the request
+        return None
+    if reply is not None and reply.get('timed_out'):
+        raise subprocess.TimeoutExpired(['python', '<snippet>'], timeout)
+    return reply
+
+
+def close_checkpoint(socket_path):
+    """Ask a checkpoint to exit now instead of at the end of its TTL"""
+    try:
+        _checkpoint_request(socket_path, {'close': True}, 5)
+    except OSError:
+        pass
@@ -0,0 +1,376 @@
+"""Long-lived Python worker process used by the execution pool.
+
+The worker imports the plotting stack once at startup and then forks a fresh
+child for every job, so each script runs in a clean copy of a warm
+interpreter. Children run under the resource limits from limits.py and
+their wall time, CPU time and peak RSS are measured with wait4().
+
+Jobs with mode "inline" carry a snippet instead of a script path: the child
+executes it directly and sends the rendered matplotlib figure back over a
+pipe, so nothing is written to disk.
+
+Jobs with mode "checkpoint" start a detached process that executes a
+snippet and then keeps its namespace alive, listening on a unix socket for
+more code (see sessions.py). Every request runs in a fresh fork of the
+checkpoint, so the saved namespace never changes, and the checkpoint exits
+after being idle for its TTL.
+
+Jobs arrive as one JSON object per line on stdin and replies are written as
+one JSON object per line on stdout.
+"""
+import base64
+import io
+import json
+import os
+import resource
+import runpy
+import select
+import signal
+import socket
+import sys
+import time
+import traceback
+
+import matplotlib
+matplotlib.use('Agg')  # Use non-interactive backend
+import matplotlib.pyplot as plt  # noqa: F401 (preloaded for user scripts)
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from dataset_store import load_dataset
+from limits import apply_limits, create_cgroup, enter_cgroup, remove_cgroup, rusage_usage
+
+
+# File descriptor of the reply channel, closed in forked children
+channel_fd = None
+
+# Jobs run so far, used to name per-job cgroups
+job_count = 0
+
+# Names predefined for snippets, matching the imports of execute_python's wrapper
+SNIPPET_GLOBALS = {'matplotlib': matplotlib, 'plt': plt, 'np': np, 'pd': pd, 'px': px, 'go': go,
+                   'pio': pio, 'load_dataset': load_dataset}
+
+
+def run_child(script, out_file, err_file, cgroup):
+    """Run a script in the forked child and exit with its status code"""
+    enter_cgroup(cgroup)
+    apply_limits()
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.dup2(out_file.fileno(), 1)
+    os.dup2(err_file.fileno(), 2)
+    os.close(devnull)
+    if channel_fd is not None:
+        os.close(channel_fd)
+    # Flush every line so the caller can follow the output while the job runs
+    sys.stdout.reconfigure(line_buffering=True)
+    # The parent's RNG state was copied by fork; give every job fresh entropy
+    np.random.seed()
+
+    code = 0
+    try:
+        sys.argv = [script]
+        runpy.run_path(script, run_name='__main__')
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            code = e.code
+        elif e.code is not None:
+            print(e.code, file=sys.stderr)
+            code = 1
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+
+
+def capture_figure(namespace):
+    """The figure left by executed code: a Plotly spec (`fig`) or a matplotlib PNG"""
+    fig = namespace.get('fig')
+    if fig is not None and 'plotly' in str(type(fig)):
+        return {'figure': pio.to_json(fig, validate=False)}
+    if plt.get_fignums():
+        buffer = io.BytesIO()
+        plt.savefig(buffer, format='png')
+        plt.close('all')
+        return {'image': base64.b64encode(buffer.getvalue()).decode('ascii')}
+    return {}
+
+
+def execute_snippet(code, namespace, figure=True):
+    """Execute code in namespace, capturing its output, timings and figure"""
+    out, err = io.StringIO(), io.StringIO()
+    sys.stdout, sys.stderr = out, err
+    message = {}
+    try:
+        started = time.perf_counter()
+        exec(compile(code, '<snippet>', 'exec'), namespace)
+        executed = time.perf_counter()
+        if figure:
+            message.update(capture_figure(namespace))
+        message['execute_seconds'] = executed - started
+        message['save_seconds'] = time.perf_counter() - executed
+    except BaseException:
+        # Leave this function's frame out of the traceback
+        exc_type, exc, tb = sys.exc_info()
+        traceback.print_exception(exc_type, exc, tb.tb_next)
+        message['error'] = f'{exc_type.__name__}: {exc}'
+    message['stdout'] = out.getvalue()
+    message['stderr'] = err.getvalue()
+    return message
+
+
+def write_message(fd, message):
+    data = json.dumps(message).encode('utf-8')
+    while data:
+        data = data[os.write(fd, data):]
+
+
+def read_pipe(fd, timeout=None):
+    """Read a pipe until EOF; returns (data, timed_out)"""
+    deadline = None if timeout is None else time.monotonic() + timeout
+    chunks = []
+    while True:
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+                return b''.join(chunks), True
+        chunk = os.read(fd, 1024 * 1024)
+        if not chunk:
+            return b''.join(chunks), False
+        chunks.append(chunk)
+
+
+def isolate_child():
+    """Common setup of a forked child that runs user code"""
+    apply_limits()
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.close(devnull)
+    if channel_fd is not None:
+        os.close(channel_fd)
+
+
+def run_inline_child(code, write_fd, cgroup):
+    """Execute a snippet in the forked child and send the result over a pipe"""
+    enter_cgroup(cgroup)
+    isolate_child()
+    np.random.seed()
+
+    namespace = {'__name__': '__main__', 'matplotlib': matplotlib, 'plt': plt, 'np': np}
+    write_message(write_fd, execute_snippet(code, namespace))
+    os._exit(0)
+
+
+def run_inline_job(job):
+    """Fork a child for a snippet and read its figure from a pipe"""
+    global job_count
+    job_count += 1
+    cgroup = create_cgroup(f'job-{os.getpid()}-{job_count}')
+    read_fd, write_fd = os.pipe()
+    started = time.monotonic()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        run_inline_child(job['code'], write_fd, cgroup)
+    os.close(write_fd)
+
+    data, _ = read_pipe(read_fd)
+    os.close(read_fd)
+    _, status, rusage = os.wait4(pid, 0)
+    wall_seconds = time.monotonic() - started
+    remove_cgroup(cgroup)
+
+    try:
+        reply = json.loads(data)
+    except ValueError:
+        # The child was killed before it could answer
+        reply = {'stdout': '', 'stderr': ''}
+    reply['returncode'] = os.waitstatus_to_exitcode(status)
+    reply['usage'] = rusage_usage(rusage, wall_seconds)
+    return reply
+
+
+def run_in_fork(namespace, request):
+    """Run a request's code in a fork of the checkpoint and collect the reply"""
+    timeout = request.get('timeout') or None
+    read_fd, write_fd = os.pipe()
+    started = time.monotonic()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        write_message(write_fd, execute_snippet(request['code'], namespace))
+        os._exit(0)
+    os.close(write_fd)
+
+    data, timed_out = read_pipe(read_fd, timeout)
+    os.close(read_fd)
+    if timed_out:
+        os.kill(pid, signal.SIGKILL)
+    _, status, rusage = os.wait4(pid, 0)
+    if timed_out:
+        return {'timed_out': True}
+    try:
+        reply = json.loads(data)
+    except ValueError:
+        reply = {'stdout': '', 'stderr': ''}
+    reply['returncode'] = os.waitstatus_to_exitcode(status)
+    reply['usage'] = rusage_usage(rusage, time.monotonic() - started)
+    return reply
+
+
+def run_checkpoint(job, write_fd):
+    """Body of a checkpoint process: execute the job's code, then serve requests"""
+    isolate_child()
+    np.random.seed()
+    started = time.monotonic()
+
+    def timed_out(signum, frame):
+        raise TimeoutError(f"Execution timed out after {job['timeout']} seconds")
+
+    signal.signal(signal.SIGALRM, timed_out)
+    signal.setitimer(signal.ITIMER_REAL, job.get('timeout') or 0)
+    namespace = dict(SNIPPET_GLOBALS, __name__='__main__')
+    message = execute_snippet(job['code'], namespace, figure=False)
+    signal.setitimer(signal.ITIMER_REAL, 0)
+    sys.stdout, sys.stderr = sys.__stdout__, sys.__stderr__
+    plt.close('all')
+    if message.get('error'):
+        write_message(write_fd, message)
+        os._exit(0)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(job['socket'])
+    os.chmod(job['socket'], 0o600)
+    server.listen(8)
+    server.settimeout(job.get('ttl') or None)
+    message['pid'] = os.getpid()
+    message['usage'] = rusage_usage(resource.getrusage(resource.RUSAGE_SELF),
+                                    time.monotonic() - started)
+    write_message(write_fd, message)
+    os.close(write_fd)
+
+    try:
+        while True:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                break
+            with conn:
+                try:
+                    conn.settimeout(10)
+                    request = json.loads(conn.makefile('rb').readline())
+                    if request.get('close'):
+                        break
+                    conn.settimeout(None)
+                    reply = run_in_fork(namespace, request)
+                    conn.sendall(json.dumps(reply).encode('utf-8') + b'\n')
+                except (OSError, ValueError) as e:
+                    print(f"Checkpoint request failed: {str(e)}")
+    finally:
+        try:
+            os.remove(job['socket'])
+        except OSError:
+            pass
+        os._exit(0)
+
+
+def run_checkpoint_job(job):
+    """Start a detached checkpoint process and wait until it is ready"""
+    read_fd, write_fd = os.pipe()
+    started = time.monotonic()
+    pid = os.fork()
+    if pid == 0:
+        # Detach through an intermediate child so the checkpoint outlives this
+        # worker (and its process group) and is not left as our zombie
+        os.close(read_fd)
+        os.setsid()
+        if os.fork() == 0:
+            run_checkpoint(job, write_fd)
+        os._exit(0)
+    os.close(write_fd)
+    os.waitpid(pid, 0)
+
+    data, _ = read_pipe(read_fd)
+    os.close(read_fd)
+    try:
+        reply = json.loads(data)
+    except ValueError:
+        # The checkpoint was killed, e.g. by its timeout or a resource limit
+        reply = {'stdout': '', 'stderr': '',
+                 'error': 'Execution stopped before the checkpoint was ready',
+                 'usage': {'wall_seconds': round(time.monotonic() - started, 3),
+                           'cpu_seconds': None, 'max_rss_mb': None}}
+    reply['returncode'] = 1 if reply.get('error') else 0
+    return reply
+
+
+def run_job(job):
+    """Fork a child for the job and collect its exit status and resource usage
+
+    The child's stdout and stderr go to the files named by the job, which
+    the caller reads (and may follow while the job runs).
+    """
+    global job_count
+    job_count += 1
+    cgroup = create_cgroup(f'job-{os.getpid()}-{job_count}')
+    with open(job['stdout'], 'wb') as out_file, open(job['stderr'], 'wb') as err_file:
+        started = time.monotonic()
+        pid = os.fork()
+        if pid == 0:
+            run_child(job['script'], out_file, err_file, cgroup)
+
+        _, status, rusage = os.wait4(pid, 0)
+        wall_seconds = time.monotonic() - started
+        remove_cgroup(cgroup)
+
+    return {
+        'returncode': os.waitstatus_to_exitcode(status),
+        'usage': rusage_usage(rusage, wall_seconds),
+    }
+
+
+def warm_up():
+    """Render one figure so fonts and the Agg/PNG pipeline are loaded before forking"""
+    fig = plt.figure()
+    plt.plot([0, 1], [0, 1])
+    plt.title('warm-up')
+    fig.savefig(io.BytesIO(), format='png')
+    plt.close('all')
+
+
+def main():
+    global channel_fd
+
+    # Keep the protocol channel private so stray prints cannot corrupt it
+    channel_fd = os.dup(1)
+    channel = os.fdopen(channel_fd, 'w', buffering=1)
+    os.dup2(2, 1)
+
+    warm_up()
+    channel.write(json.dumps({'ready': True, 'pid': os.getpid()}) + '\n')
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            job = json.loads(line)
+            if job.get('mode') == 'inline':
+                reply = run_inline_job(job)
+            elif job.get('mode') == 'checkpoint':
+                reply = run_checkpoint_job(job)
+            else:
+                reply = run_job(job)
+        except Exception as e:
+            reply = {'returncode': 1, 'stdout': '', 'stderr': f'Worker error: {str(e)}', 'error': str(e)}
+        channel.write(json.dumps(reply) + '\n')
+
+
+if __name__ == '__main__':
+    main()
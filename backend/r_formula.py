@@ -0,0 +1,295 @@
+"""Safe, vectorized evaluation of R surface formulas.
+
+R surface examples build their z values with
+`outer(x, y, function(x, y) <formula>)`. This module parses the formula body
+into a small whitelisted AST (numbers, the function's arguments, arithmetic,
+`^` and a set of math functions) and evaluates it as a single NumPy
+broadcast over the meshgrid, so arbitrary surfaces can be rendered
+in-process without launching R and without using `eval`.
+"""
+import math
+import re
+from functools import lru_cache
+
+import numpy as np
+
+
+class FormulaError(ValueError):
+    """Raised for formulas outside the supported subset of R"""
+
+
+# R function name -> (NumPy implementation, allowed argument counts)
+FUNCTIONS = {
+    'sin': (np.sin, (1,)),
+    'cos': (np.cos, (1,)),
+    'tan': (np.tan, (1,)),
+    'asin': (np.arcsin, (1,)),
+    'acos': (np.arccos, (1,)),
+    'atan': (np.arctan, (1,)),
+    'atan2': (np.arctan2, (2,)),
+    'sinh': (np.sinh, (1,)),
+    'cosh': (np.cosh, (1,)),
+    'tanh': (np.tanh, (1,)),
+    'exp': (np.exp, (1,)),
+    'expm1': (np.expm1, (1,)),
+    'log': (lambda v, base=None: np.log(v) if base is None else np.log(v) / np.log(base), (1, 2)),
+    'log10': (np.log10, (1,)),
+    'log2': (np.log2, (1,)),
+    'log1p': (np.log1p, (1,)),
+    'sqrt': (np.sqrt, (1,)),
+    'abs': (np.abs, (1,)),
+    'sign': (np.sign, (1,)),
+    'floor': (np.floor, (1,)),
+    'ceiling': (np.ceil, (1,)),
+    'pmin': (np.minimum, (2,)),
+    'pmax': (np.maximum, (2,)),
+}
+
+# Deepest nesting of operators, parentheses and calls in a formula
+MAX_DEPTH = 100
+
+CONSTANTS = {
+    'pi': math.pi,
+    'TRUE': 1.0,
+    'FALSE': 0.0,
+    'T': 1.0,
+    'F': 0.0,
+}
+
+BINARY_OPS = {
+    '+': np.add,
+    '-': np.subtract,
+    '*': np.multiply,
+    '/': np.true_divide,
+    '^': np.power,
+    '%%': np.mod,
+    '%/%': np.floor_divide,
+}
+
+TOKEN_RE = re.compile(r"""
+    \s*(?:
+        (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?L?)
+      | (?P<name>[A-Za-z.][A-Za-z0-9._]*)
+      | (?P<op>%/%|%%|\*\*|[-+*/^(),])
+    )""", re.VERBOSE)
+
+
+def tokenize(text):
+    tokens = []
+    pos = 0
+    text = text.strip()
+    while pos < len(text):
+        match = TOKEN_RE.match(text, pos)
+        if not match or match.end() == pos:
+            raise FormulaError(f'Unexpected character {text[pos]!r} in formula')
+        pos = match.end()
+        if match.group('number'):
+            tokens.append(('number', float(match.group('number').rstrip('L'))))
+        elif match.group('name'):
+            tokens.append(('name', match.group('name')))
+        else:
+            op = match.group('op')
+            tokens.append(('op', '^' if op == '**' else op))
+    return tokens
+
+
+class Parser:
+    """Recursive-descent parser following R's operator precedence"""
+
+    def __init__(self, tokens, variables):
+        self.tokens = tokens
+        self.variables = variables
+        self.pos = 0
+        self.depth = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def take(self, op=None):
+        token = self.peek()
+        if token[0] is None or (op is not None and token != ('op', op)):
+            raise FormulaError(f'Expected {op or "more input"} in formula')
+        self.pos += 1
+        return token
+
+    def parse(self):
+        node = self.additive()
+        if self.pos != len(self.tokens):
+            raise FormulaError(f'Unexpected {self.peek()[1]!r} in formula')
+        return node
+
+    def additive(self):
+        node = self.multiplicative()
+        while self.peek() in (('op', '+'), ('op', '-')):
+            op = self.take()[1]
+            node = ('bin', op, node, self.multiplicative())
+        return node
+
+    def multiplicative(self):
+        node = self.special()
+        while self.peek() in (('op', '*'), ('op', '/')):
+            op = self.take()[1]
+            node = ('bin', op, node, self.special())
+        return node
+
+    def special(self):
+        node = self.unary()
+        while self.peek() in (('op', '%%'), ('op', '%/%')):
+            op = self.take()[1]
+            node = ('bin', op, node, self.unary())
+        return node
+
+    def unary(self):
+        # Every level of nesting passes through here
+        self.depth += 1
+        if self.depth > MAX_DEPTH:
+            raise FormulaError('Formula is nested too deeply')
+        try:
+            if self.peek() == ('op', '-'):
+                self.take()
+                return ('neg', self.unary())
+            if self.peek() == ('op', '+'):
+                self.take()
+                return self.unary()
+            return self.power()
+        finally:
+            self.depth -= 1
+
+    def power(self):
+        node = self.primary()
+        if self.peek() == ('op', '^'):
+            self.take()
+            # Right-associative, and binds tighter than a leading minus
+            node = ('bin', '^', node, self.unary())
+        return node
+
+    def primary(self):
+        kind, value = self.take()
+        if kind == 'number':
+            return ('num', value)
+        if kind == 'op' and value == '(':
+            node = self.additive()
+            self.take(')')
+            return node
+        if kind == 'name':
+            if self.peek() == ('op', '('):
+                return self.call(value)
+            if value in self.variables:
+                return ('var', value)
+            if value in CONSTANTS:
+                return ('num', CONSTANTS[value])
+            raise FormulaError(f'Unknown variable {value!r} in formula')
+        raise FormulaError(f'Unexpected {value!r} in formula')
+
+    def call(self, name):
+        if name not in FUNCTIONS:
+            raise FormulaError(f'Unsupported function {name!r} in formula')
+        self.take('(')
+        args = []
+        if self.peek() != ('op', ')'):
+            args.append(self.additive())
+            while self.peek() == ('op', ','):
+                self.take()
+                args.append(self.additive())
+        self.take(')')
+        if len(args) not in FUNCTIONS[name][1]:
+            raise FormulaError(f'Wrong number of arguments to {name}()')
+        return ('call', name, tuple(args))
+
+
+def tree_depth(node):
+    """Depth of an AST, computed without recursion"""
+    depth, stack = 0, [(node, 1)]
+    while stack:
+        node, level = stack.pop()
+        depth = max(depth, level)
+        if node[0] == 'neg':
+            stack.append((node[1], level + 1))
+        elif node[0] == 'bin':
+            stack.extend(((node[2], level + 1), (node[3], level + 1)))
+        elif node[0] == 'call':
+            stack.extend((arg, level + 1) for arg in node[2])
+    return depth
+
+
+def evaluate(node, env):
+    """Evaluate an AST node with NumPy arrays bound to the variables"""
+    kind = node[0]
+    if kind == 'num':
+        return node[1]
+    if kind == 'var':
+        return env[node[1]]
+    if kind == 'neg':
+        return np.negative(evaluate(node[1], env))
+    if kind == 'bin':
+        return BINARY_OPS[node[1]](evaluate(node[2], env), evaluate(node[3], env))
+    if kind == 'call':
+        return FUNCTIONS[node[1]][0](*(evaluate(arg, env) for arg in node[2]))
+    raise FormulaError(f'Unknown node {kind!r}')
+
+
+class CompiledFormula:
+    """A parsed formula of two variables that evaluates over a grid"""
+
+    def __init__(self, formula, variables, tree):
+        self.formula = formula
+        self.variables = variables
+        self.tree = tree
+
+    def __call__(self, X, Y):
+        with np.errstate(all='ignore'):
+            Z = evaluate(self.tree, dict(zip(self.variables, (X, Y))))
+        return np.broadcast_to(np.asarray(Z, dtype=np.float64), np.broadcast(X, Y).shape)
+
+
+@lru_cache(maxsize=256)
+def compile_formula(formula, variables=('x', 'y')):
+    """Parse a formula body into a cached CompiledFormula
+
+    Raises FormulaError if the formula uses anything outside the whitelist
+    or nests deeper than MAX_DEPTH.
+    """
+    tree = Parser(tokenize(formula), variables).parse()
+    # Long operator chains parse iteratively but evaluate recursively
+    if tree_depth(tree) > MAX_DEPTH:
+        raise FormulaError('Formula is nested too deeply')
+    return CompiledFormula(formula, variables, tree)
+
+
+def _matching_paren(text, start):
+    """Return the index of the parenthesis closing the one at `start`"""
+    depth = 0
+    for i in range(start, len(text)):
+        if text[i] == '(':
+            depth += 1
+        elif text[i] == ')':
+            depth -= 1
+            if depth == 0:
+                return i
+    return -1
+
+
+def extract_outer_formula(code):
+    """Find `outer(x, y, function(a, b) body)` in R code
+
+    Returns (variables, body) with the function's argument names, or None
+    when no such call is present.
+    """
+    match = re.search(r'outer\s*\(', code)
+    if not match:
+        return None
+    end = _matching_paren(code, match.end() - 1)
+    if end < 0:
+        return None
+    inner = code[match.end():end]
+
+    fn_match = re.search(r'function\s*\(\s*([A-Za-z.][\w.]*)\s*,\s*([A-Za-z.][\w.]*)\s*\)', inner)
+    if not fn_match:
+        return None
+    body = inner[fn_match.end():].strip()
+    # Allow a braced body holding a single expression
+    if body.startswith('{') and body.endswith('}'):
+        body = body[1:-1].strip()
+    if not body:
+        return None
+    return (fn_match.group(1), fn_match.group(2)), body
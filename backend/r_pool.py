@@ -0,0 +1,102 @@
+"""Pool of warm R sessions for the R executors.
+
+Each session (see r_worker.R) loads ggplot2 and plotly once and sources job scripts into
+a global environment that is cleaned between jobs, so a request no longer
+pays for R startup and package loading. Hung sessions are killed and
+respawned when a job exceeds its timeout.
+
+Sessions start with the memory, open-file and process rlimits from
+limits.py; the CPU limit is enforced per job inside the session with
+setTimeLimit(), and each reply carries the job's measured usage.
+
+Configuration (environment variables):
+    R_POOL_SIZE        number of sessions, 0 disables the pool (default 2)
+    R_POOL_MAX_JOBS    jobs served before a session is recycled (default 50)
+    R_POOL_MAX_RSS_MB  recycle a session whose RSS grows past this (default 1024)
+"""
+import atexit
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from functools import partial
+
+from limits import CPU_SECONDS, apply_limits, run_limited
+from streaming import tail_files
+from worker_pool import WorkerDied, WorkerPool
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'r_worker.R')
+
+# R cannot duplicate file descriptors, so the shell moves the reply pipe to
+# fd 3 and points stdout at stderr before starting the session
+WORKER_COMMAND = ['sh', '-c', 'exec 3>&1 1>&2 && exec Rscript "$0"', WORKER_SCRIPT]
+
+POOL_SIZE = int(os.environ.get('R_POOL_SIZE', 2))
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_r_pool():
+    """Return the process-wide pool, creating it on first use
+
+    Returns None when the pool is disabled or Rscript is not installed.
+    """
+    global _pool
+    size = POOL_SIZE
+    if size <= 0 or shutil.which('Rscript') is None:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = WorkerPool(
+                WORKER_COMMAND,
+                size,
+                max_jobs=int(os.environ.get('R_POOL_MAX_JOBS', 50)),
+                max_rss_mb=int(os.environ.get('R_POOL_MAX_RSS_MB', 1024)),
+                preexec_fn=partial(apply_limits, cpu=False))
+            atexit.register(_pool.shutdown)
+        return _pool
+
+
+def _read_text(path):
+    with open(path, 'r', errors='replace') as f:
+        return f.read()
+
+
+def run_r_script(script, timeout=30):
+    """Run an R script file with subprocess.run semantics
+
+    Uses a warm session when the pool is enabled and a fresh Rscript
+    otherwise. Output is streamed while the script runs (see streaming.py).
+    Returns a CompletedProcess with an extra `usage` attribute (see
+    limits.py) and raises TimeoutExpired carrying the output so far.
+    """
+    args = ['Rscript', script]
+    pool = get_r_pool()
+    if pool is None:
+        return run_limited(args, timeout)
+
+    out_fd, out_path = tempfile.mkstemp(suffix='.out')
+    err_fd, err_path = tempfile.mkstemp(suffix='.err')
+    os.close(out_fd)
+    os.close(err_fd)
+    try:
+        try:
+            with tail_files({'stdout': out_path, 'stderr': err_path}):
+                reply = pool.run('\t'.join([script, out_path, err_path, str(CPU_SECONDS)]),
+                                 timeout=timeout)
+        except WorkerDied as e:
+            result = subprocess.CompletedProcess(args, 1, _read_text(out_path), str(e))
+            result.usage = None
+            return result
+        if reply is None:
+            raise subprocess.TimeoutExpired(args, timeout, output=_read_text(out_path),
+                                            stderr=_read_text(err_path))
+        result = subprocess.CompletedProcess(args, reply['returncode'],
+                                             _read_text(out_path), _read_text(err_path))
+        result.usage = reply.get('usage')
+        return result
+    finally:
+        os.remove(out_path)
+        os.remove(err_path)
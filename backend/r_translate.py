@@ -0,0 +1,1467 @@
+"""Translation of simple R plotting scripts into Plotly figures.
+
+Many R scripts only build a few vectors or a data frame and draw them with
+base graphics (plot, hist, barplot, lines, points, abline) or a simple
+ggplot (geom_point, geom_line, geom_bar/geom_col with labs and a theme).
+This module parses that subset of R into a small AST, evaluates it with
+vectorized NumPy and emits the Plotly figure directly, so these scripts
+render without starting or dispatching to an R process. rnorm() and
+runif() reproduce R's default Mersenne-Twister generator and inversion
+method, so a script that calls set.seed() draws the same numbers as in R.
+
+Anything outside the subset raises TranslationError and the script runs in
+R as before. That includes scripts building vectors longer than
+R_TRANSLATE_MAX_ELEMENTS or computing more than R_TRANSLATE_MAX_STEPS: the
+translator runs inside the web process, so large scripts belong in the
+sandboxed R pool with its resource limits.
+
+Translations are cached by the script's AST, so edits to comments or
+whitespace are answered without evaluating it again; scripts drawing random
+numbers without set.seed() are not cached.
+
+Configuration (environment variables):
+    R_TRANSLATE                set to 0 to always run R code in R (default 1)
+    R_TRANSLATE_CACHE_ENTRIES  translated scripts kept in memory (default 256)
+    R_TRANSLATE_MAX_ELEMENTS   longest vector a translated script may build (default 1000000)
+    R_TRANSLATE_MAX_STEPS      evaluation budget of a script: one step per expression
+                               plus one per element it produces (default 20000000)
+"""
+import math
+import os
+import re
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from r_formula import BINARY_OPS, CONSTANTS, FUNCTIONS
+
+TRANSLATE_ENABLED = os.environ.get('R_TRANSLATE', '1') != '0'
+MAX_ELEMENTS = int(os.environ.get('R_TRANSLATE_MAX_ELEMENTS', 1000000))
+MAX_STEPS = int(os.environ.get('R_TRANSLATE_MAX_STEPS', 20000000))
+
+
+class TranslationError(ValueError):
+    """Raised for R code outside the translatable subset"""
+
+
+# -- Parsing -------------------------------------------------------------------
+
+TOKEN_RE = re.compile(r"""
+    (?P<space>[ \t\r\f]+|\#[^\n]*)
+  | (?P<newline>\n)
+  | (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?L?)
+  | (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+  | (?P<name>(?:[A-Za-z]|\.(?![0-9]))[A-Za-z0-9._]*)
+  | (?P<op><<-|<-|->|%[^%\s]*%|==|!=|<=|>=|&&|\|\||[-+*/^(),:$=;<>!~\[\]{}&|@?])
+""", re.VERBOSE)
+
+# Control flow and function definitions are left to R
+RESERVED_WORDS = frozenset(('if', 'else', 'for', 'while', 'repeat', 'function', 'break', 'next'))
+
+STRING_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '0': '\0'}
+
+
+def tokenize(code):
+    """Split R code into tokens; newlines inside parentheses are dropped"""
+    tokens = []
+    depth = 0
+    pos = 0
+    while pos < len(code):
+        match = TOKEN_RE.match(code, pos)
+        if not match:
+            raise TranslationError(f'Unexpected character {code[pos]!r}')
+        pos = match.end()
+        kind = match.lastgroup
+        text = match.group(kind)
+        if kind == 'space':
+            continue
+        if kind == 'newline':
+            if depth == 0:
+                tokens.append(('newline', None))
+        elif kind == 'number':
+            tokens.append(('number', float(text.rstrip('L'))))
+        elif kind == 'string':
+            tokens.append(('string', re.sub(r'\\(.)', lambda m: STRING_ESCAPES.get(m.group(1), m.group(1)),
+                                            text[1:-1])))
+        elif kind == 'name':
+            tokens.append(('name', text))
+        else:
+            if text in ('(', '['):
+                depth += 1
+            elif text in (')', ']'):
+                depth = max(depth - 1, 0)
+            tokens.append(('op', text))
+    return tokens
+
+
+class Parser:
+    """Recursive-descent parser for the supported statements and expressions
+
+    Nodes are tuples, so a parsed script is hashable:
+    ('num', value), ('str', text), ('name', name), ('paren', node),
+    ('neg', node), ('bin', op, left, right), ('dollar', node, column),
+    ('call', function, ((argument name or None, node), ...)) and
+    ('assign', name, node).
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self, offset=0):
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else (None, None)
+
+    def take(self, op=None):
+        token = self.peek()
+        if token[0] is None or (op is not None and token != ('op', op)):
+            raise TranslationError(f'Expected {op or "more input"}')
+        self.pos += 1
+        return token
+
+    def skip_newlines(self):
+        while self.peek()[0] == 'newline' or self.peek() == ('op', ';'):
+            self.pos += 1
+
+    def program(self):
+        statements = []
+        self.skip_newlines()
+        while self.peek()[0] is not None:
+            statements.append(self.statement())
+            if self.peek()[0] is not None and self.peek()[0] != 'newline' and self.peek() != ('op', ';'):
+                raise TranslationError(f'Unsupported syntax {self.peek()[1]!r}')
+            self.skip_newlines()
+        return tuple(statements)
+
+    def statement(self):
+        if self.peek()[0] == 'name' and self.peek(1) in (('op', '<-'), ('op', '=')):
+            name = self.take()[1]
+            self.take()
+            return ('assign', name, self.additive())
+        return self.additive()
+
+    def additive(self):
+        node = self.multiplicative()
+        while self.peek() in (('op', '+'), ('op', '-')):
+            op = self.take()[1]
+            node = ('bin', op, node, self.multiplicative())
+        return node
+
+    def multiplicative(self):
+        node = self.special()
+        while self.peek() in (('op', '*'), ('op', '/')):
+            op = self.take()[1]
+            node = ('bin', op, node, self.special())
+        return node
+
+    def special(self):
+        node = self.sequence()
+        while self.peek() in (('op', '%%'), ('op', '%/%')):
+            op = self.take()[1]
+            node = ('bin', op, node, self.sequence())
+        return node
+
+    def sequence(self):
+        node = self.unary()
+        while self.peek() == ('op', ':'):
+            self.take()
+            node = ('bin', ':', node, self.unary())
+        return node
+
+    def unary(self):
+        self.skip_newlines()
+        if self.peek() == ('op', '-'):
+            self.take()
+            return ('neg', self.unary())
+        if self.peek() == ('op', '+'):
+            self.take()
+            return self.unary()
+        return self.power()
+
+    def power(self):
+        node = self.postfix()
+        if self.peek() == ('op', '^'):
+            self.take()
+            # Right-associative, and binds tighter than a leading minus
+            node = ('bin', '^', node, self.unary())
+        return node
+
+    def postfix(self):
+        node = self.primary()
+        while True:
+            if self.peek() == ('op', '$'):
+                self.take()
+                kind, column = self.take()
+                if kind not in ('name', 'string'):
+                    raise TranslationError('Expected a column name after $')
+                node = ('dollar', node, column)
+            elif self.peek() == ('op', '('):
+                if node[0] != 'name':
+                    raise TranslationError('Only named functions can be called')
+                node = ('call', node[1], self.arguments())
+            else:
+                return node
+
+    def arguments(self):
+        self.take('(')
+        args = []
+        while self.peek() != ('op', ')'):
+            name = None
+            if self.peek()[0] in ('name', 'string') and self.peek(1) == ('op', '='):
+                name = self.take()[1]
+                self.take()
+            args.append((name, self.additive()))
+            if self.peek() != ('op', ')'):
+                self.take(',')
+        self.take(')')
+        return tuple(args)
+
+    def primary(self):
+        kind, value = self.take()
+        if kind == 'number':
+            return ('num', value)
+        if kind == 'string':
+            return ('str', value)
+        if kind == 'name' and value not in RESERVED_WORDS:
+            return ('name', value)
+        if (kind, value) == ('op', '('):
+            node = self.additive()
+            self.take(')')
+            return ('paren', node)
+        raise TranslationError(f'Unsupported syntax {value!r}')
+
+
+def format_number(value, digits=15):
+    """R's as.character() for a number"""
+    if math.isnan(value):
+        return 'NA'
+    if math.isinf(value):
+        return 'Inf' if value > 0 else '-Inf'
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return format(value, f'.{digits}g').replace('e+0', 'e+').replace('e-0', 'e-')
+
+
+def deparse(node):
+    """R source text of an expression, used for default axis labels"""
+    kind = node[0]
+    if kind == 'num':
+        return format_number(node[1])
+    if kind == 'str':
+        return '"' + node[1].replace('\\', '\\\\').replace('"', '\\"') + '"'
+    if kind == 'name':
+        return node[1]
+    if kind == 'paren':
+        return f'({deparse(node[1])})'
+    if kind == 'neg':
+        return f'-{deparse(node[1])}'
+    if kind == 'dollar':
+        return f'{deparse(node[1])}${node[2]}'
+    if kind == 'bin':
+        if node[1] in (':', '^'):
+            return f'{deparse(node[2])}{node[1]}{deparse(node[3])}'
+        return f'{deparse(node[2])} {node[1]} {deparse(node[3])}'
+    if kind == 'call':
+        args = ', '.join(deparse(arg) if name is None else f'{name} = {deparse(arg)}' for name, arg in node[2])
+        return f'{node[1]}({args})'
+    return ''
+
+
+def parse_r(code):
+    """Parse R code into a tuple of statement nodes; raises TranslationError"""
+    return Parser(tokenize(code)).program()
+
+
+# -- R's random number generator ----------------------------------------------
+
+def qnorm(p):
+    """Standard normal quantiles with R's qnorm (Wichura's AS241)"""
+    p = np.asarray(p, dtype=np.float64)
+    q = p - 0.5
+    result = np.empty_like(p)
+
+    central = np.abs(q) <= 0.425
+    r = 0.180625 - q[central] * q[central]
+    result[central] = q[central] * (((((((r * 2509.0809287301226727 + 33430.575583588128105) * r
+                                         + 67265.770927008700853) * r + 45921.953931549871457) * r
+                                       + 13731.693765509461125) * r + 1971.5909503065514427) * r
+                                     + 133.14166789178437745) * r + 3.387132872796366608) / \
+        (((((((r * 5226.495278852545925 + 28729.085735721942674) * r + 39307.89580009271061) * r
+             + 21213.794301586595867) * r + 5394.1960214247511077) * r + 687.1870074920579083) * r
+          + 42.313330701600911252) * r + 1.0)
+
+    tail = ~central
+    r = np.sqrt(-np.log(np.minimum(p[tail], 1 - p[tail])))
+    near = r <= 5.0
+    values = np.empty_like(r)
+    s = r[near] - 1.6
+    values[near] = (((((((s * 7.7454501427834140764e-4 + 0.0227238449892691845833) * s
+                         + 0.24178072517745061177) * s + 1.27045825245236838258) * s
+                       + 3.64784832476320460504) * s + 5.7694972214606914055) * s
+                     + 4.6303378461565452959) * s + 1.42343711074968357734) / \
+        (((((((s * 1.05075007164441684324e-9 + 5.475938084995344946e-4) * s
+             + 0.0151986665636164571966) * s + 0.14810397642748007459) * s
+           + 0.68976733498510000455) * s + 1.6763848301838038494) * s
+          + 2.05319162663775882187) * s + 1.0)
+    s = r[~near] - 5.0
+    values[~near] = (((((((s * 2.01033439929228813265e-7 + 2.71155556874348757815e-5) * s
+                          + 0.0012426609473880784386) * s + 0.026532189526576123093) * s
+                        + 0.29656057112130897318) * s + 1.7848265399172913358) * s
+                      + 5.4637849111641143699) * s + 6.6579046435011037772) / \
+        (((((((s * 2.04426310338993978564e-15 + 1.4215117583164458887e-7) * s
+             + 1.8463183175100546818e-5) * s + 7.868691311456132591e-4) * s
+           + 0.0148753612908506148525) * s + 0.13692988092273580531) * s
+          + 0.59983220655588793769) * s + 1.0)
+    result[tail] = np.where(q[tail] < 0, -values, values)
+    return result
+
+
+class RRandom:
+    """R's default generators: Mersenne-Twister uniforms, normals by inversion
+
+    R's Mersenne-Twister is the standard MT19937, so NumPy's bit generator
+    runs it once loaded with the state set.seed() would create.
+    """
+
+    # 2^27, the resolution R adds to a uniform before inverting it
+    BIG = 134217728
+    I2_32M1 = 2.328306437080797e-10
+
+    def __init__(self, seed):
+        seed = int(seed) & 0xFFFFFFFF
+        for _ in range(50):
+            seed = (69069 * seed + 1) & 0xFFFFFFFF
+        state = []
+        for _ in range(625):
+            seed = (69069 * seed + 1) & 0xFFFFFFFF
+            state.append(seed)
+        # The first word is the generator's position, reset to 624 by R
+        self.bits = np.random.MT19937(0)
+        self.bits.state = {'bit_generator': 'MT19937',
+                           'state': {'key': np.array(state[1:], dtype=np.uint32), 'pos': 624}}
+
+    def uniform(self, n):
+        u = self.bits.random_raw(n).astype(np.float64) * 2.3283064365386963e-10
+        u[u <= 0.0] = 0.5 * self.I2_32M1
+        u[1.0 - u <= 0.0] = 1.0 - 0.5 * self.I2_32M1
+        return u
+
+    def normal(self, n):
+        u = self.uniform(2 * n)
+        return qnorm((np.floor(self.BIG * u[0::2]) + u[1::2]) / self.BIG)
+
+
+# -- Colours -------------------------------------------------------------------
+
+# R's default palette(), used for numeric colours
+R_PALETTE = ('black', '#DF536B', '#61D04F', '#2297E6', '#28E2E5', '#CD0BBC', '#F5C710', '#9E9E9E')
+
+# R colour names that differ from the CSS names Plotly understands
+R_COLORS = {'gray': '#BEBEBE', 'grey': '#BEBEBE', 'lightgray': '#D3D3D3', 'lightgrey': '#D3D3D3',
+            'darkgray': '#A9A9A9', 'darkgrey': '#A9A9A9', 'green': '#00FF00', 'purple': '#A020F0',
+            'maroon': '#B03060', 'transparent': 'rgba(0,0,0,0)'}
+
+CSS_COLORS = frozenset("""
+    aliceblue antiquewhite aqua aquamarine azure beige bisque black blanchedalmond blue blueviolet
+    brown burlywood cadetblue chartreuse chocolate coral cornflowerblue cornsilk crimson cyan
+    darkblue darkcyan darkgoldenrod darkgreen darkkhaki darkmagenta darkolivegreen darkorange
+    darkorchid darkred darksalmon darkseagreen darkslateblue darkslategray darkslategrey
+    darkturquoise darkviolet deeppink deepskyblue dimgray dimgrey dodgerblue firebrick floralwhite
+    forestgreen fuchsia gainsboro ghostwhite gold goldenrod greenyellow honeydew hotpink indianred
+    indigo ivory khaki lavender lavenderblush lawngreen lemonchiffon lightblue lightcoral lightcyan
+    lightgoldenrodyellow lightgreen lightpink lightsalmon lightseagreen lightskyblue lightslategray
+    lightslategrey lightsteelblue lightyellow lime limegreen linen magenta mediumaquamarine
+    mediumblue mediumorchid mediumpurple mediumseagreen mediumslateblue mediumspringgreen
+    mediumturquoise mediumvioletred midnightblue mintcream mistyrose moccasin navajowhite navy
+    oldlace olive olivedrab orange orangered orchid palegoldenrod palegreen paleturquoise
+    palevioletred papayawhip peachpuff peru pink plum powderblue red rosybrown royalblue
+    saddlebrown salmon sandybrown seagreen seashell sienna silver skyblue slateblue slategray
+    slategrey snow springgreen steelblue tan teal thistle tomato turquoise violet wheat white
+    whitesmoke yellow yellowgreen""".split())
+
+
+def r_color(value):
+    """Plotly colour for an R colour name, hex string or palette index"""
+    if isinstance(value, (float, int, np.floating, np.integer)):
+        if value != int(value) or value < 0:
+            raise TranslationError(f'Unsupported colour {value!r}')
+        return 'white' if value == 0 else R_PALETTE[(int(value) - 1) % len(R_PALETTE)]
+    name = str(value).lower()
+    if re.fullmatch(r'#[0-9a-f]{6}([0-9a-f]{2})?', name):
+        return name
+    gray = re.fullmatch(r'gr[ae]y(\d{1,3})', name)
+    if gray and int(gray.group(1)) <= 100:
+        level = round(int(gray.group(1)) * 255 / 100)
+        return f'#{level:02X}{level:02X}{level:02X}'
+    if name in R_COLORS:
+        return R_COLORS[name]
+    if name in CSS_COLORS:
+        return name
+    raise TranslationError(f'Unsupported colour {value!r}')
+
+
+def hcl_color(h, c, l):
+    """R's hcl(): a colour from polar CIE-LUV coordinates"""
+    white_u, white_v = 0.1978398, 0.4683363
+    h = math.radians(h)
+    u, v = c * math.cos(h), c * math.sin(h)
+    y = (((l + 16) / 116) ** 3 if l > 7.999592 else l / 903.3)
+    if l <= 0:
+        x = z = 0.0
+    else:
+        u = u / (13 * l) + white_u
+        v = v / (13 * l) + white_v
+        x = 9.0 * y * u / (4 * v)
+        z = -x / 3 - 5 * y + 3 * y / v
+
+    def gamma(t):
+        t = 1.055 * t ** (1 / 2.4) - 0.055 if t > 0.00304 else 12.92 * t
+        return min(max(int(255 * t + 0.5), 0), 255)
+
+    rgb = (gamma(3.240479 * x - 1.537150 * y - 0.498535 * z),
+           gamma(-0.969256 * x + 1.875992 * y + 0.041556 * z),
+           gamma(0.055648 * x - 0.204043 * y + 1.057311 * z))
+    return '#{:02X}{:02X}{:02X}'.format(*rgb)
+
+
+def hue_palette(n):
+    """ggplot2's default discrete colours (scales::hue_pal)"""
+    if n == 1:
+        return [hcl_color(15, 100, 65)]
+    return [hcl_color(h % 360, 100, 65) for h in np.linspace(15, 375 - 360 / n, n)]
+
+
+# ggplot2's default continuous colour scale
+GRADIENT = [[0, '#132B43'], [1, '#56B1F7']]
+
+
+# -- Values --------------------------------------------------------------------
+
+class Frame(OrderedDict):
+    """A data.frame: named columns of equal length"""
+
+    def nrow(self):
+        return len(next(iter(self.values()))) if self else 0
+
+
+class Aes(dict):
+    """Unevaluated ggplot2 aesthetic mappings, name -> expression node"""
+
+
+class Layer:
+    def __init__(self, geom, mapping, params):
+        self.geom = geom
+        self.mapping = mapping
+        self.params = params
+
+
+class GGPlot:
+    """A ggplot object; adding a component returns a new plot"""
+
+    def __init__(self, data, mapping, layers=(), labels=None, theme='grey'):
+        self.data = data
+        self.mapping = mapping
+        self.layers = tuple(layers)
+        self.labels = dict(labels or {})
+        self.theme = theme
+
+    def add(self, component):
+        if isinstance(component, Layer):
+            return GGPlot(self.data, self.mapping, self.layers + (component,), self.labels, self.theme)
+        if isinstance(component, Labels):
+            return GGPlot(self.data, self.mapping, self.layers, dict(self.labels, **component), self.theme)
+        if isinstance(component, Theme):
+            return GGPlot(self.data, self.mapping, self.layers, self.labels, component.name)
+        raise TranslationError('Unsupported ggplot component')
+
+
+class Labels(dict):
+    pass
+
+
+class Theme:
+    def __init__(self, name):
+        self.name = name
+
+
+# Marker symbols of R's pch values
+PCH_SYMBOLS = {0: 'square-open', 1: 'circle-open', 2: 'triangle-up-open', 3: 'cross-thin-open',
+               4: 'x-thin-open', 5: 'diamond-open', 15: 'square', 16: 'circle', 17: 'triangle-up',
+               18: 'diamond', 19: 'circle', 20: 'circle'}
+
+PLOT_MODES = {'p': 'markers', 'l': 'lines', 'b': 'lines+markers', 'o': 'lines+markers'}
+
+LINE_DASHES = {'solid': 'solid', 'dashed': 'dash', 'dotted': 'dot', 'dotdash': 'dashdot',
+               'longdash': 'longdash', 1: 'solid', 2: 'dash', 3: 'dot', 4: 'dashdot', 5: 'longdash'}
+
+def as_character(values):
+    if values.dtype == object:
+        return values
+    return np.array([format_number(float(v)) for v in values], dtype=object)
+
+
+def recycle(values, n):
+    if len(values) == n:
+        return values
+    if len(values) == 0:
+        raise TranslationError('Cannot recycle a zero-length vector')
+    return np.resize(values, n)
+
+
+def levels(values):
+    """Sorted distinct values, numerically when they all look like numbers"""
+    distinct = list(dict.fromkeys(values.tolist()))
+    try:
+        return sorted(distinct, key=float)
+    except (TypeError, ValueError):
+        return sorted(distinct)
+
+
+def pretty(low, high, n=5, min_n=1, shrink=0.75, high_bias=1.5, u5_bias=2.75):
+    """R's pretty(): about n+1 equally spaced round values covering [low, high]"""
+    dx = high - low
+    if dx == 0 and high == 0:
+        cell, small = 1.0, True
+    else:
+        cell = max(abs(low), abs(high))
+        u = 1 + (1 / (1 + high_bias) if u5_bias >= 1.5 * high_bias + 0.5 else 1.5 / (1 + u5_bias))
+        u *= max(1, n) * np.finfo(float).eps
+        small = dx < cell * u * 3
+    if small:
+        if cell > 10:
+            cell = 9 + cell / 10
+        cell *= shrink
+        if min_n > 1:
+            cell /= min_n
+    else:
+        cell = dx
+        if n > 1:
+            cell /= n
+    base = 10.0 ** math.floor(math.log10(cell))
+    unit = base
+    if 2 * base - cell < high_bias * (cell - unit):
+        unit = 2 * base
+        if 5 * base - cell < u5_bias * (cell - unit):
+            unit = 5 * base
+            if 10 * base - cell < high_bias * (cell - unit):
+                unit = 10 * base
+    ns = math.floor(low / unit + 1e-10)
+    nu = math.ceil(high / unit - 1e-10)
+    while ns * unit > low + 1e-10 * unit:
+        ns -= 1
+    while nu * unit < high - 1e-10 * unit:
+        nu += 1
+    k = int(0.5 + nu - ns)
+    if k < min_n:
+        k = min_n - k
+        if ns >= 0:
+            nu += k // 2
+            ns -= k // 2 + k % 2
+        else:
+            ns -= k // 2
+            nu += k // 2 + k % 2
+    return np.arange(ns, nu + 1) * unit
+
+
+# -- Evaluation ----------------------------------------------------------------
+
+class Interpreter:
+    """Evaluates a parsed script, recording the figure it draws"""
+
+    def __init__(self):
+        self.env = {}
+        self.rng = None
+        self.deterministic = True
+        self.figure = None
+        self.shown = None
+        self.output = []
+        self.steps = 0
+
+    def run(self, program):
+        with np.errstate(all='ignore'):
+            for node in program:
+                if node[0] == 'assign':
+                    self.env[node[1]] = self.eval(node[2])
+                    continue
+                value = self.eval(node)
+                if isinstance(value, GGPlot):
+                    self.shown = value
+                elif value is not None:
+                    raise TranslationError('Printing values is not supported')
+            shown = self.shown
+            if shown is None and isinstance(self.env.get('p'), GGPlot):
+                shown = self.env['p']
+            if shown is None:
+                raise TranslationError('The script does not draw a supported plot')
+            return ggplot_figure(self, shown) if isinstance(shown, GGPlot) else shown
+
+    # Expressions
+
+    def length(self, n, argument=None):
+        """A vector length about to be allocated, checked against MAX_ELEMENTS
+
+        `argument` names the script's argument the length came from; R stops
+        with an error when such a length is NA or negative.
+        """
+        if argument is not None and (math.isnan(n) or n < 0):
+            raise TranslationError(f'Invalid {argument!r} argument')
+        if not math.isfinite(n) or n > MAX_ELEMENTS:
+            raise TranslationError(f'Vectors longer than {MAX_ELEMENTS} elements are left to R')
+        return max(int(n), 0)
+
+    def eval(self, node, columns=None):
+        value = self.evaluate(node, columns)
+        self.steps += 1 + (value.size if isinstance(value, np.ndarray) else 0)
+        if self.steps > MAX_STEPS:
+            raise TranslationError('The script exceeds the translation step budget')
+        return value
+
+    def evaluate(self, node, columns=None):
+        kind = node[0]
+        if kind == 'num':
+            return np.array([node[1]])
+        if kind == 'str':
+            return np.array([node[1]], dtype=object)
+        if kind == 'name':
+            name = node[1]
+            if columns is not None and name in columns:
+                return columns[name]
+            if name in self.env:
+                return self.env[name]
+            if name in ('TRUE', 'T'):
+                return np.array([True])
+            if name in ('FALSE', 'F'):
+                return np.array([False])
+            if name in CONSTANTS:
+                return np.array([CONSTANTS[name]])
+            if name in ('letters', 'LETTERS'):
+                start = ord('a') if name == 'letters' else ord('A')
+                return np.array([chr(start + i) for i in range(26)], dtype=object)
+            if name == 'NULL':
+                return None
+            raise TranslationError(f'Unknown variable {name!r}')
+        if kind == 'paren':
+            return self.eval(node[1], columns)
+        if kind == 'neg':
+            return np.negative(self.numeric(self.eval(node[1], columns)))
+        if kind == 'dollar':
+            frame = self.eval(node[1], columns)
+            if not isinstance(frame, Frame) or node[2] not in frame:
+                raise TranslationError(f'Unknown column {node[2]!r}')
+            return frame[node[2]]
+        if kind == 'bin':
+            return self.binary(node[1], self.eval(node[2], columns), self.eval(node[3], columns))
+        if kind == 'call':
+            handler = CALLS.get(node[1])
+            if handler is not None:
+                return handler(self, node[2], columns)
+            if node[1] in FUNCTIONS:
+                return self.math(node[1], node[2], columns)
+            raise TranslationError(f'Unsupported function {node[1]!r}')
+        raise TranslationError(f'Unsupported expression {kind!r}')
+
+    def binary(self, op, left, right):
+        if isinstance(left, GGPlot) and op == '+':
+            return left.add(right)
+        left, right = self.numeric(left), self.numeric(right)
+        if op == ':':
+            start, end = self.scalar(left), self.scalar(right)
+            step = 1.0 if end >= start else -1.0
+            return start + step * np.arange(self.length(math.floor(abs(end - start) + 1e-10) + 1))
+        if op not in BINARY_OPS:
+            raise TranslationError(f'Unsupported operator {op!r}')
+        n = max(len(left), len(right)) if len(left) and len(right) else 0
+        return BINARY_OPS[op](recycle(left, n), recycle(right, n)) if n else np.array([])
+
+    def math(self, name, args, columns):
+        function, arities = FUNCTIONS[name]
+        values = [self.numeric(self.eval(node, columns)) for _, node in args]
+        if len(values) not in arities or any(arg_name not in (None, 'base', 'x') for arg_name, _ in args):
+            raise TranslationError(f'Unsupported call to {name}()')
+        if len(values) == 2 and name == 'log':
+            return function(values[0], self.scalar(values[1]))
+        return np.asarray(function(*values), dtype=np.float64)
+
+    def numeric(self, value):
+        if isinstance(value, np.ndarray) and value.dtype != object:
+            return value.astype(np.float64)
+        raise TranslationError('Expected a numeric vector')
+
+    def scalar(self, value):
+        value = self.numeric(value)
+        if len(value) == 0:
+            raise TranslationError('Expected a number')
+        return float(value[0])
+
+    def string(self, value):
+        if not isinstance(value, np.ndarray) or len(value) != 1:
+            raise TranslationError('Expected a string')
+        return str(value[0]) if value.dtype == object else format_number(float(value[0]))
+
+    def vector(self, value):
+        if not isinstance(value, np.ndarray):
+            raise TranslationError('Expected a vector')
+        return value
+
+    def flag(self, value):
+        return bool(self.vector(value)[0])
+
+    def bind(self, function, args, formals, aliases=None, columns=None, lazy=()):
+        """Match call arguments to formals like R: by name, then by position
+
+        Arguments named in `lazy` are returned unevaluated, as nodes.
+        """
+        aliases = aliases or {}
+        bound = {}
+        positional = []
+        for name, node in args:
+            if name is None:
+                positional.append(node)
+                continue
+            name = aliases.get(name, name)
+            if name not in formals or name in bound:
+                raise TranslationError(f'Unsupported argument {name!r} to {function}()')
+            bound[name] = node
+        remaining = [formal for formal in formals if formal not in bound]
+        if len(positional) > len(remaining):
+            raise TranslationError(f'Too many arguments to {function}()')
+        bound.update(zip(remaining, positional))
+        return {name: node if name in lazy else self.eval(node, columns) for name, node in bound.items()}
+
+    def random(self):
+        if self.rng is None:
+            self.rng = RRandom(np.random.randint(0, 2 ** 31))
+            self.deterministic = False
+        return self.rng
+
+    def base_figure(self):
+        if self.figure is None:
+            raise TranslationError('plot.new has not been called yet')
+        return self.figure
+
+
+def _count(interpreter, args, columns, function):
+    values = interpreter.bind(function, args, ('n',), columns=columns)
+    n = interpreter.vector(values['n'])
+    return interpreter.length(interpreter.scalar(n)) if len(n) == 1 else len(n)
+
+
+def call_c(interpreter, args, columns):
+    values = []
+    for name, node in args:
+        if name is not None:
+            raise TranslationError('Named vectors are not supported')
+        value = interpreter.eval(node, columns)
+        if value is not None:
+            values.append(interpreter.vector(value))
+    if not values:
+        return None
+    interpreter.length(sum(len(value) for value in values))
+    if any(value.dtype == object for value in values):
+        return np.concatenate([as_character(value) for value in values])
+    if all(value.dtype == bool for value in values):
+        return np.concatenate(values)
+    return np.concatenate([value.astype(np.float64) for value in values])
+
+
+def call_seq(interpreter, args, columns):
+    bound = interpreter.bind('seq', args, ('from', 'to', 'by', 'length.out'),
+                             aliases={'length': 'length.out', 'len': 'length.out'}, columns=columns)
+    scalar = {name: interpreter.scalar(value) for name, value in bound.items()}
+    if set(bound) == {'from'}:
+        start = bound['from']
+        if len(start) > 1:
+            return np.arange(1.0, len(start) + 1)
+        return np.arange(1.0, interpreter.length(math.floor(scalar['from'])) + 1)
+    if 'length.out' in scalar:
+        interpreter.length(scalar['length.out'], 'length.out')
+        n = interpreter.length(math.ceil(scalar['length.out']))
+        if 'by' not in scalar:
+            if 'from' in scalar and 'to' in scalar:
+                return np.linspace(scalar['from'], scalar['to'], n)
+            scalar['by'] = 1.0
+        if 'from' in scalar:
+            return scalar['from'] + np.arange(n) * scalar['by']
+        return scalar.get('to', 1.0) - np.arange(n - 1, -1, -1) * scalar['by']
+    start, end = scalar.get('from', 1.0), scalar.get('to', 1.0)
+    by = scalar.get('by', 1.0 if end >= start else -1.0)
+    if by == 0 or (end - start) / by < 0:
+        raise TranslationError('Wrong sign in by argument')
+    return start + np.arange(interpreter.length(math.floor((end - start) / by + 1e-10) + 1)) * by
+
+
+def call_seq_len(interpreter, args, columns):
+    bound = interpreter.bind('seq_len', args, ('length.out',), columns=columns)
+    return np.arange(1, interpreter.length(interpreter.scalar(bound['length.out']), 'length.out') + 1)
+
+
+def call_rep(interpreter, args, columns):
+    bound = interpreter.bind('rep', args, ('x', 'times', 'each', 'length.out'), columns=columns)
+    values = interpreter.vector(bound['x'])
+    if 'each' in bound:
+        each = interpreter.length(interpreter.scalar(bound['each']), 'each')
+        interpreter.length(len(values) * each)
+        values = np.repeat(values, int(each))
+    if 'times' in bound:
+        times = interpreter.numeric(bound['times'])
+        if np.any(np.isnan(times) | (times < 0)):
+            raise TranslationError("Invalid 'times' argument")
+        if len(times) == 1:
+            interpreter.length(len(values) * times[0])
+            values = np.tile(values, int(times[0]))
+        else:
+            interpreter.length(times.sum())
+            values = np.repeat(values, times.astype(int))
+    if 'length.out' in bound:
+        values = np.resize(values, interpreter.length(interpreter.scalar(bound['length.out']), 'length.out'))
+    return values
+
+
+def call_rnorm(interpreter, args, columns):
+    n = _count(interpreter, args[:1], columns, 'rnorm')
+    bound = interpreter.bind('rnorm', args[1:], ('mean', 'sd'), columns=columns)
+    values = interpreter.random().normal(n)
+    mean = recycle(interpreter.numeric(bound.get('mean', np.array([0.0]))), n)
+    sd = recycle(interpreter.numeric(bound.get('sd', np.array([1.0]))), n)
+    return mean + sd * values
+
+
+def call_runif(interpreter, args, columns):
+    n = _count(interpreter, args[:1], columns, 'runif')
+    bound = interpreter.bind('runif', args[1:], ('min', 'max'), columns=columns)
+    values = interpreter.random().uniform(n)
+    low = recycle(interpreter.numeric(bound.get('min', np.array([0.0]))), n)
+    high = recycle(interpreter.numeric(bound.get('max', np.array([1.0]))), n)
+    return low + (high - low) * values
+
+
+def call_set_seed(interpreter, args, columns):
+    bound = interpreter.bind('set.seed', args, ('seed',), columns=columns)
+    interpreter.rng = RRandom(interpreter.scalar(bound['seed']))
+    return None
+
+
+def _reduction(function, reduce):
+    def call(interpreter, args, columns):
+        na_rm = False
+        values = []
+        for name, node in args:
+            if name == 'na.rm':
+                na_rm = interpreter.flag(interpreter.eval(node, columns))
+            elif name is None:
+                values.append(interpreter.numeric(interpreter.eval(node, columns)))
+            else:
+                raise TranslationError(f'Unsupported argument {name!r} to {function}()')
+        if not values:
+            raise TranslationError(f'{function}() needs an argument')
+        values = np.concatenate(values)
+        if na_rm:
+            values = values[~np.isnan(values)]
+        return np.array([reduce(values)], dtype=np.float64)
+    return call
+
+
+def _transform(function, transform):
+    def call(interpreter, args, columns):
+        bound = interpreter.bind(function, args, ('x',), columns=columns)
+        return transform(interpreter.numeric(bound['x']))
+    return call
+
+
+def call_length(interpreter, args, columns):
+    bound = interpreter.bind('length', args, ('x',), columns=columns)
+    value = bound['x']
+    if isinstance(value, Frame):
+        return np.array([float(len(value))])
+    return np.array([float(len(interpreter.vector(value)))])
+
+
+def call_round(interpreter, args, columns):
+    bound = interpreter.bind('round', args, ('x', 'digits'), columns=columns)
+    digits = int(interpreter.scalar(bound['digits'])) if 'digits' in bound else 0
+    return np.round(interpreter.numeric(bound['x']), digits)
+
+
+def call_factor(interpreter, args, columns):
+    bound = interpreter.bind('factor', args, ('x',), columns=columns)
+    return as_character(interpreter.vector(bound['x']))
+
+
+def call_data_frame(interpreter, args, columns):
+    frame = Frame()
+    for name, node in args:
+        if name == 'stringsAsFactors':
+            continue
+        if name is None:
+            if node[0] != 'name':
+                raise TranslationError('data.frame() columns need names')
+            name = node[1]
+        frame[name] = interpreter.vector(interpreter.eval(node, columns))
+    if not frame:
+        return frame
+    n = max(len(values) for values in frame.values())
+    for name, values in frame.items():
+        if len(values) == 0 or n % len(values):
+            raise TranslationError('data.frame() columns have different lengths')
+        frame[name] = recycle(values, n)
+    return frame
+
+
+def call_nrow(interpreter, args, columns):
+    bound = interpreter.bind('nrow', args, ('x',), columns=columns)
+    if not isinstance(bound['x'], Frame):
+        raise TranslationError('nrow() of something other than a data frame')
+    return np.array([float(bound['x'].nrow())])
+
+
+def call_library(interpreter, args, columns):
+    if len(args) != 1 or args[0][1][0] not in ('name', 'str') or args[0][1][1] != 'ggplot2':
+        raise TranslationError('Only library(ggplot2) is supported')
+    return None
+
+
+def call_print(interpreter, args, columns):
+    bound = interpreter.bind('print', args, ('x',), columns=columns)
+    if not isinstance(bound['x'], GGPlot):
+        raise TranslationError('Printing values is not supported')
+    interpreter.shown = bound['x']
+    return None
+
+
+def call_cat(interpreter, args, columns):
+    sep = ' '
+    parts = []
+    for name, node in args:
+        value = interpreter.eval(node, columns)
+        if name == 'sep':
+            sep = interpreter.string(value)
+        elif name is not None:
+            raise TranslationError(f'Unsupported argument {name!r} to cat()')
+        elif value is not None:
+            value = interpreter.vector(value)
+            parts.extend(str(v) if value.dtype == object else format_number(float(v), 7) for v in value)
+    interpreter.output.append(sep.join(parts))
+    return None
+
+
+# -- Base graphics --------------------------------------------------------------
+
+def base_axis(title, limits):
+    axis = {'title': {'text': title}, 'showline': True, 'mirror': True, 'linecolor': 'black',
+            'ticks': 'outside', 'showgrid': False, 'zeroline': False}
+    if limits is not None:
+        axis['range'] = [float(v) for v in limits[:2]]
+    return axis
+
+
+def base_layout(interpreter, bound, xlab, ylab):
+    layout = {'xaxis': base_axis(interpreter.string(bound['xlab']) if 'xlab' in bound else xlab,
+                                 bound.get('xlim')),
+              'yaxis': base_axis(interpreter.string(bound['ylab']) if 'ylab' in bound else ylab,
+                                 bound.get('ylim')),
+              'plot_bgcolor': 'white', 'showlegend': False}
+    if bound.get('main') is not None:
+        layout['title'] = {'text': interpreter.string(bound['main'])}
+    return layout
+
+
+def base_colors(interpreter, value, n=None):
+    """A colour, or one per point when a vector of colours is given for n points"""
+    values = interpreter.vector(value)
+    colors = [r_color(v) for v in values.tolist()]
+    if len(colors) == 1 or n is None:
+        return colors[0]
+    return [colors[i % len(colors)] for i in range(n)]
+
+
+def base_xy(interpreter, bound, nodes):
+    """x and y of a base plot call and their default labels"""
+    x = interpreter.numeric(bound['x'])
+    if bound.get('y') is None:
+        return np.arange(1.0, len(x) + 1), x, 'Index', deparse(nodes['x'])
+    y = interpreter.numeric(bound['y'])
+    if len(x) != len(y):
+        raise TranslationError("'x' and 'y' lengths differ")
+    return x, y, deparse(nodes['x']), deparse(nodes['y'])
+
+
+def base_trace(interpreter, bound, x, y, plot_type, color='black'):
+    if plot_type not in PLOT_MODES:
+        raise TranslationError(f'Unsupported plot type {plot_type!r}')
+    trace = {'type': 'scatter', 'x': x, 'y': y, 'mode': PLOT_MODES[plot_type]}
+    if 'markers' in trace['mode']:
+        pch = int(interpreter.scalar(bound['pch'])) if 'pch' in bound else 1
+        if pch not in PCH_SYMBOLS:
+            raise TranslationError(f'Unsupported pch {pch}')
+        size = 6 * (interpreter.scalar(bound['cex']) if 'cex' in bound else 1)
+        trace['marker'] = {'color': base_colors(interpreter, bound['col'], len(x)) if 'col' in bound else color,
+                           'symbol': PCH_SYMBOLS[pch], 'size': size * (0.7 if pch == 20 else 1)}
+    if 'lines' in trace['mode']:
+        trace['line'] = {'color': base_colors(interpreter, bound['col']) if 'col' in bound else color,
+                         'width': 1.5 * (interpreter.scalar(bound['lwd']) if 'lwd' in bound else 1),
+                         'dash': line_dash(interpreter, bound.get('lty'))}
+    return trace
+
+
+def line_dash(interpreter, value):
+    if value is None:
+        return 'solid'
+    value = interpreter.vector(value)[0]
+    key = value if isinstance(value, str) else int(value)
+    if key not in LINE_DASHES:
+        raise TranslationError(f'Unsupported lty {value!r}')
+    return LINE_DASHES[key]
+
+
+PLOT_FORMALS = ('x', 'y', 'type', 'main', 'xlab', 'ylab', 'col', 'pch', 'cex', 'lwd', 'lty', 'xlim', 'ylim',
+                'las', 'bty')
+
+
+def call_plot(interpreter, args, columns):
+    nodes = interpreter.bind('plot', args, PLOT_FORMALS, lazy=PLOT_FORMALS)
+    bound = {name: interpreter.eval(node, columns) for name, node in nodes.items()}
+    x, y, xlab, ylab = base_xy(interpreter, bound, nodes)
+    plot_type = interpreter.string(bound['type']) if 'type' in bound else 'p'
+    data = [] if plot_type == 'n' else [base_trace(interpreter, bound, x, y, plot_type)]
+    interpreter.figure = interpreter.shown = {'data': data,
+                                              'layout': base_layout(interpreter, bound, xlab, ylab)}
+    return None
+
+
+def _add_points(function, default_type):
+    formals = ('x', 'y', 'type', 'col', 'pch', 'cex', 'lwd', 'lty')
+
+    def call(interpreter, args, columns):
+        figure = interpreter.base_figure()
+        nodes = interpreter.bind(function, args, formals, lazy=formals)
+        bound = {name: interpreter.eval(node, columns) for name, node in nodes.items()}
+        x, y, _, _ = base_xy(interpreter, bound, nodes)
+        plot_type = interpreter.string(bound['type']) if 'type' in bound else default_type
+        figure['data'].append(base_trace(interpreter, bound, x, y, plot_type))
+        return None
+    return call
+
+
+def call_abline(interpreter, args, columns):
+    figure = interpreter.base_figure()
+    bound = interpreter.bind('abline', args, ('h', 'v', 'col', 'lwd', 'lty'), columns=columns)
+    if 'h' not in bound and 'v' not in bound:
+        raise TranslationError('Only abline(h = , v = ) is supported')
+    line = {'color': base_colors(interpreter, bound['col']) if 'col' in bound else 'black',
+            'width': 1.5 * (interpreter.scalar(bound['lwd']) if 'lwd' in bound else 1),
+            'dash': line_dash(interpreter, bound.get('lty'))}
+    shapes = figure['layout'].setdefault('shapes', [])
+    for value in interpreter.numeric(bound['h']) if 'h' in bound else []:
+        shapes.append({'type': 'line', 'xref': 'paper', 'x0': 0, 'x1': 1, 'yref': 'y',
+                       'y0': float(value), 'y1': float(value), 'line': line})
+    for value in interpreter.numeric(bound['v']) if 'v' in bound else []:
+        shapes.append({'type': 'line', 'yref': 'paper', 'y0': 0, 'y1': 1, 'xref': 'x',
+                       'x0': float(value), 'x1': float(value), 'line': line})
+    return None
+
+
+HIST_FORMALS = ('x', 'breaks', 'freq', 'col', 'border', 'main', 'xlab', 'ylab', 'xlim', 'ylim', 'las')
+
+
+def call_hist(interpreter, args, columns):
+    nodes = interpreter.bind('hist', args, HIST_FORMALS, lazy=HIST_FORMALS)
+    bound = {name: interpreter.eval(node, columns) for name, node in nodes.items()}
+    x = interpreter.numeric(bound['x'])
+    x = x[np.isfinite(x)]
+    if len(x) == 0:
+        raise TranslationError('hist() needs finite values')
+    breaks = bound.get('breaks', np.array(['Sturges'], dtype=object))
+    if breaks.dtype == object:
+        if interpreter.string(breaks).lower() != 'sturges':
+            raise TranslationError('Only the Sturges breaks algorithm is supported')
+        breaks = pretty(x.min(), x.max(), math.ceil(math.log2(len(x)) + 1))
+    elif len(breaks) == 1:
+        breaks = pretty(x.min(), x.max(), interpreter.length(interpreter.scalar(breaks)))
+    elif x.min() < breaks[0] or x.max() > breaks[-1]:
+        raise TranslationError("Some 'x' are not counted; the breaks do not span the data")
+    breaks = np.asarray(breaks, dtype=np.float64)
+
+    # Intervals are closed on the right, and the first one on both sides
+    index = np.maximum(np.searchsorted(breaks, x, side='left'), 1)
+    counts = np.bincount(index - 1, minlength=len(breaks) - 1).astype(np.float64)
+    widths = np.diff(breaks)
+    equidistant = np.allclose(widths, widths[0])
+    freq = interpreter.flag(bound['freq']) if 'freq' in bound else equidistant
+    heights = counts if freq else counts / (len(x) * widths)
+
+    xname = deparse(nodes['x'])
+    if 'main' not in bound:
+        bound['main'] = np.array([f'Histogram of {xname}'], dtype=object)
+    layout = base_layout(interpreter, bound, xname, 'Frequency' if freq else 'Density')
+    layout['bargap'] = 0
+    trace = {'type': 'bar', 'x': (breaks[:-1] + breaks[1:]) / 2, 'y': heights, 'width': widths,
+             'marker': {'color': base_colors(interpreter, bound['col']) if 'col' in bound else 'lightgray',
+                        'line': {'color': base_colors(interpreter, bound['border'])
+                                 if 'border' in bound else 'black', 'width': 1}}}
+    interpreter.figure = interpreter.shown = {'data': [trace], 'layout': layout}
+    return None
+
+
+BARPLOT_FORMALS = ('height', 'names.arg', 'col', 'border', 'main', 'xlab', 'ylab', 'horiz', 'xlim',
+                   'ylim', 'las')
+
+
+def call_barplot(interpreter, args, columns):
+    bound = interpreter.bind('barplot', args, BARPLOT_FORMALS, columns=columns)
+    heights = interpreter.numeric(bound['height'])
+    names = bound.get('names.arg')
+    labels = as_character(interpreter.vector(names)).tolist() if names is not None else \
+        [str(i) for i in range(1, len(heights) + 1)]
+    if len(labels) != len(heights):
+        raise TranslationError('Incorrect number of names')
+    horizontal = interpreter.flag(bound['horiz']) if 'horiz' in bound else False
+    layout = base_layout(interpreter, bound, '', '')
+    category_axis = layout['yaxis' if horizontal else 'xaxis']
+    category_axis.update({'showline': False, 'mirror': False, 'ticks': '', 'type': 'category',
+                          'showticklabels': names is not None})
+    layout['yaxis' if not horizontal else 'xaxis']['mirror'] = False
+    layout['bargap'] = 0.2
+    trace = {'type': 'bar', 'x': heights, 'y': labels, 'orientation': 'h'} if horizontal else \
+        {'type': 'bar', 'x': labels, 'y': heights}
+    trace['marker'] = {'color': base_colors(interpreter, bound['col'], len(heights)) if 'col' in bound
+                       else '#BEBEBE',
+                       'line': {'color': base_colors(interpreter, bound['border'])
+                                if 'border' in bound else 'black', 'width': 1}}
+    interpreter.figure = interpreter.shown = {'data': [trace], 'layout': layout}
+    return None
+
+
+# -- ggplot2 -------------------------------------------------------------------
+
+AESTHETICS = ('x', 'y', 'colour', 'fill', 'group')
+AES_ALIASES = {'color': 'colour'}
+
+
+def call_aes(interpreter, args, columns):
+    mapping = Aes()
+    positional = ['x', 'y']
+    for name, node in args:
+        name = AES_ALIASES.get(name, name) if name is not None else (positional.pop(0) if positional else None)
+        if name not in AESTHETICS or name in mapping:
+            raise TranslationError(f'Unsupported aesthetic {name!r}')
+        mapping[name] = node
+    return mapping
+
+
+def call_ggplot(interpreter, args, columns):
+    bound = interpreter.bind('ggplot', args, ('data', 'mapping'), columns=columns)
+    data = bound.get('data')
+    if data is not None and not isinstance(data, Frame):
+        raise TranslationError('ggplot() data must be a data frame')
+    mapping = bound.get('mapping', Aes())
+    if not isinstance(mapping, Aes):
+        raise TranslationError('ggplot() mapping must be aes()')
+    return GGPlot(data, mapping)
+
+
+GEOM_PARAMS = {
+    'geom_point': ('mapping', 'data', 'colour', 'fill', 'size', 'alpha', 'shape'),
+    'geom_line': ('mapping', 'data', 'colour', 'size', 'linewidth', 'alpha', 'linetype'),
+    'geom_bar': ('mapping', 'data', 'stat', 'colour', 'fill', 'width', 'alpha'),
+    'geom_col': ('mapping', 'data', 'colour', 'fill', 'width', 'alpha'),
+}
+
+
+def _geom(geom):
+    def call(interpreter, args, columns):
+        params = interpreter.bind(geom, args, GEOM_PARAMS[geom], aliases=AES_ALIASES, columns=columns)
+        mapping = params.pop('mapping', Aes())
+        if not isinstance(mapping, Aes) or ('data' in params and not isinstance(params['data'], Frame)):
+            raise TranslationError(f'Unsupported arguments to {geom}()')
+        if geom == 'geom_col':
+            geom_name, params['stat'] = 'geom_bar', np.array(['identity'], dtype=object)
+        else:
+            geom_name = geom
+        return Layer(geom_name, mapping, params)
+    return call
+
+
+def call_labs(interpreter, args, columns):
+    labels = Labels()
+    for name, node in args:
+        name = AES_ALIASES.get(name, name)
+        if name not in ('title', 'subtitle', 'x', 'y', 'colour', 'fill', 'caption'):
+            raise TranslationError(f'Unsupported label {name!r}')
+        labels[name] = interpreter.string(interpreter.eval(node, columns))
+    return labels
+
+
+def _label(key):
+    def call(interpreter, args, columns):
+        bound = interpreter.bind('ggtitle' if key == 'title' else f'{key}lab', args, ('label',), columns=columns)
+        return Labels({key: interpreter.string(bound['label'])})
+    return call
+
+
+def _theme(name):
+    def call(interpreter, args, columns):
+        interpreter.bind(f'theme_{name}', args, ('base_size',), columns=columns)
+        return Theme(name)
+    return call
+
+
+THEMES = {
+    'grey': {'plot_bgcolor': '#EBEBEB', 'grid': 'white', 'line': False},
+    'gray': {'plot_bgcolor': '#EBEBEB', 'grid': 'white', 'line': False},
+    'minimal': {'plot_bgcolor': 'white', 'grid': '#EBEBEB', 'line': False},
+    'bw': {'plot_bgcolor': 'white', 'grid': '#EBEBEB', 'line': True},
+    'classic': {'plot_bgcolor': 'white', 'grid': None, 'line': True},
+}
+
+
+def gg_axis(theme, title, categories=None):
+    axis = {'title': {'text': title}, 'zeroline': False, 'showgrid': theme['grid'] is not None,
+            'ticks': 'outside', 'tickcolor': '#333333', 'showline': theme['line'], 'linecolor': '#333333'}
+    if theme['grid'] is not None:
+        axis['gridcolor'] = theme['grid']
+    if categories is not None:
+        axis.update({'type': 'category', 'categoryorder': 'array', 'categoryarray': categories})
+    return axis
+
+
+def ggplot_figure(interpreter, plot):
+    """Plotly figure for a ggplot object"""
+    if not plot.layers:
+        raise TranslationError('The plot has no layers')
+    theme = THEMES[plot.theme]
+    traces = []
+    labels = {}
+    x_categories = None
+    legend_title = None
+    legend_names = set()
+    for layer in plot.layers:
+        mapping = Aes(plot.mapping, **layer.mapping)
+        data = layer.params.get('data', plot.data)
+        frame = data if data is not None else Frame()
+
+        def aesthetic(name):
+            return interpreter.vector(interpreter.eval(mapping[name], frame)) if name in mapping else None
+
+        stat = interpreter.string(layer.params['stat']) if 'stat' in layer.params else (
+            'count' if layer.geom == 'geom_bar' else 'identity')
+        if stat not in ('identity', 'count'):
+            raise TranslationError(f'Unsupported stat {stat!r}')
+        x = aesthetic('x')
+        if x is None:
+            raise TranslationError('Layers need an x aesthetic')
+        y = aesthetic('y') if stat == 'identity' else None
+        if stat == 'identity' and y is None:
+            raise TranslationError(f'{layer.geom}() needs a y aesthetic')
+        if stat == 'count' and 'y' in mapping:
+            raise TranslationError('stat_count() must not be used with a y aesthetic')
+        n = len(x)
+        y = recycle(y, n) if y is not None else None
+        labels.setdefault('x', deparse(mapping['x']))
+        labels.setdefault('y', deparse(mapping['y']) if stat == 'identity' else 'count')
+        if x.dtype == object:
+            x_categories = levels(x)
+
+        colour_name = 'fill' if layer.geom == 'geom_bar' else 'colour'
+        colour = aesthetic(colour_name)
+        if colour is not None:
+            colour = recycle(colour, n)
+            legend_title = deparse(mapping[colour_name])
+        group = aesthetic('group')
+
+        if colour is not None and colour.dtype != object and colour.dtype != bool:
+            if layer.geom != 'geom_point':
+                raise TranslationError('Continuous colours are only supported for points')
+            groups = [(None, np.ones(n, dtype=bool), None)]
+        elif colour is not None:
+            colour = as_character(colour)
+            names = levels(colour)
+            palette = hue_palette(len(names))
+            groups = [(name, colour == name, palette[i]) for i, name in enumerate(names)]
+        elif group is not None:
+            group = as_character(recycle(group, n))
+            groups = [(None, group == name, None) for name in levels(group)]
+        else:
+            groups = [(None, np.ones(n, dtype=bool), None)]
+
+        for name, mask, group_colour in groups:
+            trace = gg_trace(interpreter, layer, stat, x[mask], y[mask] if y is not None else None,
+                             group_colour)
+            if name is not None:
+                trace.update({'name': name, 'legendgroup': name, 'showlegend': name not in legend_names})
+                legend_names.add(name)
+            else:
+                trace['showlegend'] = False
+            if layer.geom == 'geom_point' and colour is not None and group_colour is None:
+                trace['marker'].update({'color': colour.astype(np.float64), 'colorscale': GRADIENT,
+                                        'showscale': True, 'colorbar': {'title': {'text': legend_title}}})
+            traces.append(trace)
+
+    labels.update(plot.labels)
+    layout = {
+        'xaxis': gg_axis(theme, labels.get('x'), x_categories),
+        'yaxis': gg_axis(theme, labels.get('y')),
+        'plot_bgcolor': theme['plot_bgcolor'],
+        'paper_bgcolor': 'white',
+        'barmode': 'stack',
+        'bargap': 0.1,
+    }
+    if legend_title is not None:
+        layout['legend'] = {'title': {'text': labels.get('fill', labels.get('colour', legend_title))}}
+    if 'title' in labels:
+        title = labels['title']
+        if 'subtitle' in labels:
+            title += f"<br><sup>{labels['subtitle']}</sup>"
+        layout['title'] = {'text': title, 'x': 0, 'xref': 'paper', 'xanchor': 'left'}
+    return {'data': traces, 'layout': layout}
+
+
+def gg_trace(interpreter, layer, stat, x, y, group_colour):
+    params = layer.params
+    alpha = interpreter.scalar(params['alpha']) if 'alpha' in params else None
+
+    def fixed_colour(name, default):
+        if group_colour is not None:
+            return group_colour
+        return r_color(interpreter.vector(params[name])[0]) if name in params else default
+
+    if layer.geom == 'geom_point':
+        size = interpreter.scalar(params['size']) if 'size' in params else 1.5
+        trace = {'type': 'scatter', 'mode': 'markers', 'x': x, 'y': y,
+                 'marker': {'color': fixed_colour('colour', 'black'), 'size': 4 * size}}
+    elif layer.geom == 'geom_line':
+        order = np.argsort(x, kind='stable')
+        width = params.get('linewidth', params.get('size'))
+        trace = {'type': 'scatter', 'mode': 'lines', 'x': x[order], 'y': y[order],
+                 'line': {'color': fixed_colour('colour', 'black'),
+                          'width': 4 * (interpreter.scalar(width) if width is not None else 0.5),
+                          'dash': line_dash(interpreter, params.get('linetype'))}}
+    else:
+        if stat == 'count':
+            names = levels(x)
+            y = np.array([float(np.count_nonzero(x == name)) for name in names])
+            x = np.array(names, dtype=x.dtype)
+        trace = {'type': 'bar', 'x': x, 'y': y,
+                 'marker': {'color': fixed_colour('fill', '#595959')}}
+        if 'colour' in params:
+            trace['marker']['line'] = {'color': r_color(interpreter.vector(params['colour'])[0]), 'width': 1}
+        if 'width' in params:
+            trace['width'] = interpreter.scalar(params['width'])
+    if alpha is not None:
+        trace['opacity'] = alpha
+    return trace
+
+
+CALLS = {
+    'c': call_c,
+    'seq': call_seq,
+    'seq_len': call_seq_len,
+    'rep': call_rep,
+    'rnorm': call_rnorm,
+    'runif': call_runif,
+    'set.seed': call_set_seed,
+    'sum': _reduction('sum', np.sum),
+    'mean': _reduction('mean', np.mean),
+    'min': _reduction('min', np.min),
+    'max': _reduction('max', np.max),
+    'cumsum': _transform('cumsum', np.cumsum),
+    'rev': _transform('rev', lambda values: values[::-1]),
+    'sort': _transform('sort', np.sort),
+    'length': call_length,
+    'round': call_round,
+    'factor': call_factor,
+    'data.frame': call_data_frame,
+    'nrow': call_nrow,
+    'library': call_library,
+    'require': call_library,
+    'print': call_print,
+    'cat': call_cat,
+    'plot': call_plot,
+    'lines': _add_points('lines', 'l'),
+    'points': _add_points('points', 'p'),
+    'abline': call_abline,
+    'hist': call_hist,
+    'barplot': call_barplot,
+    'ggplot': call_ggplot,
+    'aes': call_aes,
+    'geom_point': _geom('geom_point'),
+    'geom_line': _geom('geom_line'),
+    'geom_bar': _geom('geom_bar'),
+    'geom_col': _geom('geom_col'),
+    'labs': call_labs,
+    'ggtitle': _label('title'),
+    'xlab': _label('x'),
+    'ylab': _label('y'),
+    'theme_grey': _theme('grey'),
+    'theme_gray': _theme('gray'),
+    'theme_minimal': _theme('minimal'),
+    'theme_bw': _theme('bw'),
+    'theme_classic': _theme('classic'),
+}
+
+
+# -- Public API ----------------------------------------------------------------
+
+class Translation:
+    """A translated script: its figure, cat() output and whether it came from the cache"""
+
+    def __init__(self, figure, output, cached):
+        self.figure = figure
+        self.output = output
+        self.cached = cached
+
+
+class Translator:
+    """Translates R scripts, caching figures by the script's parsed form"""
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {'translated': 0, 'fallbacks': 0, 'hits': 0, 'misses': 0}
+
+    def _count(self, name):
+        with self._lock:
+            self._counters[name] += 1
+
+    def translate(self, code):
+        """Return a Translation of code; raises TranslationError to fall back to R"""
+        try:
+            program = parse_r(code)
+            with self._lock:
+                cached = self._cache.get(program)
+                if cached is not None:
+                    self._cache.move_to_end(program)
+                    self._counters['hits'] += 1
+                    self._counters['translated'] += 1
+                    return Translation(cached[0], cached[1], True)
+            self._count('misses')
+            interpreter = Interpreter()
+            figure = interpreter.run(program)
+            output = ''.join(interpreter.output)
+        except TranslationError:
+            self._count('fallbacks')
+            raise
+        except Exception as e:
+            # A bug or an edge case the subset does not model; R still gets it right
+            print(f"R translation failed, falling back to R: {type(e).__name__}: {str(e)}")
+            self._count('fallbacks')
+            raise TranslationError(f'Translation failed: {str(e)}')
+
+        if interpreter.deterministic and self.max_entries > 0:
+            with self._lock:
+                self._cache[program] = (figure, output)
+                while len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
+        self._count('translated')
+        return Translation(figure, output, False)
+
+    def stats(self):
+        with self._lock:
+            return dict(self._counters, enabled=TRANSLATE_ENABLED, entries=len(self._cache),
+                        max_entries=self.max_entries)
+
+
+def create_translator():
+    """Build the translator from environment configuration"""
+    return Translator(max_entries=int(os.environ.get('R_TRANSLATE_CACHE_ENTRIES', 256)))
@@ -0,0 +1,199 @@
+"""Static PNG, SVG and PDF export of Plotly figures with a warm kaleido process.
+
+Kaleido renders figures in a headless Chromium whose startup takes seconds,
+so each server process keeps one kaleido scope alive and feeds it from a
+single thread through a bounded queue. Exports that find the queue full
+fail at once instead of piling up behind a slow figure, and an export that
+exceeds its timeout kills the kaleido process, which is restarted for the
+next one.
+
+Exported images are cached by a hash of the figure, the format and the
+size, so a figure is exported once however many renders produce it.
+Thumbnails render the figure at its full size and scale the image down,
+so they look like a miniature of the full export rather than a re-layout.
+
+Configuration (environment variables):
+    RASTER_QUEUE_SIZE     exports allowed to wait for kaleido (default 16)
+    RASTER_TIMEOUT        seconds an export may take, including its wait in the queue (default 30)
+    RASTER_CACHE_ENTRIES  exported images kept in memory, 0 disables the cache (default 128)
+    RASTER_CACHE_MB       size limit of the image cache (default 64)
+"""
+import base64
+import hashlib
+import json
+import os
+import queue
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+
+from plotly.utils import PlotlyJSONEncoder
+
+from assets import PLOTLY_JS_PATH
+from render_cache import RenderCache
+
+try:
+    from kaleido.scopes.plotly import PlotlyScope
+except ImportError:
+    PlotlyScope = None
+
+# Export formats and the MIME type of their results
+RASTER_FORMATS = {'png': 'image/png', 'svg': 'image/svg+xml', 'pdf': 'application/pdf'}
+
+# Size a figure is exported at unless the request sets one
+DEFAULT_WIDTH = 800
+DEFAULT_HEIGHT = 600
+MAX_SIZE = 4096
+MAX_SCALE = 4
+
+# Widths a thumbnail may ask for; a fixed set keeps the image cache effective
+THUMBNAIL_WIDTHS = (160, 320, 640)
+
+
+class RasterizeError(Exception):
+    pass
+
+
+def export_options(data):
+    """Validate the width/height/scale/thumbnail fields of a request body
+
+    Returns (options, None) on success or (None, error message).
+    """
+    try:
+        width = int(data.get('width', DEFAULT_WIDTH))
+        height = int(data.get('height', DEFAULT_HEIGHT))
+        scale = float(data.get('scale', 1))
+    except (TypeError, ValueError):
+        return None, 'width and height must be integers and scale a number'
+    if not (0 < width <= MAX_SIZE and 0 < height <= MAX_SIZE):
+        return None, f'width and height must be between 1 and {MAX_SIZE}'
+    if not 0 < scale <= MAX_SCALE:
+        return None, f'scale must be greater than 0 and at most {MAX_SCALE}'
+    thumbnail = data.get('thumbnail')
+    if thumbnail is not None:
+        if thumbnail not in THUMBNAIL_WIDTHS:
+            return None, f'Unsupported thumbnail. Use one of: {", ".join(map(str, THUMBNAIL_WIDTHS))}'
+        scale = thumbnail / width
+    return {'width': width, 'height': height, 'scale': scale}, None
+
+
+class Rasterizer:
+    """One kaleido scope served by a worker thread from a bounded queue"""
+
+    def __init__(self, queue_size=16, timeout=30, cache=None):
+        self.timeout = timeout
+        self.cache = cache
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._scope = None
+        self._thread_pid = None
+        self._running = None
+        self._counters = {'exports': 0, 'cache_hits': 0, 'rejected': 0, 'timeouts': 0,
+                          'errors': 0, 'restarts': 0}
+
+    def _count(self, name):
+        with self._lock:
+            self._counters[name] += 1
+
+    def _start(self):
+        """Start the export thread once per process (workers may fork after import)"""
+        with self._lock:
+            if self._thread_pid == os.getpid():
+                return
+            self._thread_pid = os.getpid()
+            self._scope = None
+        threading.Thread(target=self._serve, name='kaleido', daemon=True).start()
+
+    def _serve(self):
+        while True:
+            future, figure, output_format, size = self._queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            with self._lock:
+                self._running = future
+                scope = self._scope
+            try:
+                if scope is None:
+                    scope = PlotlyScope(plotlyjs=PLOTLY_JS_PATH, mathjax=False)
+                    with self._lock:
+                        self._scope = scope
+                # kaleido relaunches its process itself if it has exited
+                future.set_result(scope.transform(figure, format=output_format, **size))
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                with self._lock:
+                    self._running = None
+
+    def _stop_kaleido(self, scope):
+        """Kill a kaleido process so the next export starts a fresh one"""
+        with self._lock:
+            if self._scope is not scope:
+                return
+            self._scope = None
+            self._counters['restarts'] += 1
+        proc = getattr(scope, '_proc', None)  # kaleido keeps no public handle on its process
+        if proc is not None:
+            proc.kill()
+
+    def export(self, figure, output_format, width=DEFAULT_WIDTH, height=DEFAULT_HEIGHT, scale=1):
+        """Return the figure exported as bytes; raises RasterizeError"""
+        if PlotlyScope is None:
+            raise RasterizeError('Static export requires the kaleido package')
+        key = hashlib.sha256(json.dumps([figure, output_format, width, height, scale], sort_keys=True,
+                                        cls=PlotlyJSONEncoder).encode('utf-8')).hexdigest()
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self._count('cache_hits')
+                return base64.b64decode(cached['image'])
+
+        self._start()
+        future = Future()
+        size = {'width': width, 'height': height, 'scale': scale}
+        try:
+            self._queue.put_nowait((future, figure, output_format, size))
+        except queue.Full:
+            self._count('rejected')
+            raise RasterizeError('Static export queue is full, try again later')
+        try:
+            data = future.result(timeout=self.timeout)
+        except FutureTimeout:
+            self._count('timeouts')
+            if not future.cancel():
+                with self._lock:
+                    scope = self._scope if self._running is future else None
+                if scope is not None:
+                    self._stop_kaleido(scope)
+            raise RasterizeError(f'Static export timed out after {self.timeout} seconds')
+        except Exception as e:
+            self._count('errors')
+            raise RasterizeError(f'Static export failed: {str(e)}')
+
+        self._count('exports')
+        if self.cache is not None:
+            self.cache.put(key, {'image': base64.b64encode(data).decode('ascii')})
+        return data
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._counters,
+                         available=PlotlyScope is not None,
+                         running=self._scope is not None,
+                         queued=self._queue.qsize(),
+                         queue_size=self._queue.maxsize,
+                         timeout=self.timeout)
+        if self.cache is not None:
+            stats['cache'] = self.cache.stats()
+        return stats
+
+
+def create_rasterizer():
+    """Build the rasterizer from environment configuration"""
+    entries = int(os.environ.get('RASTER_CACHE_ENTRIES', 128))
+    cache = None
+    if entries > 0:
+        cache = RenderCache(max_entries=entries,
+                            max_bytes=int(os.environ.get('RASTER_CACHE_MB', 64)) * 1024 * 1024)
+    return Rasterizer(queue_size=int(os.environ.get('RASTER_QUEUE_SIZE', 16)),
+                      timeout=float(os.environ.get('RASTER_TIMEOUT', 30)),
+                      cache=cache)
@@ -0,0 +1,203 @@
+"""Content-addressed cache of visualization results.
+
+Results are keyed on a hash of the language, the normalized code and the
+renderer version, so re-running a gallery example or an unchanged notebook
+cell is answered without executing anything. The cache has a bounded
+in-memory LRU tier and an optional on-disk tier; both honour a TTL.
+
+Configuration (environment variables):
+    RENDER_CACHE_ENTRIES  max results kept in memory, 0 disables caching (default 256)
+    RENDER_CACHE_MB       max size of the in-memory tier (default 128)
+    RENDER_CACHE_TTL      seconds a result stays valid (default 3600)
+    RENDER_CACHE_DISK     set to 1 to enable the on-disk tier (default 0)
+    RENDER_CACHE_DISK_MB  max size of the on-disk tier (default 512)
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+# Bump whenever the shape or content of rendered results changes
+RENDERER_VERSION = '11'
+
+
+def normalize_code(code):
+    """Normalize line endings and surrounding whitespace"""
+    lines = code.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+    return '\n'.join(line.rstrip() for line in lines).strip('\n')
+
+
+def cache_key(language, code, options=None):
+    """Return the cache key for a piece of code"""
+    payload = json.dumps([RENDERER_VERSION, language, normalize_code(code), options or {}],
+                         sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class RenderCache:
+    """Two-tier LRU cache of JSON-serializable result payloads"""
+
+    def __init__(self, max_entries=256, max_bytes=128 * 1024 * 1024, ttl=3600,
+                 disk_dir=None, disk_max_bytes=512 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self._entries = OrderedDict()  # key -> (expires_at, size, result)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'disk_hits': 0, 'misses': 0, 'stores': 0,
+                          'evictions': 0, 'disk_evictions': 0, 'expired': 0}
+        self._disk_bytes = 0
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._disk_bytes = sum(size for _, size, _ in self._disk_files())
+
+    # -- memory tier ---------------------------------------------------------
+
+    def _store_memory(self, key, result, size, expires_at):
+        if key in self._entries:
+            self._bytes -= self._entries.pop(key)[1]
+        self._entries[key] = (expires_at, size, result)
+        self._bytes += size
+        while self._entries and (len(self._entries) > self.max_entries
+                                 or self._bytes > self.max_bytes):
+            _, (_, evicted_size, _) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self._counters['evictions'] += 1
+
+    # -- disk tier -----------------------------------------------------------
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, key[:2], f'{key}.json')
+
+    def _disk_files(self):
+        """Yield (path, size, mtime) for every file in the disk tier"""
+        for root, _, files in os.walk(self.disk_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                yield path, st.st_size, st.st_mtime
+
+    def _remove_disk_file(self, path, size):
+        try:
+            os.remove(path)
+            self._disk_bytes -= size
+        except OSError:
+            pass
+
+    def _load_disk(self, key):
+        path = self._disk_path(key)
+        try:
+            st = os.stat(path)
+            if time.time() - st.st_mtime > self.ttl:
+                self._remove_disk_file(path, st.st_size)
+                self._counters['expired'] += 1
+                return None
+            with open(path, 'r') as f:
+                return json.load(f), st.st_size, st.st_mtime + self.ttl
+        except (OSError, ValueError):
+            return None
+
+    def _store_disk(self, key, encoded):
+        path = self._disk_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if os.path.exists(path):
+            self._remove_disk_file(path, os.path.getsize(path))
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                f.write(encoded)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error writing render cache entry: {str(e)}")
+            return
+        self._disk_bytes += len(encoded)
+        if self._disk_bytes > self.disk_max_bytes:
+            # Drop the least recently written files until we are under budget
+            for old_path, size, _ in sorted(self._disk_files(), key=lambda f: f[2]):
+                if self._disk_bytes <= self.disk_max_bytes:
+                    break
+                self._remove_disk_file(old_path, size)
+                self._counters['disk_evictions'] += 1
+
+    # -- public API ----------------------------------------------------------
+
+    def get(self, key):
+        """Return the cached result for a key, or None"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] >= time.time():
+                    self._entries.move_to_end(key)
+                    self._counters['hits'] += 1
+                    return dict(entry[2])
+                self._bytes -= self._entries.pop(key)[1]
+                self._counters['expired'] += 1
+
+            if self.disk_dir:
+                loaded = self._load_disk(key)
+                if loaded is not None:
+                    result, size, expires_at = loaded
+                    self._store_memory(key, result, size, expires_at)
+                    self._counters['disk_hits'] += 1
+                    return dict(result)
+
+            self._counters['misses'] += 1
+            return None
+
+    def put(self, key, result):
+        """Store a result payload"""
+        encoded = json.dumps(result)
+        with self._lock:
+            self._store_memory(key, result, len(encoded), time.time() + self.ttl)
+            if self.disk_dir:
+                self._store_disk(key, encoded)
+            self._counters['stores'] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            if self.disk_dir:
+                for path, size, _ in list(self._disk_files()):
+                    self._remove_disk_file(path, size)
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._counters)
+            lookups = stats['hits'] + stats['disk_hits'] + stats['misses']
+            stats.update({
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'ttl': self.ttl,
+                'disk_enabled': bool(self.disk_dir),
+                'disk_bytes': self._disk_bytes,
+                'hit_ratio': (stats['hits'] + stats['disk_hits']) / lookups if lookups else 0.0,
+                'renderer_version': RENDERER_VERSION,
+            })
+            return stats
+
+
+def create_render_cache(temp_dir):
+    """Build the cache from environment configuration, or None if disabled"""
+    max_entries = int(os.environ.get('RENDER_CACHE_ENTRIES', 256))
+    if max_entries <= 0:
+        return None
+    disk_dir = None
+    if os.environ.get('RENDER_CACHE_DISK', '0') == '1':
+        disk_dir = os.path.join(temp_dir, 'cache')
+    return RenderCache(
+        max_entries=max_entries,
+        max_bytes=int(os.environ.get('RENDER_CACHE_MB', 128)) * 1024 * 1024,
+        ttl=int(os.environ.get('RENDER_CACHE_TTL', 3600)),
+        disk_dir=disk_dir,
+        disk_max_bytes=int(os.environ.get('RENDER_CACHE_DISK_MB', 512)) * 1024 * 1024)
@@ -0,0 +1,164 @@
+"""Editing sessions for incremental re-renders.
+
+While a user tweaks a script in the editor, most edits only touch the
+plotting statements at its end (a title, a colour, an axis range). Python
+code is split at its first plotting statement: the data preparation before
+it runs once in a checkpoint process that keeps the resulting namespace
+(see python_worker.py), and each render runs only the plotting suffix in a
+fork of that checkpoint. A session also keeps the last Plotly figure it
+returned, so the next one can be sent as a delta the client applies to the
+figure it already has before calling Plotly.react.
+
+Sessions expire after SESSION_TTL seconds without a render; the least
+recently used ones are closed when there are more than SESSION_MAX.
+
+Configuration (environment variables):
+    SESSION_TTL  seconds a session and its checkpoint are kept after last use (default 300)
+    SESSION_MAX  sessions kept at once, 0 disables sessions (default 32)
+"""
+import ast
+import os
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from artifacts import SCRIPT_DIR
+from python_pool import close_checkpoint
+
+# Names whose use marks the start of the plotting part of a script
+PLOTTING_NAMES = frozenset({'plt', 'matplotlib', 'px', 'go', 'pio', 'fig', 'ax', 'axs', 'axes'})
+
+# Longest session id a client may choose
+MAX_SESSION_ID_LENGTH = 64
+
+
+def split_code(code):
+    """Split Python code into (prefix, suffix) at the first plotting statement
+
+    Imports never start the suffix. The suffix is padded with blank lines so
+    line numbers in its tracebacks match the full script. Returns None when
+    the code does not parse, or has no data preparation before its plotting.
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return None
+    lines = code.splitlines(keepends=True)
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            continue
+        if any(isinstance(child, ast.Name) and child.id in PLOTTING_NAMES for child in ast.walk(node)):
+            start = min([node.lineno] + [d.lineno for d in getattr(node, 'decorator_list', [])]) - 1
+            prefix = ''.join(lines[:start])
+            if not prefix.strip():
+                return None
+            return prefix, '\n' * start + ''.join(lines[start:])
+    return None
+
+
+def normalize_prefix(prefix):
+    return '\n'.join(line.rstrip() for line in prefix.splitlines()).strip('\n')
+
+
+def figure_delta(previous, figure):
+    """Changes from one Plotly figure spec to the next, or None if not expressible
+
+    Traces are compared by position and sent whole when they differ; the
+    layout is compared per top-level key.
+    """
+    if set(previous) - {'data', 'layout'} or set(figure) - {'data', 'layout'}:
+        return None
+    data, old_data = figure.get('data', []), previous.get('data', [])
+    layout, old_layout = figure.get('layout', {}), previous.get('layout', {})
+    return {
+        'traces': len(data),
+        'data': {str(i): trace for i, trace in enumerate(data) if i >= len(old_data) or old_data[i] != trace},
+        'layout': {key: value for key, value in layout.items() if old_layout.get(key) != value},
+        'layout_removed': [key for key in old_layout if key not in layout],
+    }
+
+
+class EditSession:
+    """State kept between renders of one editor session"""
+
+    def __init__(self, session_id):
+        self.id = session_id
+        self.lock = threading.Lock()
+        self.prefix = None
+        self.prefix_output = ''
+        self.checkpoint = None
+        self.figure = None
+        self.version = 0
+        self.last_used = time.monotonic()
+
+    def new_checkpoint_path(self):
+        return os.path.join(SCRIPT_DIR or tempfile.gettempdir(), f'checkpoint-{uuid.uuid4().hex}.sock')
+
+    def close_checkpoint(self):
+        if self.checkpoint:
+            close_checkpoint(self.checkpoint)
+        self.checkpoint = None
+        self.prefix = None
+        self.prefix_output = ''
+
+
+class SessionStore:
+    """Bounded map of session id to EditSession with idle expiry"""
+
+    def __init__(self, max_sessions=32, ttl=300):
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {'prefix_runs': 0, 'prefix_reused': 0, 'full_renders': 0, 'deltas': 0,
+                          'expired': 0, 'evicted': 0}
+
+    def get(self, session_id):
+        """Return the session with this id, creating it if needed"""
+        now = time.monotonic()
+        closed = []
+        with self._lock:
+            for key, session in list(self._sessions.items()):
+                if now - session.last_used > self.ttl:
+                    closed.append(self._sessions.pop(key))
+                    self._counters['expired'] += 1
+            session = self._sessions.get(session_id)
+            if session is None:
+                session = self._sessions[session_id] = EditSession(session_id)
+            self._sessions.move_to_end(session_id)
+            session.last_used = now
+            while len(self._sessions) > self.max_sessions:
+                closed.append(self._sessions.popitem(last=False)[1])
+                self._counters['evicted'] += 1
+        for old in closed:
+            old.close_checkpoint()
+        return session
+
+    def count(self, name):
+        with self._lock:
+            self._counters[name] += 1
+
+    def close(self):
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close_checkpoint()
+
+    def stats(self):
+        with self._lock:
+            return dict(self._counters,
+                        sessions=len(self._sessions),
+                        checkpoints=sum(1 for s in self._sessions.values() if s.checkpoint),
+                        max_sessions=self.max_sessions,
+                        ttl=self.ttl)
+
+
+def create_session_store():
+    """Build the session store from environment configuration, or None if disabled"""
+    max_sessions = int(os.environ.get('SESSION_MAX', 32))
+    if max_sessions <= 0:
+        return None
+    return SessionStore(max_sessions, ttl=int(os.environ.get('SESSION_TTL', 300)))
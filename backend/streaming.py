@@ -0,0 +1,142 @@
+"""Incremental stdout/stderr of running executions.
+
+Executions used to report their output only once they finished. Now the
+executors follow a job's output while it runs: files written by the worker
+pools are tailed, and the pipes of a fresh interpreter are read as data
+arrives. New text goes to the output listener active on the current thread
+(the job runner forwards it as `output` events on the job's SSE stream).
+Forwarded text is capped per stream, so a chatty script cannot grow a job's
+event list without bound. Executions that time out raise TimeoutExpired
+carrying the output captured so far.
+
+Configuration (environment variables):
+    STREAM_MAX_KB         output forwarded per stream of one execution (default 256)
+    STREAM_POLL_INTERVAL  seconds between reads of a running job's output files (default 0.1)
+"""
+import codecs
+import os
+import subprocess
+import threading
+from contextlib import contextmanager
+
+MAX_STREAM_BYTES = int(os.environ.get('STREAM_MAX_KB', 256)) * 1024
+POLL_INTERVAL = float(os.environ.get('STREAM_POLL_INTERVAL', 0.1))
+
+_local = threading.local()
+
+
+def current_listener():
+    return getattr(_local, 'listener', None)
+
+
+@contextmanager
+def listen(listener):
+    """Send output of executions on this thread to listener(stream, text)"""
+    previous = current_listener()
+    _local.listener = listener
+    try:
+        yield
+    finally:
+        _local.listener = previous
+
+
+class StreamForwarder:
+    """Decode the chunks of one output stream and forward them up to a byte limit"""
+
+    def __init__(self, name, listener, limit=MAX_STREAM_BYTES):
+        self.name = name
+        self.listener = listener
+        self.limit = limit
+        self.forwarded = 0
+        self._decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    def feed(self, data):
+        if self.listener is None or self.forwarded >= self.limit:
+            return
+        data = data[:self.limit - self.forwarded]
+        self.forwarded += len(data)
+        text = self._decoder.decode(data)
+        if self.forwarded >= self.limit:
+            text += self._decoder.decode(b'', final=True) + '\n[output truncated]\n'
+        if text:
+            self.listener(self.name, text)
+
+
+@contextmanager
+def tail_files(paths):
+    """Forward text appended to output files while the block runs
+
+    `paths` maps stream names ('stdout', 'stderr') to files written by a
+    worker. Does nothing when no listener is active.
+    """
+    listener = current_listener()
+    if listener is None:
+        yield
+        return
+
+    forwarders = {name: StreamForwarder(name, listener) for name in paths}
+    offsets = dict.fromkeys(paths, 0)
+    stopped = threading.Event()
+
+    def poll():
+        for name, path in paths.items():
+            try:
+                with open(path, 'rb') as f:
+                    f.seek(offsets[name])
+                    data = f.read(MAX_STREAM_BYTES)
+            except OSError:
+                continue
+            offsets[name] += len(data)
+            forwarders[name].feed(data)
+
+    def run():
+        while not stopped.wait(POLL_INTERVAL):
+            poll()
+
+    thread = threading.Thread(target=run, name='output-tail', daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stopped.set()
+        thread.join()
+        poll()
+
+
+def run_streaming(args, timeout, preexec_fn=None, env=None):
+    """subprocess.run(capture_output=True, text=True) that streams output as it arrives
+
+    Raises TimeoutExpired with the stdout and stderr read before the
+    process was killed.
+    """
+    listener = current_listener()
+    proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            preexec_fn=preexec_fn, env=env)
+    chunks = {'stdout': [], 'stderr': []}
+
+    def read(name, pipe):
+        forwarder = StreamForwarder(name, listener)
+        for chunk in iter(lambda: os.read(pipe.fileno(), 65536), b''):
+            chunks[name].append(chunk)
+            forwarder.feed(chunk)
+        pipe.close()
+
+    readers = [threading.Thread(target=read, args=(name, pipe), daemon=True)
+               for name, pipe in (('stdout', proc.stdout), ('stderr', proc.stderr))]
+    for reader in readers:
+        reader.start()
+
+    def captured(name):
+        return b''.join(chunks[name]).decode('utf-8', errors='replace')
+
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        for reader in readers:
+            reader.join()
+        raise subprocess.TimeoutExpired(args, timeout, output=captured('stdout'), stderr=captured('stderr'))
+    for reader in readers:
+        reader.join()
+    return subprocess.CompletedProcess(args, proc.returncode, captured('stdout'), captured('stderr'))
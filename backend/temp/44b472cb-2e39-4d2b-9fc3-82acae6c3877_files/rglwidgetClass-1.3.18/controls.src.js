@@ -1,591 +0,0 @@
-
-    /**
-     * Change the displayed subset
-     * @param { Object } el - Element of the control; not used.
-     * @param { Object } control - The subset control data.
-     */
-    rglwidgetClass.prototype.subsetSetter = function(el, control) {
-      if (typeof control.subscenes === "undefined" ||
-          control.subscenes === null)
-        control.subscenes = this.scene.rootSubscene;
-      var value = Math.round(control.value),
-          subscenes = [].concat(control.subscenes),
-          fullset = [].concat(control.fullset),
-          i, j, subsceneid,
-          adds = [], deletes = [];
-      if (rglwidgetClass.missing(value))
-        value = control.value = 0;
-      if (control.accumulate)
-        for (i=0; i <= value; i++)
-          adds = adds.concat(control.subsets[i]);
-      else
-        adds = adds.concat(control.subsets[value]);
-      deletes = fullset.filter(function(x) { return adds.indexOf(x) < 0; });
-      for (i = 0; i < subscenes.length; i++) {
-        subsceneid = subscenes[i];
-        if (typeof this.getObj(subsceneid) === "undefined")
-          this.alertOnce("typeof object is undefined");
-        for (j = 0; j < adds.length; j++)
-          this.addToSubscene(adds[j], subsceneid);
-        for (j = 0; j < deletes.length; j++)
-          this.delFromSubscene(deletes[j], subsceneid);
-      }
-    };
-
-    /**
-     * Change the requested property
-     * @param { Object } el - Element of the control; not used.
-     * @param { Object } control - The property setter control data.
-     */
-    rglwidgetClass.prototype.propertySetter = function(el, control)  {
-      var value = control.value,
-          values = [].concat(control.values),
-          svals = [].concat(control.param),
-          direct = values[0] === null,
-          entries = [].concat(control.entries),
-          ncol = entries.length,
-          nrow = values.length/ncol,
-          properties = rglwidgetClass.repeatToLen(control.properties, ncol),
-          objids = rglwidgetClass.repeatToLen(control.objids, ncol),
-          property, objid = objids[0],
-          obj = this.getObj(objid),
-          propvals, i, j, v1, v2, p, entry, gl, needsBinding,
-          newprop, newid,
-
-          getPropvals = function() {
-            if (property === "userMatrix")
-              return obj.par3d.userMatrix.getAsArray();
-            else if (property === "scale" || property === "FOV" || property === "zoom")
-              return [].concat(obj.par3d[property]);
-            else
-              return [].concat(obj[property]);
-          },
-
-          putPropvals = function(newvals) {
-            if (newvals.length === 1)
-              newvals = newvals[0];
-            if (property === "userMatrix")
-              obj.par3d.userMatrix.load(newvals);
-            else if (property === "scale" || property === "FOV" || property === "zoom")
-              obj.par3d[property] = newvals;
-            else
-              obj[property] = newvals;
-          };
-
-      if (direct && typeof value === "undefined")
-        return;
-
-      if (control.interp) {
-        values = values.slice(0, ncol).concat(values).
-                 concat(values.slice(ncol*(nrow-1), ncol*nrow));
-        svals = [-Infinity].concat(svals).concat(Infinity);
-        for (i = 1; i < svals.length; i++) {
-          if (value <= svals[i]) {
-            if (svals[i] === Infinity)
-              p = 1;
-            else
-              p = (svals[i] - value)/(svals[i] - svals[i-1]);
-            break;
-          }
-        }
-      } else if (!direct) {
-        value = Math.round(value);
-      }
-
-      for (j=0; j<entries.length; j++) {
-        entry = entries[j];
-        newprop = properties[j];
-        newid = objids[j];
-
-        if (newprop !== property || newid !== objid) {
-          if (typeof property !== "undefined")
-            putPropvals(propvals);
-          property = newprop;
-          objid = newid;
-          obj = this.getObj(objid);
-          propvals = getPropvals();
-        }
-        if (control.interp) {
-          v1 = values[ncol*(i-1) + j];
-          v2 = values[ncol*i + j];
-          this.setElement(propvals, entry, p*v1 + (1-p)*v2);
-        } else if (!direct) {
-          this.setElement(propvals, entry, values[ncol*value + j]);
-        } else {
-          this.setElement(propvals, entry, value[j]);
-        }
-      }
-      putPropvals(propvals);
-
-      needsBinding = [];
-      for (j=0; j < entries.length; j++) {
-        if (properties[j] === "values" &&
-            needsBinding.indexOf(objids[j]) === -1) {
-          needsBinding.push(objids[j]);
-        }
-      }
-      for (j=0; j < needsBinding.length; j++) {
-        gl = this.gl || this.initGL();
-        obj = this.getObj(needsBinding[j]);
-        gl.bindBuffer(gl.ARRAY_BUFFER, obj.buf);
-        gl.bufferData(gl.ARRAY_BUFFER, obj.values, gl.STATIC_DRAW);
-      }
-    };
-
-    /**
-     * Change the requested vertices
-     * @param { Object } el - Element of the control; not used.
-     * @param { Object } control - The vertext setter control data.
-     */
-    rglwidgetClass.prototype.vertexSetter = function(el, control)  {
-      var svals = [].concat(control.param),
-          j, k, p, a, propvals, stride, ofs, obj, entry,
-          attrib, vertex, varies,
-          ofss    = {x:"vofs", y:"vofs", z:"vofs",
-                     red:"cofs", green:"cofs", blue:"cofs",
-                     alpha:"cofs", radii:"radofs",
-                     nx:"nofs", ny:"nofs", nz:"nofs",
-                     ox:"oofs", oy:"oofs", oz:"oofs",
-                     ts:"tofs", tt:"tofs"},
-          pos     = {x:0, y:1, z:2,
-                     red:0, green:1, blue:2,
-                     alpha:3,radii:0,
-                     nx:0, ny:1, nz:2,
-                     ox:0, oy:1, oz:2,
-                     ts:0, tt:1},
-        values = control.values,
-        direct = values === null,
-        ncol,
-        interp = control.interp,
-        vertices = [].concat(control.vertices),
-        attributes = [].concat(control.attributes),
-        value = control.value, newval, aliases, alias;
-
-      ncol = Math.max(vertices.length, attributes.length);
-
-      if (!ncol)
-        return;
-
-      vertices = rglwidgetClass.repeatToLen(vertices, ncol);
-      attributes = rglwidgetClass.repeatToLen(attributes, ncol);
-
-      if (direct)
-        interp = false;
-
-      /* JSON doesn't pass Infinity */
-      svals[0] = -Infinity;
-      svals[svals.length - 1] = Infinity;
-
-      for (j = 1; j < svals.length; j++) {
-        if (value <= svals[j]) {
-          if (interp) {
-            if (svals[j] === Infinity)
-              p = 1;
-            else
-              p = (svals[j] - value)/(svals[j] - svals[j-1]);
-          } else {
-            if (svals[j] - value > value - svals[j-1])
-              j = j - 1;
-          }
-          break;
-        }
-      }
-
-      obj = this.getObj(control.objid);
-      // First, make sure color attributes vary in original
-      if (typeof obj.vOffsets !== "undefined") {
-      	varies = true;
-        for (k = 0; k < ncol; k++) {
-          attrib = attributes[k];
-          if (typeof attrib !== "undefined") {
-            ofs = obj.vOffsets[ofss[attrib]];
-            if (ofs < 0) {
-              switch(attrib) {
-              	case "alpha":
-              	case "red":
-              	case "green":
-              	case "blue":
-              	  obj.colors = [obj.colors[0], obj.colors[0]];
-              	  break;
-              }
-              varies = false;
-            }
-          }
-        }
-        if (!varies)
-          this.initObjId(control.objid);
-      }
-      propvals = obj.values;
-      aliases = obj.alias;
-      if (typeof aliases === "undefined")
-        aliases = [];
-      for (k=0; k<ncol; k++) {
-        if (direct) {
-          newval = value;
-        } else if (interp) {
-          newval = p*values[j-1][k] + (1-p)*values[j][k];
-        } else {
-          newval = values[j][k];
-        }      	
-        attrib = attributes[k];
-        vertex = vertices[k];
-        alias = aliases[vertex];
-        if (obj.type === "planes" || obj.type === "clipplanes") {
-          ofs = ["nx", "ny", "nz", "offset"].indexOf(attrib);
-          if (ofs >= 0) {
-            if (ofs < 3) {
-              if (obj.normals[vertex][ofs] !== newval) {  // Assume no aliases here...
-              	obj.normals[vertex][ofs] = newval;
-              	obj.initialized = false;
-              }
-            } else {
-              if (obj.offsets[vertex][0] !== newval) {
-              	obj.offsets[vertex][0] = newval;
-              	obj.initialized = false;
-              }
-            }
-            continue;
-          }
-        }
-        // Not a plane setting...
-        ofs = obj.vOffsets[ofss[attrib]];
-        if (ofs < 0)
-          this.alertOnce("Attribute '"+attrib+"' not found in object "+control.objid);
-        else {
-          stride = obj.vOffsets.stride;
-          ofs = ofs + pos[attrib];
-          entry = vertex*stride + ofs;
-          propvals[entry] = newval;
-          if (typeof alias !== "undefined")
-            for (a = 0; a < alias.length; a++)
-              propvals[alias[a]*stride + ofs] = newval;
-        }
-      }
-      if (typeof obj.buf !== "undefined") {
-        var gl = this.gl || this.initGL();
-        gl.bindBuffer(gl.ARRAY_BUFFER, obj.buf);
-        gl.bufferData(gl.ARRAY_BUFFER, propvals, gl.STATIC_DRAW);
-      }
-    };
-
-    /**
-     * Change the requested vertex properties by age
-     * @param { Object } el - Element of the control; not used.
-     * @param { Object } control - The age setter control data.
-     */
-    rglwidgetClass.prototype.ageSetter = function(el, control) {
-      var objids = [].concat(control.objids),
-          nobjs = objids.length,
-          time = control.value,
-          births = [].concat(control.births),
-          ages = [].concat(control.ages),
-          steps = births.length,
-          j = Array(steps),
-          p = Array(steps),
-          i, k, l, age, j0, propvals, stride, ofs, objid, obj,
-          attrib, dim, varies, alias, aliases, a, d,
-          attribs = ["colors", "alpha", "radii", "vertices",
-                     "normals", "origins", "texcoords",
-                     "x", "y", "z",
-                     "red", "green", "blue"],
-          ofss    = ["cofs", "cofs", "radofs", "vofs",
-                     "nofs", "oofs", "tofs",
-                     "vofs", "vofs", "vofs",
-                     "cofs", "cofs", "cofs"],
-          dims    = [3,1,1,3,
-                     3,2,2,
-                     1,1,1,
-                     1,1,1],
-          pos     = [0,3,0,0,
-                     0,0,0,
-                     0,1,2,
-                     0,1,2];
-      /* Infinity doesn't make it through JSON */
-      ages[0] = -Infinity;
-      ages[ages.length-1] = Infinity;
-      for (i = 0; i < steps; i++) {
-        if (births[i] !== null) {  // NA in R becomes null
-          age = time - births[i];
-          for (j0 = 1; age > ages[j0]; j0++);
-          if (ages[j0] === Infinity)
-            p[i] = 1;
-          else if (ages[j0] > ages[j0-1])
-            p[i] = (ages[j0] - age)/(ages[j0] - ages[j0-1]);
-          else
-            p[i] = 0;
-          j[i] = j0;
-        }
-      }
-      // First, make sure color attributes vary in original
-      for (l = 0; l < nobjs; l++) {
-      	objid = objids[l];
-      	obj = this.getObj(objid);
-      	varies = true;
-        if (typeof obj.vOffsets === "undefined")
-          continue;
-        for (k = 0; k < attribs.length; k++) {
-          attrib = control[attribs[k]];
-          if (typeof attrib !== "undefined") {
-            ofs = obj.vOffsets[ofss[k]];
-            if (ofs < 0) {
-              switch(attribs[k]) {
-              	case "colors":
-              	case "alpha":
-              	case "red":
-              	case "green":
-              	case "blue":
-              	  obj.colors = [obj.colors[0], obj.colors[0]];
-              	  break;
-              }
-              varies = false;
-            }
-          }
-        }
-        if (!varies)
-          this.initObjId(objid);
-      }
-      for (l = 0; l < nobjs; l++) {
-        objid = objids[l];
-        obj = this.getObj(objid);
-        if (typeof obj.vOffsets === "undefined")
-          continue;
-        aliases = obj.alias;
-        if (typeof aliases === "undefined")
-          aliases = [];
-        propvals = obj.values;
-        stride = obj.vOffsets.stride;
-        for (k = 0; k < attribs.length; k++) {
-          attrib = control[attribs[k]];
-          if (typeof attrib !== "undefined") {
-            ofs = obj.vOffsets[ofss[k]];
-            if (ofs >= 0) {
-              dim = dims[k];
-              ofs = ofs + pos[k];
-              for (i = 0; i < steps; i++) {
-              	alias = aliases[i];
-                if (births[i] !== null) {
-                  for (d=0; d < dim; d++) {
-                    propvals[i*stride + ofs + d] = p[i]*attrib[dim*(j[i]-1) + d] + (1-p[i])*attrib[dim*j[i] + d];
-                    if (typeof alias !== "undefined")
-                      for (a=0; a < alias.length; a++)
-                        propvals[alias[a]*stride + ofs + d] = propvals[i*stride + ofs + d];
-                  }
-                }
-              }
-            } else
-              this.alertOnce("\'"+attribs[k]+"\' property not found in object "+objid);
-          }
-        }
-        obj.values = propvals;
-        if (typeof obj.buf !== "undefined") {
-          var gl = this.gl || this.initGL();
-          gl.bindBuffer(gl.ARRAY_BUFFER, obj.buf);
-          gl.bufferData(gl.ARRAY_BUFFER, obj.values, gl.STATIC_DRAW);
-        }
-      }
-    };
-
-    /**
-     * Bridge to old style control
-     * @param { Object } el - Element of the control; not used.
-     * @param { Object } control - The bridge control data.
-     */
-    rglwidgetClass.prototype.oldBridge = function(el, control) {
-      var attrname, global = window[control.prefix + "rgl"];
-      if (global)
-        for (attrname in global)
-          this[attrname] = global[attrname];
-      window[control.prefix + "rgl"] = this;
-    };
-
-    /**
-     * Set up a player control
-     * @param { Object } el - The player control element
-     * @param { Object } control - The player data.
-     */
-    rglwidgetClass.prototype.Player = function(el, control) {
-      var
-        self = this,
-        components = [].concat(control.components),
-        buttonLabels = [].concat(control.buttonLabels),
-
-        Tick = function() { /* "this" will be a timer */
-          var i,
-              nominal = this.value,
-              slider = this.Slider,
-              labels = this.outputLabels,
-              output = this.Output,
-              step;
-          if (typeof slider !== "undefined" && nominal !== slider.value)
-            slider.value = nominal;
-          if (typeof output !== "undefined") {
-            step = Math.round((nominal - output.sliderMin)/output.sliderStep);
-            if (labels !== null) {
-              output.innerHTML = labels[step];
-            } else {
-              step = step*output.sliderStep + output.sliderMin;
-              output.innerHTML = step.toPrecision(output.outputPrecision);
-            }
-          }
-          for (i=0; i < this.actions.length; i++) {
-            this.actions[i].value = nominal;
-          }
-          self.applyControls(el, this.actions, false);
-          self.drawScene();
-        },
-
-        OnSliderInput = function() { /* "this" will be the slider */
-          this.rgltimer.value = Number(this.value);
-          this.rgltimer.Tick();
-        },
-
-        addSlider = function(min, max, step, value) {
-          var slider = document.createElement("input");
-          slider.type = "range";
-          slider.min = min;
-          slider.max = max;
-          slider.step = step;
-          slider.value = value;
-          slider.oninput = OnSliderInput;
-          slider.sliderActions = control.actions;
-          slider.sliderScene = this;
-          slider.className = "rgl-slider";
-          slider.id = el.id + "-slider";
-          el.rgltimer.Slider = slider;
-          slider.rgltimer = el.rgltimer;
-          el.appendChild(slider);
-        },
-
-        addLabel = function(labels, min, step, precision) {
-          var output = document.createElement("output");
-          output.sliderMin = min;
-          output.sliderStep = step;
-          output.outputPrecision = precision;
-          output.className = "rgl-label";
-          output.id = el.id + "-label";
-          el.rgltimer.Output = output;
-          el.rgltimer.outputLabels = labels;
-          el.appendChild(output);
-        },
-
-        addButton = function(which, label, active) {
-          var button = document.createElement("input"),
-              onclicks = {Reverse: function() { this.rgltimer.reverse();},
-                    Play: function() { this.rgltimer.play();
-                                       this.value = this.rgltimer.enabled ? this.inactiveValue : this.activeValue; },
-                   Slower: function() { this.rgltimer.slower(); },
-                   Faster: function() { this.rgltimer.faster(); },
-                   Reset: function() { this.rgltimer.reset(); },
-              	   Step:  function() { this.rgltimer.step(); }
-              };
-          button.rgltimer = el.rgltimer;
-          button.type = "button";
-          button.value = label;
-          button.activeValue = label;
-          button.inactiveValue = active;
-          if (which === "Play")
-            button.rgltimer.PlayButton = button;
-          button.onclick = onclicks[which];
-          button.className = "rgl-button";
-          button.id = el.id + "-" + which;
-          el.appendChild(button);
-        };
-
-        if (typeof control.reinit !== "undefined" && control.reinit !== null) {
-          control.actions.reinit = control.reinit;
-        }
-        el.rgltimer = new rgltimerClass(Tick, control.start, control.interval, control.stop,
-                                        control.step, control.value, control.rate, control.loop, control.actions);
-        for (var i=0; i < components.length; i++) {
-          switch(components[i]) {
-            case "Slider": addSlider(control.start, control.stop,
-                                   control.step, control.value);
-              break;
-            case "Label": addLabel(control.labels, control.start,
-                                   control.step, control.precision);
-              break;
-            default:
-              addButton(components[i], buttonLabels[i], control.pause);
-          }
-        }
-        el.rgltimer.Tick();
-    };
-
-    /**
-     * Apply all registered controls
-     * @param { Object } el - DOM element of the control
-     * @param { Object } x - List of actions to apply
-     * @param { boolean } [draw=true] - Whether to redraw after applying
-     */
-    rglwidgetClass.prototype.applyControls = function(el, x, draw) {
-      var self = this, reinit = x.reinit, i, control, type;
-      for (i = 0; i < x.length; i++) {
-        control = x[i];
-        type = control.type;
-        self[type](el, control);
-      }
-      if (typeof reinit !== "undefined" && reinit !== null) {
-        reinit = [].concat(reinit);
-        for (i = 0; i < reinit.length; i++)
-          self.getObj(reinit[i]).initialized = false;
-      }
-      if (typeof draw === "undefined" || draw)
-        self.drawScene();
-    };
-
-    /**
-     * Handler for scene change
-     * @param { Object } message - What sort of scene change to do?
-     */
-    rglwidgetClass.prototype.sceneChangeHandler = function(message) {
-      var self = document.getElementById(message.elementId).rglinstance,
-          objs = message.objects, mat = message.material,
-          root = message.rootSubscene,
-          initSubs = message.initSubscenes,
-          redraw = message.redrawScene,
-          skipRedraw = message.skipRedraw,
-          deletes, subs, allsubs = [], i,j;
-      if (typeof message.delete !== "undefined") {
-        deletes = [].concat(message.delete);
-        if (typeof message.delfromSubscenes !== "undefined")
-          subs = [].concat(message.delfromSubscenes);
-        else
-          subs = [];
-        for (i = 0; i < deletes.length; i++) {
-          for (j = 0; j < subs.length; j++) {
-            self.delFromSubscene(deletes[i], subs[j]);
-          }
-          delete self.scene.objects[deletes[i]];
-        }
-      }
-      if (typeof objs !== "undefined") {
-        Object.keys(objs).forEach(function(key){
-          key = parseInt(key, 10);
-          self.scene.objects[key] = objs[key];
-          self.initObjId(key);
-          var obj = self.getObj(key),
-              subs = [].concat(obj.inSubscenes), k;
-          allsubs = allsubs.concat(subs);
-          for (k = 0; k < subs.length; k++)
-            self.addToSubscene(key, subs[k]);
-        });
-      }
-      if (typeof mat !== "undefined") {
-        self.scene.material = mat;
-      }
-      if (typeof root !== "undefined") {
-        self.scene.rootSubscene = root;
-      }
-      if (typeof initSubs !== "undefined")
-        allsubs = allsubs.concat(initSubs);
-      allsubs = self.unique(allsubs);
-      for (i = 0; i < allsubs.length; i++) {
-        self.initSubscene(allsubs[i]);
-      }
-      if (typeof skipRedraw !== "undefined") {
-        root = self.getObj(self.scene.rootSubscene);
-        root.par3d.skipRedraw = skipRedraw;
-      }
-      if (redraw)
-        self.drawScene();
-    };
@@ -1,148 +0,0 @@
-    /**
-     * Methods related to projections
-     * @name ___METHODS_FOR_PROJECTIONS___
-     * @memberof rglwidgetClass
-     * @kind function
-     * @instance
-     */
-     
-    /**
-     * Get the viewport
-     */
-     
-    rglwidgetClass.prototype.getViewport = function(id) {
-      var vp = this.getObj(id).par3d.viewport,
-         x = vp.x*this.canvas.width,
-         y = vp.y*this.canvas.height,
-         width = vp.width*this.canvas.width,
-         height = vp.height*this.canvas.height;
-       this.vp = {x:x, y:y, width:width, height:height};
-    };
-    
-    /**
-     * Set the gl viewport and scissor test
-     * @param { number } id - id of subscene
-     */
-    rglwidgetClass.prototype.setViewport = function(id) {
-       var gl = this.gl || this.initGL();
-       this.getViewport(id);
-       gl.viewport(this.vp.x, this.vp.y, this.vp.width, this.vp.height);
-       gl.scissor(this.vp.x, this.vp.y, this.vp.width, this.vp.height);
-       gl.enable(gl.SCISSOR_TEST);
-     };
-
-    /**
-     * Set the projection matrix for a subscene
-     * @param { number } id - id of subscene
-     */
-    rglwidgetClass.prototype.setprMatrix = function(id) {
-       var subscene = this.getObj(id),
-          embedding = subscene.embeddings.projection;
-       if (embedding === "replace")
-         this.prMatrix.makeIdentity();
-       else
-         this.setprMatrix(subscene.parent);
-       if (embedding === "inherit")
-         return;
-       // This is based on the Frustum::enclose code from geom.cpp
-       var bbox = subscene.par3d.bbox,
-           scale = subscene.par3d.scale,
-           ranges = [(bbox[1]-bbox[0])*scale[0]/2,
-                     (bbox[3]-bbox[2])*scale[1]/2,
-                     (bbox[5]-bbox[4])*scale[2]/2],
-           radius = Math.sqrt(this.sumsq(ranges))*1.1; // A bit bigger to handle labels
-       if (radius <= 0) radius = 1;
-       var observer = subscene.par3d.observer,
-           distance = observer[2],
-           FOV = subscene.par3d.FOV, ortho = FOV === 0,
-           t = ortho ? 1 : Math.tan(FOV*Math.PI/360),
-           near = distance - radius,
-           far = distance + radius,
-           hlen,
-           aspect = this.vp.width/this.vp.height,
-           z = subscene.par3d.zoom,
-           userProjection = subscene.par3d.userProjection;
-       if (far < 0.0)
-         far = 1.0;
-       if (near < far/100.0)
-         near = far/100.0;
-       this.frustum = {near:near, far:far};
-       hlen = t*near;
-       if (ortho) {
-         if (aspect > 1)
-           this.prMatrix.ortho(-hlen*aspect*z, hlen*aspect*z,
-                          -hlen*z, hlen*z, near, far);
-         else
-           this.prMatrix.ortho(-hlen*z, hlen*z,
-                          -hlen*z/aspect, hlen*z/aspect,
-                          near, far);
-       } else {
-         if (aspect > 1)
-           this.prMatrix.frustum(-hlen*aspect*z, hlen*aspect*z,
-                          -hlen*z, hlen*z, near, far);
-         else
-           this.prMatrix.frustum(-hlen*z, hlen*z,
-                          -hlen*z/aspect, hlen*z/aspect,
-                          near, far);
-       }
-       this.prMatrix.multRight(userProjection);
-     };
-
-    /**
-     * Set the model-view matrix for a subscene
-     * @param { number } id - id of the subscene
-     */
-    rglwidgetClass.prototype.setmvMatrix = function(id) {
-       var observer = this.getObj(id).par3d.observer;
-       this.mvMatrix.makeIdentity();
-       this.setmodelMatrix(id);
-       this.mvMatrix.translate(-observer[0], -observer[1], -observer[2]);
-
-     };
-
-    /**
-     * Set the model matrix for a subscene
-     * @param { number } id - id of the subscene
-     */
-    rglwidgetClass.prototype.setmodelMatrix = function(id) {
-      var subscene = this.getObj(id),
-          embedding = subscene.embeddings.model;
-      if (embedding === "replace") {
-        var bbox = subscene.par3d.bbox,
-            center = [(bbox[0]+bbox[1])/2,
-                      (bbox[2]+bbox[3])/2,
-                      (bbox[4]+bbox[5])/2];
-        this.mvMatrix.translate(-center[0], -center[1], -center[2]);
-      }
-      if (embedding !== "inherit") {
-        var scale = subscene.par3d.scale;
-        this.mvMatrix.scale(scale[0], scale[1], scale[2]);
-        this.mvMatrix.multRight( subscene.par3d.userMatrix );
-      }
-      if (embedding !== "replace")
-        this.setmodelMatrix(subscene.parent);
-     };
-
-    /**
-     * Set the normals matrix for a subscene
-     * @param { number } subsceneid - id of the subscene
-     */
-     rglwidgetClass.prototype.setnormMatrix2 = function() {
-       this.normMatrix = new CanvasMatrix4(this.mvMatrix);
-       this.normMatrix.invert();
-       this.normMatrix.transpose();
-     };
-
-    /**
-     * Set the combined projection-model-view matrix
-     */
-    rglwidgetClass.prototype.setprmvMatrix = function() {
-       this.prmvMatrix = new CanvasMatrix4( this.mvMatrix );
-       this.prmvMatrix.multRight( this.prMatrix );
-     };
-
-    rglwidgetClass.prototype.setInvPrMatrix = function() {
-      this.invPrMatrix = new CanvasMatrix4( this.prMatrix );
-      this.invPrMatrix.invert();
-      this.invPrMatrix.transpose();
-    };
@@ -1,155 +0,0 @@
-
-/* globals rgltimerClass: true */
-
-/**
- * The class of an rgl timer object
- * @class
-*/
-
-/**
- * Construct an rgltimerClass object
- * @constructor
- * @param { function } Tick - action when timer fires
- * @param { number } startTime - nominal start time in seconds
- * @param { number } interval - seconds between updates
- * @param { number } stopTime - nominal stop time in seconds
- * @param { number } stepSize - nominal step size
- * @param { number } value - current nominal time
- * @param { number } rate - nominal units per second
- * @param { string } loop - "none", "cycle" or "oscillate"
- * @param { Object } actions - list of actions
- */
-rgltimerClass = function(Tick, startTime, interval, stopTime, stepSize, value, rate, loop, actions) {
-  this.enabled = false;
-  this.timerId = 0;
-  /** nominal start time in seconds */
-  this.startTime = startTime;   
-  /** current nominal time */      
-  this.value = value;
-  /** seconds between updates */                 
-  this.interval = interval;
-  /** nominal stop time */           
-  this.stopTime = stopTime;
-  /** nominal step size */           
-  this.stepSize = stepSize;
-  /** nominal units per second */           
-  this.rate = rate;
-  /** "none", "cycle", or "oscillate" */                   
-  this.loop = loop;
-  /** real world start time */                   
-  this.realStart = undefined;
-  /** multiplier for fast-forward or reverse */         
-  this.multiplier = 1;                
-  this.actions = actions;
-  this.Tick = Tick;
-};
-
-
-    /**
-     * Methods related to players
-     * @name ___METHODS_FOR_PLAYERS___
-     * @memberof rgltimerClass
-     * @kind function
-     * @instance
-     */
-
-  /**
-   * Start playing
-   * @memberof rgltimerClass
-   */
-  rgltimerClass.prototype.play = function() {
-    if (this.enabled) {
-      this.enabled = false;
-      window.clearInterval(this.timerId);
-      this.timerId = 0;
-      return;
-    }
-    var tick = function(self) {
-      var now = new Date();
-      self.value = self.multiplier*self.rate*(now - self.realStart)/1000 + self.startTime;
-      self.forceToRange();
-      if (typeof self.Tick !== "undefined") {
-        self.Tick(self.value);
-      }
-
-    };
-    this.realStart = new Date() - 1000*(this.value - this.startTime)/this.rate/this.multiplier;
-    this.timerId = window.setInterval(tick, 1000*this.interval, this);
-    this.enabled = true;
-  };
-
-  /**
-   * Force value into legal range
-   */
-  rgltimerClass.prototype.forceToRange = function() {
-    if (this.value > this.stopTime + this.stepSize/2 || this.value < this.startTime - this.stepSize/2) {
-      if (!this.loop) {
-        this.reset();
-      } else {
-        var cycle = this.stopTime - this.startTime + this.stepSize,
-            newval = (this.value - this.startTime) % cycle + this.startTime;
-        if (newval < this.startTime) {
-          newval += cycle;
-        }
-        this.realStart += (this.value - newval)*1000/this.multiplier/this.rate;
-        this.value = newval;
-      }
-    }
-  };
-
-  /**
-   * Reset to start values
-   */
-  rgltimerClass.prototype.reset = function() {
-    this.value = this.startTime;
-    this.newmultiplier(1);
-    if (typeof this.Tick !== "undefined") {
-        this.Tick(this.value);
-    }
-    if (this.enabled)
-      this.play();  /* really pause... */
-    if (typeof this.PlayButton !== "undefined")
-      this.PlayButton.value = "Play";
-  };
-
-  /**
-   * Increase the multiplier to play faster
-   */
-  rgltimerClass.prototype.faster = function() {
-    this.newmultiplier(Math.SQRT2*this.multiplier);
-  };
-
-  /**
-   * Decrease the multiplier to play slower
-   */
-  rgltimerClass.prototype.slower = function() {
-    this.newmultiplier(this.multiplier/Math.SQRT2);
-  };
-
-  /**
-   * Change sign of multiplier to reverse direction
-   */
-  rgltimerClass.prototype.reverse = function() {
-    this.newmultiplier(-this.multiplier);
-  };
-
-  /**
-   * Set multiplier for play speed
-   * @param { number } newmult - new value
-   */
-  rgltimerClass.prototype.newmultiplier = function(newmult) {
-    if (newmult !== this.multiplier) {
-      this.realStart += 1000*(this.value - this.startTime)/this.rate*(1/this.multiplier - 1/newmult);
-      this.multiplier = newmult;
-    }
-  };
-
-  /**
-   * Take one step
-   */
-  rgltimerClass.prototype.step = function() {
-    this.value += this.rate*this.multiplier;
-    this.forceToRange();
-    if (typeof this.Tick !== "undefined")
-      this.Tick(this.value);
-  };
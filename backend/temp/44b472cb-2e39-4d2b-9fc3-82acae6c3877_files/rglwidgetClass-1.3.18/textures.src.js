@@ -1,173 +0,0 @@
-    /**
-     * Methods related to textures
-     * @name ___METHODS_FOR_TEXTURES___
-     * @memberof rglwidgetClass
-     * @kind function
-     * @instance
-     */
-     
-    rglwidgetClass.prototype.getTexFilter = function(filter) {
-      var gl = this.gl || this.initGL();
-      switch(filter) {
-        case "nearest": return gl.NEAREST;
-        case "linear": return gl.LINEAR;
-        case "nearest.mipmap.nearest": return gl.NEAREST_MIPMAP_NEAREST;
-        case "linear.mipmap.nearest": return gl.LINEAR_MIPMAP_NEAREST;
-        case "nearest.mipmap.linear": return gl.NEAREST_MIPMAP_LINEAR;
-        case "linear.mipmap.linear": return gl.LINEAR_MIPMAP_LINEAR;
-        default: console.error("Unknown filter: "+filter);
-      }
-    };
-     
-    /**
-     * Handle a texture after its image has been loaded
-     * @param { Object } texture - the gl texture object
-     * @param { Object } textureCanvas - the canvas holding the image
-     */
-    rglwidgetClass.prototype.handleLoadedTexture = function(texture, textureCanvas) {
-      var gl = this.gl || this.initGL();
-      gl.pixelStorei(gl.UNPACK_FLIP_Y_WEBGL, true);
-
-      gl.bindTexture(gl.TEXTURE_2D, texture);
-      gl.texImage2D(gl.TEXTURE_2D, 0, gl.RGBA, gl.RGBA, gl.UNSIGNED_BYTE, textureCanvas);
-      gl.texParameteri(gl.TEXTURE_2D, gl.TEXTURE_MAG_FILTER, gl.LINEAR);
-      gl.texParameteri(gl.TEXTURE_2D, gl.TEXTURE_MIN_FILTER, gl.LINEAR_MIPMAP_NEAREST);
-      gl.generateMipmap(gl.TEXTURE_2D);
-
-      gl.bindTexture(gl.TEXTURE_2D, null);
-    };
-
-    /**
-     * Get maximum dimension of texture in current browser.
-     * @returns {number}
-     */
-    rglwidgetClass.prototype.getMaxTexSize = function() {
-      var gl = this.gl || this.initGL();	
-      return Math.min(4096, gl.getParameter(gl.MAX_TEXTURE_SIZE));
-    };
-    
-    /**
-     * Load an image to a texture
-     * @param { string } uri - The image location
-     * @param { Object } texture - the gl texture object
-     */
-    rglwidgetClass.prototype.loadImageToTexture = function(uri, texture) {
-      var canvas = this.textureCanvas,
-          ctx = canvas.getContext("2d"),
-          image = new Image(),
-          self = this;
-
-       image.onload = function() {
-
-         var w = image.width,
-             h = image.height,
-             canvasX = self.getPowerOfTwo(w),
-             canvasY = self.getPowerOfTwo(h),
-             maxTexSize = self.getMaxTexSize();
-         while (canvasX > 1 && canvasY > 1 && (canvasX > maxTexSize || canvasY > maxTexSize)) {
-           canvasX /= 2;
-           canvasY /= 2;
-         }
-         canvas.width = canvasX;
-         canvas.height = canvasY;
-         ctx.imageSmoothingEnabled = true;
-         ctx.drawImage(image, 0, 0, canvasX, canvasY);
-         self.handleLoadedTexture(texture, canvas);
-         self.texturesLoading -= 1;
-         if (!self.texturesLoading)
-           self.drawScene();
-       };
-       if (!self.texturesLoading)
-         self.texturesLoading = 0; // may have been undefined
-       self.texturesLoading += 1;
-       image.src = uri;
-     };
-
-    /**
-     * Draw text to the texture canvas
-     * @returns { Object } object with text measurements
-     * @param { string } text - the text
-     * @param { number } cex - expansion
-     * @param { string } family - font family
-     * @param { number } font - font number
-     */
-    rglwidgetClass.prototype.drawTextToCanvas = function(text, cex, family, font) {
-       var canvasX, canvasY,
-           scaling = 20,
-           textColour = "white",
-
-           backgroundColour = "rgba(0,0,0,0)",
-           canvas = this.textureCanvas,
-           ctx = canvas.getContext("2d"),
-           i, textHeight = 0, textHeights = [], width, widths = [], 
-           offsetx, offsety = 0, line, lines = [], offsetsx = [],
-           offsetsy = [], lineoffsetsy = [], fontStrings = [],
-           maxTexSize = this.getMaxTexSize(),
-           getFontString = function(i) {
-             textHeights[i] = scaling*cex[i];
-             var fontString = textHeights[i] + "px",
-                 family0 = family[i],
-                 font0 = font[i];
-             if (family0 === "sans")
-               family0 = "sans-serif";
-             else if (family0 === "mono")
-               family0 = "monospace";
-             fontString = fontString + " " + family0;
-             if (font0 === 2 || font0 === 4)
-               fontString = "bold " + fontString;
-             if (font0 === 3 || font0 === 4)
-               fontString = "italic " + fontString;
-             return fontString;
-           };
-       cex = rglwidgetClass.repeatToLen(cex, text.length);
-       family = rglwidgetClass.repeatToLen(family, text.length);
-       font = rglwidgetClass.repeatToLen(font, text.length);
-
-       canvasX = 1;
-       line = -1;
-       offsetx = maxTexSize;
-       for (i = 0; i < text.length; i++)  {
-         ctx.font = fontStrings[i] = getFontString(i);
-         width = widths[i] = ctx.measureText(text[i]).width;
-         if (offsetx + width > maxTexSize) {
-           offsety = offsety + 2*textHeight;
-           if (line >= 0)
-             lineoffsetsy[line] = offsety;
-           line += 1;
-           if (offsety > maxTexSize)
-             console.error("Too many strings for texture.");
-           textHeight = 0;
-           offsetx = 0;
-         }
-         textHeight = Math.max(textHeight, textHeights[i]);
-         offsetsx[i] = offsetx;
-         offsetx += width;
-         canvasX = Math.max(canvasX, offsetx);
-         lines[i] = line;
-       }
-       offsety = lineoffsetsy[line] = offsety + 2*textHeight;
-       for (i = 0; i < text.length; i++) {
-       	 offsetsy[i] = lineoffsetsy[lines[i]];
-       }
-       
-       canvasX = this.getPowerOfTwo(canvasX);
-       canvasY = this.getPowerOfTwo(offsety);
-
-       canvas.width = canvasX;
-       canvas.height = canvasY;
-
-       ctx.fillStyle = backgroundColour;
-       ctx.fillRect(0, 0, ctx.canvas.width, ctx.canvas.height);
-
-       ctx.textBaseline = "alphabetic";
-       for(i = 0; i < text.length; i++) {
-         ctx.font = fontStrings[i];
-         ctx.fillStyle = textColour;
-         ctx.textAlign = "left";
-         ctx.fillText(text[i], offsetsx[i],  offsetsy[i]);
-       }
-       return {canvasX:canvasX, canvasY:canvasY,
-               widths:widths, textHeights:textHeights,
-               offsetsx:offsetsx, offsetsy:offsetsy};
-     };
-
@@ -0,0 +1,177 @@
+"""Generic pool of long-lived worker processes.
+
+A worker is any process that prints a JSON line once it is ready and then
+answers every job line written to its stdin with one JSON line on stdout.
+The pool hands jobs to idle workers, enforces per-job timeouts by killing
+and respawning hung workers, and recycles workers after a number of jobs or
+once their memory grows past a limit.
+"""
+import json
+import os
+import queue
+import resource
+import select
+import signal
+import subprocess
+import time
+
+# Time allowed for a fresh worker to finish loading its libraries
+STARTUP_TIMEOUT = 60
+
+
+class WorkerDied(Exception):
+    """Raised when a worker exits or stops answering"""
+
+
+def process_rss_kb(pid):
+    """Return the resident set size of a process in KiB, or 0 if unknown"""
+    try:
+        with open(f'/proc/{pid}/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * resource.getpagesize() // 1024
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+class PoolWorker:
+    """A single worker process and its line-based JSON channel"""
+
+    def __init__(self, command, preexec_fn=None):
+        self.jobs = 0
+        self._buffer = b''
+        self._ready = False
+        # A session of its own lets us kill the worker together with its children
+        self.proc = subprocess.Popen(command,
+                                     stdin=subprocess.PIPE,
+                                     stdout=subprocess.PIPE,
+                                     start_new_session=True,
+                                     preexec_fn=preexec_fn)
+
+    @property
+    def rss_kb(self):
+        return process_rss_kb(self.proc.pid)
+
+    def _read_message(self, timeout):
+        """Read one JSON line from the worker, or return None on timeout"""
+        deadline = time.monotonic() + timeout
+        fd = self.proc.stdout.fileno()
+        while b'\n' not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            readable, _, _ = select.select([fd], [], [], remaining)
+            if not readable:
+                continue
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise WorkerDied('Worker process exited unexpectedly')
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b'\n', 1)
+        return json.loads(line)
+
+    def wait_ready(self):
+        if self._ready:
+            return
+        if self._read_message(STARTUP_TIMEOUT) is None:
+            raise WorkerDied('Worker process did not start in time')
+        self._ready = True
+
+    def send(self, line, timeout):
+        """Send one job line, returning the reply or None on timeout"""
+        self.wait_ready()
+        try:
+            self.proc.stdin.write(line.encode('utf-8') + b'\n')
+            self.proc.stdin.flush()
+        except OSError:
+            raise WorkerDied('Worker process closed its input')
+
+        reply = self._read_message(timeout)
+        if reply is not None:
+            self.jobs += 1
+        return reply
+
+    def kill(self):
+        try:
+            os.killpg(self.proc.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+        self.proc.wait()
+
+    def close(self):
+        try:
+            self.proc.stdin.close()
+            self.proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self.kill()
+
+
+class WorkerPool:
+    """Fixed-size pool of PoolWorker processes running the same command"""
+
+    def __init__(self, command, size, max_jobs=100, max_rss_mb=512, preexec_fn=None):
+        self.command = command
+        self.preexec_fn = preexec_fn
+        self.size = size
+        self.max_jobs = max_jobs
+        self.max_rss_kb = max_rss_mb * 1024
+        self._idle = queue.Queue()
+        self._closed = False
+        for _ in range(size):
+            self._idle.put(self._spawn())
+
+    def _spawn(self):
+        return PoolWorker(self.command, preexec_fn=self.preexec_fn)
+
+    def _needs_recycle(self, worker):
+        if worker.proc.poll() is not None or worker.jobs >= self.max_jobs:
+            return True
+        return bool(self.max_rss_kb) and worker.rss_kb > self.max_rss_kb
+
+    def _release(self, worker):
+        if self._closed:
+            worker.close()
+            return
+        if self._needs_recycle(worker):
+            worker.close()
+            worker = self._spawn()
+        self._idle.put(worker)
+
+    def run(self, line, timeout=30):
+        """Run one job on an idle worker
+
+        Returns the worker's reply, or None when the job took longer than
+        `timeout` seconds, including the wait for an idle worker; a hung
+        worker is killed and replaced. Raises WorkerDied if the worker
+        crashed while running the job.
+        """
+        started = time.monotonic()
+        try:
+            worker = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        remaining = timeout - (time.monotonic() - started)
+        if remaining <= 0:
+            self._idle.put(worker)
+            return None
+        try:
+            reply = worker.send(line, remaining)
+        except WorkerDied:
+            worker.kill()
+            self._release(self._spawn())
+            raise
+
+        if reply is None:
+            worker.kill()
+            self._release(self._spawn())
+            return None
+
+        self._release(worker)
+        return reply
+
+    def shutdown(self):
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
@@ -0,0 +1,14 @@
+"""Production WSGI entry point.
+
+    gunicorn --config gunicorn.conf.py wsgi:app
+
+With preload_app (see gunicorn.conf.py) this module is imported once in the
+gunicorn master, so numpy, plotly and the API itself are loaded a single
+time and shared copy-on-write by the forked workers. Worker pools, executor
+threads and caches are created lazily and therefore belong to each worker.
+"""
+import numpy  # noqa: F401
+import plotly.graph_objects  # noqa: F401
+import plotly.io  # noqa: F401
+
+from app import app  # noqa: F401
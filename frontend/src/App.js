@@ -1,8 +1,33 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import './App.css';
 import CodeEditor from './components/CodeEditor';
 import Visualization from './components/Visualization';
 import { pythonExamples, rExamples } from './examples';
+import { applyDelta } from './plotlySpec';
+
+// Identifies this editor to the backend so re-renders can reuse its last run
+const newSessionId = () =>
+  (window.crypto && window.crypto.randomUUID
+    ? window.crypto.randomUUID()
+    : `${Date.now()}-${Math.random().toString(36).slice(2)}`);
+
+// Follow a render job's Server-Sent-Events until its result arrives,
+// passing output to onOutput as the code prints it
+const followJob = (jobId, onOutput) =>
+  new Promise((resolve, reject) => {
+    const events = new EventSource(`/api/jobs/${jobId}/events`);
+    events.addEventListener('output', (e) => onOutput(JSON.parse(e.data).text));
+    events.addEventListener('result', (e) => {
+      events.close();
+      resolve(JSON.parse(e.data));
+    });
+    // The browser reconnects (resuming after the last event) unless the stream is gone
+    events.onerror = () => {
+      if (events.readyState === EventSource.CLOSED) {
+        reject(new Error('Lost the connection to the visualization job'));
+      }
+    };
+  });
 
 function App() {
   const [language, setLanguage] = useState('python');
@@ -12,6 +37,8 @@ function App() {
   const [result, setResult] = useState(null);
   const [examples, setExamples] = useState([]);
   const [selectedExample, setSelectedExample] = useState('');
+  const [liveOutput, setLiveOutput] = useState('');
+  const sessionId = useRef(newSessionId());
 
   // Set the initial example code based on the selected language
   useEffect(() => {
@@ -61,25 +88,42 @@ function App() {
   const handleGenerate = async () => {
     setLoading(true);
     setError(null);
-    setResult(null);
+    setLiveOutput('');
+    // Keep the previous result mounted so Plotly figures can update in place
     
     try {
-      const response = await fetch('/api/visualize', {  // Use relative URL for proxy to work
+      // Queue the render as a job so its output can be shown while it runs
+      const response = await fetch('/api/jobs', {  // Use relative URL for proxy to work
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
         },
-        body: JSON.stringify({ code, language }),
+        body: JSON.stringify({
+          code,
+          language,
+          format: 'spec',
+          session: sessionId.current,
+          // The figure version we hold, so the backend can answer with a delta
+          base: result && result.spec && result.session ? result.session.version : null,
+        }),
       });
       
-      const data = await response.json();
+      const job = await response.json();
       
       if (!response.ok) {
-        throw new Error(data.error || 'Failed to generate visualization');
+        throw new Error(job.error || 'Failed to generate visualization');
       }
       
+      const data = await followJob(job.id, (text) => setLiveOutput((previous) => previous + text));
+      
       if (data.error) {
         setError(data.error);
+        // Keep what the code printed before it failed or timed out
+        if (data.output) {
+          setLiveOutput(data.output);
+        }
+      } else if (data.delta) {
+        setResult({ ...data, spec: applyDelta(result.spec, data.delta) });
       } else {
         setResult(data);
       }
@@ -145,6 +189,13 @@ function App() {
             <pre>{error}</pre>
           </div>}
           
+          {(loading || error) && liveOutput && (
+            <div className="output-log">
+              <h4>Output Log:</h4>
+              <pre>{liveOutput}</pre>
+            </div>
+          )}
+          
           {result && !error && <Visualization result={result} />}
           
           {!result && !error && !loading && (
@@ -33,10 +33,10 @@ api.interceptors.response.use(
 );
 
 // Function to generate visualization
-export const generateVisualization = async (code, language) => {
+export const generateVisualization = async (code, language, format = 'spec') => {
   try {
     console.log(`Sending ${language} code to API:`, code);
-    const response = await api.post('/api/visualize', { code, language });
+    const response = await api.post('/api/visualize', { code, language, format });
     return response.data;
   } catch (error) {
     console.error('Error generating visualization:', error);
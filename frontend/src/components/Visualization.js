@@ -1,5 +1,37 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import './Visualization.css';
+import { decodeFigure, loadPlotly } from '../plotlySpec';
+
+// Plots a figure spec into one persistent div, updating it in place with Plotly.react
+const PlotlyFigure = ({ spec, plotlyJs }) => {
+  const plotRef = useRef(null);
+  const [loadError, setLoadError] = useState(null);
+
+  useEffect(() => {
+    let cancelled = false;
+    loadPlotly(plotlyJs)
+      .then((Plotly) => {
+        if (!cancelled && plotRef.current) {
+          const figure = decodeFigure(spec);
+          Plotly.react(plotRef.current, figure.data, figure.layout, { responsive: true });
+        }
+      })
+      .catch((err) => setLoadError(err.message));
+    return () => {
+      cancelled = true;
+    };
+  }, [spec, plotlyJs]);
+
+  if (loadError) {
+    return (
+      <div className="error">
+        <h3>Error Loading Interactive Visualization</h3>
+        <p>{loadError}</p>
+      </div>
+    );
+  }
+  return <div ref={plotRef} className="visualization-plot" />;
+};
 
 const Visualization = ({ result }) => {
   const [isErrored, setIsErrored] = useState(false);
@@ -50,6 +82,22 @@ const Visualization = ({ result }) => {
     );
   }
   
+  // If the result contains a Plotly figure spec (interactive visualization)
+  if (result.spec) {
+    return (
+      <div className="visualization-container">
+        <PlotlyFigure spec={result.spec} plotlyJs={result.plotly_js} />
+        
+        {result.output && (
+          <div className="output-log">
+            <h4>Output Log:</h4>
+            <pre>{result.output}</pre>
+          </div>
+        )}
+      </div>
+    );
+  }
+  
   // If the result contains HTML (interactive visualization)
   if (result.html) {
     return (
@@ -0,0 +1,114 @@
+// Helpers for rendering Plotly figure specs returned with format "spec"
+
+const TYPED_ARRAYS = {
+  f8: Float64Array,
+  f4: Float32Array,
+  i4: Int32Array,
+  u4: Uint32Array,
+  i2: Int16Array,
+  u2: Uint16Array,
+  i1: Int8Array,
+  u1: Uint8Array
+};
+
+const halfToFloat = (h) => {
+  const sign = (h & 0x8000) ? -1 : 1;
+  const exponent = (h >> 10) & 0x1f;
+  const fraction = h & 0x3ff;
+  if (exponent === 0) {
+    return sign * Math.pow(2, -14) * (fraction / 1024);
+  }
+  if (exponent === 31) {
+    return fraction ? NaN : sign * Infinity;
+  }
+  return sign * Math.pow(2, exponent - 15) * (1 + fraction / 1024);
+};
+
+// Decode one {dtype, bdata, shape} array into typed arrays
+export const decodeArray = (encoded) => {
+  const raw = atob(encoded.bdata);
+  const bytes = new Uint8Array(raw.length);
+  for (let i = 0; i < raw.length; i++) {
+    bytes[i] = raw.charCodeAt(i);
+  }
+
+  let values;
+  if (encoded.dtype === 'f2') {
+    values = Float32Array.from(new Uint16Array(bytes.buffer), halfToFloat);
+  } else if (encoded.dtype === 'u2' && encoded.scale !== undefined) {
+    // Quantized values with 65535 reserved for missing data
+    values = Float32Array.from(new Uint16Array(bytes.buffer),
+      (q) => (q === 65535 ? NaN : encoded.offset + q * encoded.scale));
+  } else if (TYPED_ARRAYS[encoded.dtype]) {
+    values = new TYPED_ARRAYS[encoded.dtype](bytes.buffer);
+  } else {
+    throw new Error(`Unsupported dtype ${encoded.dtype}`);
+  }
+
+  let shape = encoded.shape || [values.length];
+  if (typeof shape === 'string') {
+    shape = shape.split(',').map(Number);
+  }
+  if (shape.length === 2) {
+    const rows = [];
+    for (let r = 0; r < shape[0]; r++) {
+      rows.push(values.subarray(r * shape[1], (r + 1) * shape[1]));
+    }
+    return rows;
+  }
+  return values;
+};
+
+// Recursively decode every encoded array in a figure spec
+export const decodeFigure = (value) => {
+  if (Array.isArray(value)) {
+    return value.map(decodeFigure);
+  }
+  if (value !== null && typeof value === 'object') {
+    if (value.bdata) {
+      return decodeArray(value);
+    }
+    const decoded = {};
+    Object.keys(value).forEach((key) => {
+      decoded[key] = decodeFigure(value[key]);
+    });
+    return decoded;
+  }
+  return value;
+};
+
+// Apply a figure delta from an editor session to the spec it was computed against
+export const applyDelta = (spec, delta) => {
+  const data = spec.data.slice(0, delta.traces);
+  Object.keys(delta.data).forEach((index) => {
+    data[Number(index)] = delta.data[index];
+  });
+  const layout = { ...spec.layout, ...delta.layout };
+  delta.layout_removed.forEach((key) => {
+    delete layout[key];
+  });
+  return { ...spec, data, layout };
+};
+
+let plotlyPromise = null;
+
+// Load the Plotly bundle served by the backend once per page
+export const loadPlotly = (src) => {
+  if (window.Plotly) {
+    return Promise.resolve(window.Plotly);
+  }
+  if (!plotlyPromise) {
+    plotlyPromise = new Promise((resolve, reject) => {
+      const script = document.createElement('script');
+      script.src = src;
+      script.async = true;
+      script.onload = () => resolve(window.Plotly);
+      script.onerror = () => {
+        plotlyPromise = null;
+        reject(new Error(`Failed to load Plotly from ${src}`));
+      };
+      document.head.appendChild(script);
+    });
+  }
+  return plotlyPromise;
+};